@@ -49,8 +49,22 @@
 # ============================================================
 
 import uno
-import random
-from com.sun.star.awt import Point, Size
+from com.sun.star.awt import Point
+
+# Shared helper (Scripts/python/pythonpath/kreis_scramble.py)
+from kreis_scramble import plan_scramble
+# Shared helper (Scripts/python/pythonpath/kreis_docprops.py)
+from kreis_docprops import ensure_layout
+# Shared helper (Scripts/python/pythonpath/kreis_layout.py)
+from kreis_layout import apply_row_heights, apply_col_widths
+# Shared helper (Scripts/python/pythonpath/kreis_styles.py)
+from kreis_styles import ensure_cell_styles, apply_style, STYLE_CENTER, STYLE_HEADER
+# Shared helper (Scripts/python/pythonpath/kreis_shapes.py)
+from kreis_shapes import CircleTemplate
+# Shared helper (Scripts/python/pythonpath/kreis_render.py)
+from kreis_render import write_svg, write_pdf
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import message_box
 
 # ============================================================
 # 1) KONFIGURATION
@@ -135,12 +149,7 @@ def _a1(col0, row0):
 
 def _msgbox(doc, title, message):
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "WARNINGBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "WARNINGBOX")
     except Exception:
         pass
 
@@ -293,6 +302,32 @@ def _get_pairs_for_half(sheet, ef_row_1based, fallback_row_1based):
         return _pairs_from_row_cells(sheet, fallback_row_1based)
 
 
+def _read_quad_model(sheet):
+    """
+    Liest alle Gruppen EINMAL aus dem Sheet (EF/Fallback) -> In-Memory-Modell.
+    Returns: {"circles": [(group_index, title, c, idx_tag, quad)], "msgs": [...]}
+      quad = [UL, UR, LL, LR] in Ausgangsstellung (Lösung), leer bleibt " "
+    """
+    circles = []
+    msgs = []
+    for group_index, (title, ef_top, top_row, bot_row, ef_bot) in enumerate(GROUPS):
+        top_pairs, m1 = _get_pairs_for_half(sheet, ef_top, top_row)
+        bot_pairs, m2 = _get_pairs_for_half(sheet, ef_bot, bot_row)
+        msgs.extend([f"{title}: {x}" for x in (m1 + m2)])
+
+        for c in range(NUM_COLS):
+            t = top_pairs[c] if c < len(top_pairs) else ""
+            b = bot_pairs[c] if c < len(bot_pairs) else ""
+
+            ul = t[0] if len(t) > 0 else " "
+            ur = t[1] if len(t) > 1 else " "
+            ll = b[0] if len(b) > 0 else " "
+            lr = b[1] if len(b) > 1 else " "
+            circles.append((group_index, title, c, f"b{group_index}_c{c}", [ul, ur, ll, lr]))
+
+    return {"circles": circles, "msgs": msgs}
+
+
 def _upper_keep_umlauts(s):
     """For EF cells: uppercase only, keep ÄÖÜ, show ß as ẞ."""
     return (s or "").replace("ß", "ẞ").upper()
@@ -386,69 +421,12 @@ def disable_spellcheck_for_range(sheet, a1_range: str):
         pass
 
 # ============================================================
-# 5) ZEICHNEN (PRIMITIVES)
+# 5) ZEICHNEN (VORLAGE)
 # ============================================================
 
-def _mark_shape(shape, name_suffix):
-    try:
-        shape.Name = f"{MARK_DESC}_{name_suffix}"
-    except Exception:
-        pass
-    try:
-        shape.Description = MARK_DESC
-    except Exception:
-        pass
-
-
-def draw_text_center(doc, draw_page, cx, cy, text, name_suffix):
-    t = doc.createInstance("com.sun.star.drawing.TextShape")
-    _mark_shape(t, name_suffix)
-    draw_page.add(t)  # erst adden -> dann zuverlässig setzen
-
-    # ---> HIER: Parameter "text" umwandeln (nicht "txt")
-    text = _to_upper_visual(text)
-
-    w, h = 700, 700
-    t.Size = Size(w, h)
-    t.Position = Point(int(cx - w/2), int(cy - h/2))
-
-    try:
-        t.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "NONE")
-        t.LineStyle = uno.Enum("com.sun.star.drawing.LineStyle", "NONE")
-    except Exception:
-        pass
-
-    try:
-        t.String = text
-    except Exception:
-        try:
-            t.Text.setString(text)
-        except Exception:
-            pass
-
-    try:
-        t.CharHeight = CHAR_HEIGHT
-        t.CharWeight = 150
-        t.CharColor  = 0x000000
-        t.TextHorizontalAdjust = 1  # CENTER
-        t.TextVerticalAdjust   = 1  # CENTER
-    except Exception:
-        pass
-
-    return t
-
-def draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
-    """
-    Zeichnet eine Linie von (x1,y1) nach (x2,y2) auf die DrawPage.
-    Wichtig: erst adden, dann Eigenschaften setzen (LO/UNO stabiler).
-    """
-    line = doc.createInstance("com.sun.star.drawing.LineShape")
-    _mark_shape(line, name_suffix)
-    draw_page.add(line)  # erst adden
-
-    line.Position = Point(x1, y1)
-    line.Size = Size(x2 - x1, y2 - y1)
-    line.LineColor = 0x000000
+# Vorlage für Kreis + Kreuz + 4 Texte (kreis_shapes): Eigenschaften EINMAL vorbereitet,
+# je Shape EIN setPropertyValues statt Einzelzuweisungen
+_CIRCLE_TEMPLATE = CircleTemplate(MARK_DESC, char_height=CHAR_HEIGHT, bold=True, text_box=700)
 
 
 # ============================================================
@@ -456,38 +434,8 @@ def draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
 # ============================================================
 
 def draw_circle_with_quadrants(doc, draw_page, x, y, size, fill_color, label_texts, idx_tag):
-    circle = doc.createInstance("com.sun.star.drawing.EllipseShape")
-    _mark_shape(circle, f"circle_{idx_tag}")
-    draw_page.add(circle)  # erst adden
-
-    circle.Position  = Point(x, y)
-    circle.Size      = Size(size, size)
-    circle.FillColor = fill_color
-    circle.LineColor = 0x000000
-
-    cx = x + size // 2
-    cy = y + size // 2
-
-    draw_line(doc, draw_page, cx, y,  cx, y + size, f"vline_{idx_tag}")
-    draw_line(doc, draw_page, x,  cy, x + size, cy, f"hline_{idx_tag}")
-
-    # Quadranten-Zentren
-    q1x = x + size // 4
-    q3x = x + (3 * size) // 4
-    q1y = y + size // 4
-    q3y = y + (3 * size) // 4
-
-    centers = [
-        (q1x, q1y),  # UL
-        (q3x, q1y),  # UR
-        (q1x, q3y),  # LL
-        (q3x, q3y),  # LR
-    ]
-
-    text_shapes = []
-    for i, ((tcx, tcy), txt) in enumerate(zip(centers, label_texts), start=1):
-        sh = draw_text_center(doc, draw_page, tcx, tcy, txt, f"text_{idx_tag}_{i}")
-        text_shapes.append(sh)
+    texts = [_to_upper_visual(t) for t in label_texts]
+    return _CIRCLE_TEMPLATE.draw(doc, draw_page, x, y, size, fill_color, texts, idx_tag)
 
 
 # ============================================================
@@ -496,16 +444,6 @@ def draw_circle_with_quadrants(doc, draw_page, x, y, size, fill_color, label_tex
 
 MAX_SOLVED_CIRCLES = 2  # 0..2 sind ok; >2 vermeiden
 
-def _rotate_right_vals(vals):
-    # vals = [UL, UR, LL, LR]
-    return [vals[2], vals[0], vals[3], vals[1]]
-
-def _rotate_vals(vals, steps_clockwise):
-    v = list(vals)
-    for _ in range(steps_clockwise % 4):
-        v = _rotate_right_vals(v)
-    return v
-
 def _name_map_from_drawpage(dp):
     m = {}
     for i in range(dp.getCount()):
@@ -515,95 +453,87 @@ def _name_map_from_drawpage(dp):
             m[nm] = sh
     return m
 
+def _plan_scramble_model(circles):
+    """
+    Scramble-Planung NUR auf dem In-Memory-Modell (kein Shape-Zugriff).
+    Alle Kreise werden gemeinsam geplant (kreis_scramble.plan_scramble):
+    - jeder drehbare Kreis wird gedreht, nie die komplette Ausgangsstellung (Lösung)
+    - max. MAX_SOLVED_CIRCLES in Ausgangsstellung (nur Symmetrie kann das verletzen)
+    Returns: (quads, info)
+      quads: {idx_tag: [UL, UR, LL, LR]} gemischt
+      info:  {"total", "solved_after", "forced_solved", "feasible", "full_solution", "score", ...}
+    """
+    tags = [idx_tag for _gi, _title, _c, idx_tag, _base in circles]
+    _steps, scrambled, info = plan_scramble(
+        [base for _gi, _title, _c, _tag, base in circles],
+        max_solved=MAX_SOLVED_CIRCLES,
+        allow_solved=False,
+    )
+    return dict(zip(tags, scrambled)), info
+
+def _scramble_warning(info):
+    """Meldungstext nach dem Mischen (oder None)."""
+    total = info["total"]
+    solved_after = info["solved_after"]
+
+    # Gesamtzustand darf nie komplett „Lösung“ sein
+    # (wenn total==0: nichts zu tun)
+    if total > 0 and solved_after == total:
+        return "Alle Kreise sind rotationssymmetrisch/leer – kann nicht mischen, ohne Lösung zu treffen."
+
+    # Soft-Limit: max. 2 Kreise dürfen in Ausgangsstellung sein
+    allowed = min(MAX_SOLVED_CIRCLES, max(total - 1, 0))
+    if solved_after > allowed:
+        return (
+            f"{solved_after} Kreise stehen in Ausgangsstellung (erlaubt: {allowed}).\n"
+            f"Grund: mindestens {info['forced_solved']} Kreise sind rotationssymmetrisch/leer und lassen sich nicht „verdrehen“."
+        )
+    return None
+
 def scramble_all_circles_no_solution(*args):
     """
     Mischt alle Kreise durch Rotation der Buchstaben.
     Ziel: NICHT die komplette Ausgangsstellung (Lösung) erzeugen.
     Außerdem: versucht, dass max. MAX_SOLVED_CIRCLES Kreise in Ausgangsstellung bleiben.
+    Ausgangsstellung kommt aus dem Sheet (einmal gelesen), Shapes werden nur geschrieben.
     """
     doc = _get_doc()
     sheet = _get_sheet(doc)
     dp = _get_draw_page(sheet)
     name_map = _name_map_from_drawpage(dp)
 
-    missing = []
-    forced_solved = 0
-    total = 0
-    plan = []  # (idx_tag, base_quad, chosen_step)
-
-    for gi, (title, ef_top, top_row, bot_row, ef_bot) in enumerate(GROUPS):
-        top_pairs, _ = _get_pairs_for_half(sheet, ef_top, top_row)
-        bot_pairs, _ = _get_pairs_for_half(sheet, ef_bot, bot_row)
-
-        for c in range(NUM_COLS):
-            idx_tag = f"b{gi}_c{c}"
-            circle_name = f"{MARK_DESC}_circle_{idx_tag}"
-            if circle_name not in name_map:
-                missing.append(f"{title}: Kreis fehlt ({circle_name})")
-                continue
-
-            total += 1
-
-            t = top_pairs[c] if c < len(top_pairs) else ""
-            b = bot_pairs[c] if c < len(bot_pairs) else ""
-
-            # Ausgangsstellung (Soll): Leer bleibt leer
-            ul = t[0] if len(t) > 0 else " "
-            ur = t[1] if len(t) > 1 else " "
-            ll = b[0] if len(b) > 0 else " "
-            lr = b[1] if len(b) > 1 else " "
-            base = [ul, ur, ll, lr]
-
-            # Erlaubte Rotationen: nur solche, die wirklich ändern (wenn möglich)
-            candidates = [k for k in (1, 2, 3) if _rotate_vals(base, k) != base]
+    model = _read_quad_model(sheet)
 
-            if candidates:
-                step = random.choice(candidates)  # garantiert "nicht Ausgangsstellung" für diesen Kreis
-            else:
-                # rotationssymmetrisch (z.B. alles leer oder gleiche Buchstaben) -> lässt sich nicht "entschärfen"
-                step = 0
-                forced_solved += 1
-
-            plan.append((idx_tag, base, step))
+    missing = []
+    for _gi, title, _c, idx_tag, _quad in model["circles"]:
+        circle_name = f"{MARK_DESC}_circle_{idx_tag}"
+        if circle_name not in name_map:
+            missing.append(f"{title}: Kreis fehlt ({circle_name})")
 
     if missing:
         _msgbox(doc, "Scramble", "Es fehlen Shapes (bitte neu zeichnen):\n" + "\n".join(missing))
         return
 
-    # Anwenden
-    solved_after = 0
-    for idx_tag, base, step in plan:
-        vals = _rotate_vals(base, step)
-        if vals == base:
-            solved_after += 1
+    quads, info = _plan_scramble_model(model["circles"])
 
+    # Anwenden (genau ein Schreibvorgang pro Quadrant)
+    for idx_tag, vals in quads.items():
         for q, val in enumerate(vals, start=1):
             nm = f"{MARK_DESC}_text_{idx_tag}_{q}"
             sh = name_map.get(nm)
             if sh is not None:
                 sh.String = val
 
-    # Gesamtzustand darf nie komplett „Lösung“ sein
-    # (wenn total==0: nichts zu tun)
-    if total > 0 and solved_after == total:
-        _msgbox(doc, "Scramble", "Alle Kreise sind rotationssymmetrisch/leer – kann nicht mischen, ohne Lösung zu treffen.")
-        return
-
-    # Soft-Limit: max. 2 Kreise dürfen in Ausgangsstellung sein
-    allowed = min(MAX_SOLVED_CIRCLES, max(total - 1, 0))
-    if solved_after > allowed:
-        _msgbox(
-            doc,
-            "Scramble Hinweis",
-            f"{solved_after} Kreise stehen in Ausgangsstellung (erlaubt: {allowed}).\n"
-            f"Grund: mindestens {forced_solved} Kreise sind rotationssymmetrisch/leer und lassen sich nicht „verdrehen“."
-        )
+    msg = _scramble_warning(info)
+    if msg:
+        _msgbox(doc, "Scramble Hinweis", msg)
 
 def refresh_and_scramble(*args):
     """
-    1) Falls Kreise existieren: nur Buchstaben aktualisieren
-       sonst: Kreise neu erzeugen
-    2) Danach mischen (Rotation), aber nur wenn keine Fehler gemeldet wurden
+    1) Sheet EINMAL lesen -> Modell, Mischen im Speicher
+    2) Falls Kreise existieren: nur Buchstaben aktualisieren (gemischt)
+       sonst: Kreise neu erzeugen (gemischt)
+    -> Shapes werden genau einmal beschrieben.
     """
     doc = _get_doc()
     sheet = _get_sheet(doc)
@@ -620,13 +550,20 @@ def refresh_and_scramble(*args):
     except Exception:
         pass
 
+    model = _read_quad_model(sheet)
+    quads, info = _plan_scramble_model(model["circles"])
+
     # Run update/create (they handle locking + messages)
-    ok = update_texts_only() if has_any else create_circle_grid()
+    if has_any:
+        ok = update_texts_only(model=model, quads=quads)
+    else:
+        ok = create_circle_grid(model=model, quads=quads)
     if not ok:
         return
 
-    # Scramble only if update/create succeeded
-    scramble_all_circles_no_solution()
+    msg = _scramble_warning(info)
+    if msg:
+        _msgbox(doc, "Scramble Hinweis", msg)
 
 # ============================================================
 # 8) REFLOW-FUNKTION (verschiebt vorhandene Kreise + Linien + Texte)
@@ -636,7 +573,7 @@ def reflow_circles_only(*args):
     """
     Verschiebt NUR bestehende Shapes (Kreis + Kreuzlinien + 4 Texte) auf neue Soll-Positionen.
     Es wird NICHT gelöscht und NICHT neu gezeichnet.
-    Voraussetzung: Shapes wurden mit _mark_shape() benannt/markiert.
+    Voraussetzung: Shapes wurden über _CIRCLE_TEMPLATE benannt/markiert.
     """
     doc = _get_doc()
     sheet = _get_sheet(doc)
@@ -836,38 +773,11 @@ def delete_all_circles(*args):
 # ============================================================
 
 SHEET_INIT_FLAG = "KREIS_GUI_INIT_DONE"
-
-def _doc_user_props(doc):
-    return doc.getDocumentProperties().getUserDefinedProperties()
-
-def _get_init_done(doc) -> bool:
-    props = _doc_user_props(doc)
-    try:
-        if props.hasByName(SHEET_INIT_FLAG):
-            return str(props.getPropertyValue(SHEET_INIT_FLAG)) == "1"
-    except Exception:
-        pass
-    return False
-
-def _set_init_done(doc):
-    props = _doc_user_props(doc)
-    try:
-        if not props.hasByName(SHEET_INIT_FLAG):
-            props.addProperty(SHEET_INIT_FLAG, 0, "0")
-        props.setPropertyValue(SHEET_INIT_FLAG, "1")
-    except Exception:
-        pass
-
-def _set_center(rng):
-    rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-    rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
-
-def _set_bold_14(rng):
-    rng.CharHeight = 14
-    rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
+LAYOUT_VERSION = 2  # raise to re-run _init_sheet_layout once in existing documents
 
 def _init_sheet_layout(doc):
     sheet = doc.Sheets.getByName(SHEET_NAME)
+    ensure_cell_styles(doc)
     
     # Disable spellcheck for EF input rows (merged E+F, but range is still E:F)
     disable_spellcheck_for_range(sheet, "E3:F3")
@@ -890,23 +800,18 @@ def _init_sheet_layout(doc):
     sheet.getCellRangeByName("E2").setString("Kreis \n-3-")
     sheet.getCellRangeByName("F2").setString("Kreis \n-4-")
 
+    # B2:F50 mittig (hori + vert), danach die fetten Bereiche darüber (Vorlagen, kreis_styles)
+    apply_style(sheet.getCellRangeByName(INIT_CENTER_RANGE), STYLE_CENTER)
+
     hdr = sheet.getCellRangeByName(INIT_HEADER_RANGE)   # "B2:F2"
-    _set_center(hdr)
-    _set_bold_14(hdr)
+    apply_style(hdr, STYLE_HEADER)
     
     # Spalte B Hinweise (Zeilen 3,6,8,11,13,16)
     hint = "Begriffe\nmit 8 Buchstaben"
     for r in (3, 6, 8, 11, 13, 16,):
         cell = sheet.getCellByPosition(1, r - 1)  # B = 1
         cell.setString(hint)
-        try:
-            cell.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-            cell.CharHeight = 14  # optional: gleich wie Überschrift
-        except Exception:
-            pass
-
-    # B2:F50 mittig (hori + vert)
-    _set_center(sheet.getCellRangeByName(INIT_CENTER_RANGE))  # "B2:F50"
+        apply_style(cell, STYLE_HEADER)
 
     # Wort-Zeilen: E+F verbinden + zentrieren + fett
     for r in INIT_WORD_ROWS:
@@ -916,19 +821,16 @@ def _init_sheet_layout(doc):
             ef.merge(True)
         except Exception:
             pass
-        _set_center(ef)
-        _set_bold_14(ef)
+        apply_style(ef, STYLE_HEADER)
 
     # Spaltenbreiten
     cols = sheet.Columns
 
-    # C..G = 1,7 cm
-    for col in range(2, 7):  # C(2)..G(6)
-        cols.getByIndex(col).Width = INIT_COL_W_C_TO_G
-
-    # J und L = 4 cm
-    cols.getByIndex(9).Width  = INIT_COL_W_J_L  # J
-    cols.getByIndex(11).Width = INIT_COL_W_J_L  # L
+    # C..G = 1,7 cm (ein Bereich), J und L = 4 cm
+    widths = {col: INIT_COL_W_C_TO_G for col in range(2, 7)}  # C(2)..G(6)
+    widths[9] = INIT_COL_W_J_L   # J
+    widths[11] = INIT_COL_W_J_L  # L
+    apply_col_widths(sheet, widths)
 
     # B: optimal, aber max 4,5 cm
     col_b = cols.getByIndex(1)
@@ -943,9 +845,7 @@ def _init_sheet_layout(doc):
         pass
 
     # Zeilenhöhen
-    rows = sheet.Rows
-    for r in INIT_ROWS_H17:
-        rows.getByIndex(r - 1).Height = INIT_ROW_H_17
+    apply_row_heights(sheet, {r: INIT_ROW_H_17 for r in INIT_ROWS_H17})
 
     adjust_rows_to_circle_radius(sheet)
 
@@ -956,16 +856,16 @@ def _init_sheet_layout(doc):
         pass
 
 def _ensure_initialized(doc):
-    if _get_init_done(doc):
-        return
-    _init_sheet_layout(doc)
-    _set_init_done(doc)
+    # formatting runs once per document and LAYOUT_VERSION
+    ensure_layout(doc, SHEET_INIT_FLAG, LAYOUT_VERSION, _init_sheet_layout)
 
 
-def update_texts_only(*args):
+def update_texts_only(*args, model=None, quads=None):
     """
     Aktualisiert nur die Texte in bestehenden Kreisen (keine neuen Shapes).
     Nutzt dieselbe EF/Fallback-Logik wie create_circle_grid().
+    model: fertiges Modell aus _read_quad_model (sonst wird das Sheet gelesen)
+    quads: optional {idx_tag: quad} – z.B. bereits gemischt (refresh_and_scramble)
     """
     doc = _get_doc()
     sheet = _get_sheet(doc)
@@ -983,58 +883,50 @@ def update_texts_only(*args):
         dp = _get_draw_page(sheet)
         name_map = _name_map_from_drawpage(dp)
 
-        for group_index, (title, ef_top, top_row, bot_row, ef_bot) in enumerate(GROUPS):
-            top_pairs, m1 = _get_pairs_for_half(sheet, ef_top, top_row)
-            bot_pairs, m2 = _get_pairs_for_half(sheet, ef_bot, bot_row)
-            all_msgs.extend([f"{title}: {x}" for x in (m1 + m2)])
-
-            for c in range(NUM_COLS):
-                idx_tag = f"b{group_index}_c{c}"
-                circle_name = f"{MARK_DESC}_circle_{idx_tag}"
-                circle = name_map.get(circle_name)
-                if circle is None:
-                    missing.append(f"{title}: Kreis fehlt ({circle_name}) – bitte neu zeichnen")
+        if model is None:
+            model = _read_quad_model(sheet)
+        all_msgs.extend(model["msgs"])
+
+        for group_index, title, c, idx_tag, quad in model["circles"]:
+            circle_name = f"{MARK_DESC}_circle_{idx_tag}"
+            circle = name_map.get(circle_name)
+            if circle is None:
+                missing.append(f"{title}: Kreis fehlt ({circle_name}) – bitte neu zeichnen")
+                continue
+
+            if quads is not None:
+                quad = quads.get(idx_tag, quad)
+
+            x0 = circle.Position.X
+            y0 = circle.Position.Y
+            d = min(circle.Size.Width, circle.Size.Height)
+
+            q1x = x0 + d // 4
+            q3x = x0 + (3 * d) // 4
+            q1y = y0 + d // 4
+            q3y = y0 + (3 * d) // 4
+            centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]
+
+            for i, ((cx, cy), txt) in enumerate(zip(centers, quad), start=1):
+                nm = f"{MARK_DESC}_text_{idx_tag}_{i}"
+                sh = name_map.get(nm)
+                if sh is None:
+                    missing.append(f"{title}: Text fehlt ({nm}) – bitte neu zeichnen")
                     continue
 
-                t = top_pairs[c] if c < len(top_pairs) else ""
-                b = bot_pairs[c] if c < len(bot_pairs) else ""
-
-                ul = t[0] if len(t) > 0 else " "
-                ur = t[1] if len(t) > 1 else " "
-                ll = b[0] if len(b) > 0 else " "
-                lr = b[1] if len(b) > 1 else " "
-                quad = [ul, ur, ll, lr]
-
-                x0 = circle.Position.X
-                y0 = circle.Position.Y
-                d = min(circle.Size.Width, circle.Size.Height)
-
-                q1x = x0 + d // 4
-                q3x = x0 + (3 * d) // 4
-                q1y = y0 + d // 4
-                q3y = y0 + (3 * d) // 4
-                centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]
-
-                for i, ((cx, cy), txt) in enumerate(zip(centers, quad), start=1):
-                    nm = f"{MARK_DESC}_text_{idx_tag}_{i}"
-                    sh = name_map.get(nm)
-                    if sh is None:
-                        missing.append(f"{title}: Text fehlt ({nm}) – bitte neu zeichnen")
-                        continue
-
-                    txt = _to_upper_visual(txt)
+                txt = _to_upper_visual(txt)
+                try:
+                    sh.String = txt
+                except Exception:
                     try:
-                        sh.String = txt
+                        sh.Text.setString(txt)
                     except Exception:
-                        try:
-                            sh.Text.setString(txt)
-                        except Exception:
-                            pass
+                        pass
 
-                    # Re-center (optional)
-                    w = sh.Size.Width or 700
-                    h = sh.Size.Height or 700
-                    sh.Position = Point(int(cx - w/2), int(cy - h/2))
+                # Re-center (optional)
+                w = sh.Size.Width or 700
+                h = sh.Size.Height or 700
+                sh.Position = Point(int(cx - w/2), int(cy - h/2))
 
         # Debug A1
         try:
@@ -1066,7 +958,11 @@ def update_texts_only(*args):
 # 13) HAUPT-MAKRO: 3 BLÖCKE ZEICHNEN + FEHLER MSGBOX + ENDE
 # ============================================================
 
-def create_circle_grid(*args):
+def create_circle_grid(*args, model=None, quads=None):
+    """
+    model: fertiges Modell aus _read_quad_model (sonst wird das Sheet gelesen)
+    quads: optional {idx_tag: quad} – z.B. bereits gemischt (refresh_and_scramble)
+    """
     doc = _get_doc()
     sheet = _get_sheet(doc)
 
@@ -1088,30 +984,24 @@ def create_circle_grid(*args):
 
         draw_page = _get_draw_page(sheet)
 
-        for group_index, (title, ef_top, top_row, bot_row, ef_bot) in enumerate(GROUPS):
-            top_pairs, m1 = _get_pairs_for_half(sheet, ef_top, top_row)
-            bot_pairs, m2 = _get_pairs_for_half(sheet, ef_bot, bot_row)
+        if model is None:
+            model = _read_quad_model(sheet)
 
-            # softer messages (not too many)
-            all_msgs.extend([f"{title}: {x}" for x in (m1 + m2)])
+        # softer messages (not too many)
+        all_msgs.extend(model["msgs"])
 
-            y = _circle_top_y_for_group(sheet, group_index)
+        group_y = {}
+        for group_index, _title, c, idx_tag, quad in model["circles"]:
+            if group_index not in group_y:
+                group_y[group_index] = _circle_top_y_for_group(sheet, group_index)
+            y = group_y[group_index]
             fill = ROW_COLORS[group_index] if group_index < len(ROW_COLORS) else ROW_COLORS[-1]
+            x = START_X + c * OFFSET_X_BASE
 
-            for c in range(NUM_COLS):
-                x = START_X + c * OFFSET_X_BASE
-                idx_tag = f"b{group_index}_c{c}"
-
-                t = top_pairs[c] if c < len(top_pairs) else ""
-                b = bot_pairs[c] if c < len(bot_pairs) else ""
-
-                ul = t[0] if len(t) > 0 else " "
-                ur = t[1] if len(t) > 1 else " "
-                ll = b[0] if len(b) > 0 else " "
-                lr = b[1] if len(b) > 1 else " "
-                quad = [ul, ur, ll, lr]
+            if quads is not None:
+                quad = quads.get(idx_tag, quad)
 
-                draw_circle_with_quadrants(doc, draw_page, x, y, CIRCLE_DIAMETER, fill, quad, idx_tag)
+            draw_circle_with_quadrants(doc, draw_page, x, y, CIRCLE_DIAMETER, fill, quad, idx_tag)
 
         # Debug A1
         try:
@@ -1137,6 +1027,59 @@ def create_circle_grid(*args):
             _msgbox(doc, "Hinweise / Eingaben", msg)
 
 
+# ============================================================
+# 13b) DRUCK-EXPORT (SVG + PDF ohne Shapes, kreis_render)
+# ============================================================
+
+def _print_puzzle(sheet, dp):
+    """
+    Modell aus dem Sheet; stehen schon Kreise auf der Seite, gelten deren Buchstaben
+    (z.B. gemischt) – gedruckt wird, was man sieht.
+    """
+    model = _read_quad_model(sheet)
+    name_map = _name_map_from_drawpage(dp)
+    quads = []
+    for _gi, _title, _c, idx_tag, quad in model["circles"]:
+        vals = list(quad)
+        for q in range(4):
+            sh = name_map.get(f"{MARK_DESC}_text_{idx_tag}_{q + 1}")
+            if sh is not None:
+                try:
+                    vals[q] = sh.String
+                except Exception:
+                    pass
+        quads.append((idx_tag, vals))
+    return {"title": "", "model": quads}
+
+
+def export_puzzle_print(*args):
+    """
+    Schreibt <Dokument>_druck.svg und <Dokument>_druck.pdf neben das gespeicherte Dokument.
+    """
+    doc = _get_doc()
+    sheet = _get_sheet(doc)
+    try:
+        base = uno.fileUrlToSystemPath(doc.getURL())
+    except Exception:
+        base = ""
+    if not base:
+        _msgbox(doc, "Druck-Export", "Dokument bitte zuerst speichern (Export landet daneben).")
+        return False
+
+    puzzle = _print_puzzle(sheet, _get_draw_page(sheet))
+    opts = {"diameter": CIRCLE_DIAMETER, "step_x": OFFSET_X_BASE, "row_colors": ROW_COLORS}
+    stem = base.rsplit(".", 1)[0] + "_druck"
+    try:
+        svg = write_svg(stem + ".svg", puzzle, **opts)
+        pdf = write_pdf(stem + ".pdf", [puzzle], **opts)
+    except Exception as e:
+        _msgbox(doc, "Druck-Export", f"Export fehlgeschlagen:\n{e}")
+        return False
+
+    _msgbox(doc, "Druck-Export", f"Geschrieben:\n{svg}\n{pdf}")
+    return True
+
+
 # ============================================================
 # 14 SELF-CHECK (Debug): prüft fehlende Makros/Konstanten/Globals
 # ============================================================
@@ -1300,4 +1243,5 @@ g_exportedScripts = (
     reflow_circles_only,
     scramble_all_circles_no_solution,
     refresh_and_scramble,
+    export_puzzle_print,
 )
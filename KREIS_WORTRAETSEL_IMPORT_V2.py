@@ -34,17 +34,33 @@ Task:
 2) Spalte AB wird auf 12 cm Breite gesetzt.
 """
 
+import os
 import uno
 from datetime import datetime
 from com.sun.star.lang import Locale
 from com.sun.star.beans import PropertyValue
 
+# Shared helper (Scripts/python/pythonpath/kreis_wordindex.py)
+from kreis_wordindex import WordTrie
+# Shared helper (Scripts/python/pythonpath/kreis_spellpool.py)
+from kreis_spellpool import SpellSession, CHUNK_PROCESS
+# Shared helper (Scripts/python/pythonpath/kreis_headers.py)
+from kreis_headers import HeaderWriter
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import hori, vert, message_box
+# Shared helper (Scripts/python/pythonpath/kreis_schema.py)
+from kreis_schema import (
+    get_schema, word_col0, field_offset, read_block, read_blocks, iter_entries, free_rows,
+    write_rows, compact_block, count_words, BLOCK_STEP, F_WORD, F_IMPORTED, F_USED,
+)
+
 
 # ============================================================
 # 1) CONFIG
 # ============================================================
 
 SHEET_NAME = "KREIS_WORTRAETSEL"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout (kreis_schema.py)
 
 # Candidate area
 CAND_COL_WORD0   = 26   # AA
@@ -55,28 +71,41 @@ CAND_MAX_ROWS = 500
 # AB column width
 AB_WIDTH_CM = 12.0
 
-# Wordlist blocks
-WORDLEN_MIN = 5
-WORDLEN_MAX = 12
+# Wordlist blocks (from kreis_schema: 5->AG ... 12->CD)
+WORDLEN_MIN = SCHEMA["len_min"]
+WORDLEN_MAX = SCHEMA["len_max"]
 
-WORDLIST_BASE_COL0 = 32        # AG (0-based)
-WORDLIST_BLOCK_STEP = 7        # 7 columns per length block
-WORDLIST_START_ROW_1BASED = 4  # list starts row 4
-WORDLIST_MAX_ROWS = 500
+WORDLIST_BASE_COL0 = word_col0(SCHEMA, WORDLEN_MIN)  # AG (0-based)
+WORDLIST_BLOCK_STEP = BLOCK_STEP                      # 7 columns per length block
+WORDLIST_START_ROW_1BASED = SCHEMA["start_row"]       # list starts row 4
+WORDLIST_MAX_ROWS = SCHEMA["max_rows"]
 
 # Timestamp columns relative to word column
-TS_IMPORT_OFFSET = 1      # direkt rechts neben dem Wort
-TS_USED_OFFSET   = 2      # zweite Spalte rechts (für 30-Tage-Logik)
-TIMESTAMP_COL_OFFSET = 2
+TS_IMPORT_OFFSET = field_offset(SCHEMA, F_IMPORTED)  # direkt rechts neben dem Wort
+TS_USED_OFFSET   = field_offset(SCHEMA, F_USED)      # zweite Spalte rechts (für 30-Tage-Logik)
+TIMESTAMP_COL_OFFSET = TS_USED_OFFSET
 
 # Optional header row
-HEADER_ROW_1BASED = 3
+HEADER_ROW_1BASED = SCHEMA["header_row"]
 SYNC_HEADERS = True
 
 
 # Locales to try
 LOCALES_DE = (("de", "DE"), ("de", "CH"), ("de", "AT"))
 
+# File import (streaming, see import_words_from_file)
+FILE_IMPORT_BATCH = 200          # pending new words per length before one bulk write
+FILE_IMPORT_PROGRESS_EVERY = 500 # lines between status bar updates
+
+# Parallel spellcheck (see _spell_check_many)
+# "off" = one by one in the macro thread (default, safe)
+# "process" = offline word list SPELL_OFFLINE_DICT, no UNO in the workers
+# "thread" = one LO SpellChecker per worker thread (opt-in; UNO calls from Python threads)
+SPELL_MODE = "off"
+SPELL_WORKERS = 4
+SPELL_OFFLINE_DICT = ""      # "process": path to a UTF-8 word list (one word per line)
+SPELL_BATCH = 4 * CHUNK_PROCESS  # file import: words per spellcheck round (several process chunks)
+
 
 # ============================================================
 # 2) UNO HELPERS
@@ -91,12 +120,7 @@ def _get_sheet(doc):
 def _msgbox(title, message):
     doc = _get_doc()
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "INFOBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "INFOBOX")
     except Exception:
         pass
 
@@ -240,6 +264,32 @@ def _spell_suggestions_any(sp, word: str, max_n=2):
 
     return []
 
+def _spell_session(sp):
+    """One session per import (kreis_spellpool): pool / offline dictionary set up once."""
+    return SpellSession(
+        SPELL_MODE if SPELL_WORKERS > 1 else "off",
+        check=_spell_is_valid_any,
+        make_checker=_get_spellchecker_direct,
+        workers=SPELL_WORKERS,
+        dict_path=SPELL_OFFLINE_DICT,
+        checker=sp,
+    )
+
+def _spell_check_many(sp, words, session=None):
+    """
+    Spellcheck a whole batch (same rule as _spell_is_valid_any).
+    session: _spell_session(sp) of the running import (several batches), else one for this batch.
+    Returns [bool] in input order; the sheet is written afterwards, single-threaded.
+    """
+    words = list(words)
+    try:
+        if session is not None:
+            return session.check(words)
+        with _spell_session(sp) as spell:
+            return spell.check(words)
+    except Exception:
+        return [_spell_is_valid_any(sp, w) for w in words]
+
 
 # ============================================================
 # 5) NORMALIZATION
@@ -269,19 +319,36 @@ def _normalize_crossword(raw: str) -> str:
 # ============================================================
 
 def _word_col0_for_len(L: int) -> int:
-    return WORDLIST_BASE_COL0 + (L - WORDLEN_MIN) * WORDLIST_BLOCK_STEP
+    return word_col0(SCHEMA, L)
 
-def _find_word_in_column(sheet, word_col0: int, target: str):
+def _column_word_index(sheet, word_col0: int):
+    """
+    Trie word -> row (1-based) for one list column.
+    One bulk read of the column instead of a cell-by-cell scan per candidate.
+    First occurrence wins (same as the old linear search).
+    """
     start0 = WORDLIST_START_ROW_1BASED - 1
     end0 = start0 + WORDLIST_MAX_ROWS - 1
-    t = (target or "").strip().upper()
-    for r0 in range(start0, end0 + 1):
-        w = (sheet.getCellByPosition(word_col0, r0).getString() or "").strip().upper()
-        if not w:
-            continue
-        if w == t:
-            return r0 + 1  # 1-based
-    return None
+    trie = WordTrie()
+    try:
+        data = sheet.getCellRangeByPosition(word_col0, start0, word_col0, end0).getDataArray()
+    except Exception:
+        data = ()
+    for i, row in enumerate(data):
+        w = str(row[0] or "").strip().upper() if row else ""
+        if w and w not in trie:
+            trie.add(w, start0 + i + 1)
+    return trie
+
+def _find_word_in_column(sheet, word_col0: int, target: str, index_cache: dict = None):
+    """Row (1-based) of target in the list column, or None. index_cache: {word_col0: WordTrie}"""
+    if index_cache is None:
+        index_cache = {}
+    trie = index_cache.get(word_col0)
+    if trie is None:
+        trie = _column_word_index(sheet, word_col0)
+        index_cache[word_col0] = trie
+    return trie.get((target or "").strip().upper())
 
 def _append_first_empty(sheet, word_col0: int, w: str, ts_import: str):
     start0 = WORDLIST_START_ROW_1BASED - 1
@@ -329,51 +396,22 @@ def _compact_word_and_meta(sheet, word_col0: int, col_offsets: tuple):
 
 def _compact_all_wordlists(sheet):
     """
-    Kompaktiert ALLE Wortlisten-Spalten (Wort + Timestamp) ab WORDLIST_START_ROW_1BASED.
-    Unabhängig von _compact_word_and_ts (falls die fehlt/kaputt ist).
+    Kompaktiert ALLE Wortlisten (Wort + Import- und Benutzt-Zeitstempel) ab WORDLIST_START_ROW_1BASED.
+    Je Block ein getDataArray + ein setDataArray (kreis_schema.compact_block).
+    Returns: {L: Anzahl Wörter}
     """
-    start0 = WORDLIST_START_ROW_1BASED - 1
-    end0 = start0 + WORDLIST_MAX_ROWS - 1
-
-    for L in range(WORDLEN_MIN, WORDLEN_MAX + 1):
-        word_col0 = _word_col0_for_len(L)
-        ts_col0   = word_col0 + TIMESTAMP_COL_OFFSET
-
-        # 1) sammeln
-        pairs = []
-        for r0 in range(start0, end0 + 1):
-            w = (sheet.getCellByPosition(word_col0, r0).getString() or "").strip()
-            if not w:
-                continue
-            ts = (sheet.getCellByPosition(ts_col0, r0).getString() or "").strip()
-            pairs.append((w, ts))
-
-        # 2) kompakt zurückschreiben
-        write0 = start0
-        for w, ts in pairs:
-            sheet.getCellByPosition(word_col0, write0).setString(w)
-            sheet.getCellByPosition(ts_col0, write0).setString(ts)
-            write0 += 1
-
-        # 3) Rest leeren
-        for r0 in range(write0, end0 + 1):
-            sheet.getCellByPosition(word_col0, r0).setString("")
-            sheet.getCellByPosition(ts_col0, r0).setString("")
+    return {L: compact_block(sheet, SCHEMA, L) for L in range(WORDLEN_MIN, WORDLEN_MAX + 1)}
 
 
 def _sync_headers(sheet):
     if not SYNC_HEADERS:
         return
     try:
-        r0 = HEADER_ROW_1BASED - 1
-        for L in range(WORDLEN_MIN, WORDLEN_MAX + 1):
-            col0 = _word_col0_for_len(L)
-            colA1 = _col_index_to_letters(col0)
-            want = f"Wörter in {colA1}\n{L} Buchstaben"
-            cell = sheet.getCellByPosition(col0, r0)
-            cur = (cell.getString() or "").strip()
-            if cur != want:
-                cell.setString(want)
+        # one getDataArray over the header row, only differing headers are written
+        _COUNT_HEADERS.update_row(sheet, HEADER_ROW_1BASED, {
+            _word_col0_for_len(L): (f"Wörter in {_col_index_to_letters(_word_col0_for_len(L))}\n", L, " Buchstaben")
+            for L in range(WORDLEN_MIN, WORDLEN_MAX + 1)
+        }, bold=False, doc=_get_doc())
     except Exception:
         pass
 
@@ -387,26 +425,27 @@ def _count_nonempty_in_col(sheet, col0: int, start_row_1based: int, max_rows: in
             n += 1
     return n
         
-def _write_count_cell(sheet, col0: int, row_1based: int, n: int):
-    r0 = row_1based - 1
-    cell = sheet.getCellByPosition(col0, r0)
-
-    cell.setString(f"Anzahl Wörter:\n{n}")
+_COUNT_HEADERS = HeaderWriter()  # last written header/count texts (kreis_headers.py)
 
-    cell.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-    cell.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+def _format_count_cell(cell):
+    """Only for cells that were actually rewritten."""
+    cell.HoriJustify = hori("CENTER")
+    cell.VertJustify = vert("CENTER")
     cell.IsTextWrapped = True
     cell.CharHeight = 11.0
 
-def _update_all_wordlist_counts(sheet):
+def _update_all_wordlist_counts(sheet, counts=None):
     """
     Schreibt pro Wortspalte (AG..CD) die Anzahl in Zeile 2.
-    Gezählt wird ab Zeile 4 in der jeweiligen Wortspalte.
+    counts {L: n} aus dem Listen-Index des Laufs (Kompaktieren / freie Zeilen);
+    ohne counts: ein Bulk-Read aller Blöcke. Nur geänderte Zellen werden neu geschrieben.
     """
-    for L in range(WORDLEN_MIN, WORDLEN_MAX + 1):
-        word_col0 = _word_col0_for_len(L)
-        cnt = _count_nonempty_in_col(sheet, word_col0, WORDLIST_START_ROW_1BASED, WORDLIST_MAX_ROWS)
-        _write_count_cell(sheet, word_col0, 2, cnt)
+    if counts is None:
+        blocks = read_blocks(sheet, SCHEMA)  # one bulk read for all lengths
+        counts = {L: count_words(blocks[L]) for L in blocks}
+    _COUNT_HEADERS.update_row(sheet, SCHEMA["count_row"], {
+        _word_col0_for_len(L): ("Anzahl Wörter:\n", counts[L]) for L in range(WORDLEN_MIN, WORDLEN_MAX + 1)
+    }, bold=False, on_write=_format_count_cell, doc=_get_doc())
 
 def _update_candidate_count_in_AB3(sheet):
     """
@@ -417,8 +456,8 @@ def _update_candidate_count_in_AB3(sheet):
     cell = sheet.getCellByPosition(CAND_COL_STATUS0, 2)  # row0=2 => row3
     cell.setString(f"Anzahl der Wörter:\n{cnt}")
     try:
-        cell.HoriJustify = _h("CENTER")
-        cell.VertJustify = _v("CENTER")
+        cell.HoriJustify = hori("CENTER")
+        cell.VertJustify = vert("CENTER")
         cell.IsTextWrapped = True
         cell.CharHeight = 14
     except Exception:
@@ -428,8 +467,8 @@ def _write_label_cell(sheet, col0: int, row_1based: int, text: str):
     cell = sheet.getCellByPosition(col0, row_1based - 1)
     cell.setString(text)
     try:
-        cell.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-        cell.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+        cell.HoriJustify = hori("CENTER")
+        cell.VertJustify = vert("CENTER")
         cell.IsTextWrapped = True
         cell.CharHeight = 11
     except Exception:
@@ -525,6 +564,17 @@ def import_candidates_from_AA(*args):
     start0 = CAND_START_ROW_1BASED - 1
     end0 = start0 + CAND_MAX_ROWS - 1
     now = _now_str()
+    list_index = {}  # word_col0 -> WordTrie (built on first use, updated on insert)
+
+    # Spellcheck all candidates up front (parallel), results by cleaned word
+    try:
+        cand = sheet.getCellRangeByPosition(CAND_COL_WORD0, start0, CAND_COL_WORD0, end0).getDataArray()
+    except Exception:
+        cand = ()
+    to_check = list(dict.fromkeys(
+        c for c in (_clean_candidate_keep_hyphen(str(row[0] or "") if row else "") for row in cand) if c
+    ))
+    spell_ok = dict(zip(to_check, _spell_check_many(sp, to_check)))
 
     doc.lockControllers()
     try:
@@ -545,7 +595,10 @@ def import_candidates_from_AA(*args):
                 continue
 
             # 2) Spellcheck
-            if not _spell_is_valid_any(sp, cleaned):
+            ok = spell_ok.get(cleaned)
+            if ok is None:
+                ok = _spell_is_valid_any(sp, cleaned)
+            if not ok:
                 sugg = _spell_suggestions_any(sp, cleaned, max_n=2)
                 if sugg:
                     ab.setString("Nicht im LO Wörterbuch; Vorschläge: " + ", ".join(sugg))
@@ -570,7 +623,7 @@ def import_candidates_from_AA(*args):
             colA1 = _col_index_to_letters(word_col0)
 
             # 4) Already present? -> AA MUST STAY
-            found_row1 = _find_word_in_column(sheet, word_col0, cw)
+            found_row1 = _find_word_in_column(sheet, word_col0, cw, list_index)
             if found_row1 is not None:
                 ab.setString(f"Wort vorhanden in {colA1} {found_row1}")
                 # AA bleibt stehen (Änderungswunsch)
@@ -582,12 +635,13 @@ def import_candidates_from_AA(*args):
                 ab.setString(f"Liste voll in {colA1} (max {WORDLIST_MAX_ROWS}).")
                 continue
 
+            list_index[word_col0].add(cw, row1)
             ab.setString(f"Neu aufgenommen in {colA1} {row1}")
             aa.setString("")  # NUR hier löschen
 
-        _compact_all_wordlists(sheet)
-        
-        _update_all_wordlist_counts(sheet)
+        counts = _compact_all_wordlists(sheet)
+
+        _update_all_wordlist_counts(sheet, counts)
         _update_timestamp_labels_row2(sheet)
         _update_candidate_count_in_AB3(sheet)
 
@@ -597,12 +651,240 @@ def import_candidates_from_AA(*args):
     return True
 
 
+# ============================================================
+# 7B) FILE IMPORT (streaming, large UTF-8 text/CSV files)
+# ============================================================
+
+def _pick_import_file(doc):
+    """FilePicker -> system path or None."""
+    try:
+        ctx = XSCRIPTCONTEXT.getComponentContext()
+        fp = ctx.ServiceManager.createInstanceWithContext("com.sun.star.ui.dialogs.FilePicker", ctx)
+        try:
+            fp.appendFilter("Text / CSV", "*.txt;*.csv;*.dic;*.lst")
+            fp.appendFilter("Alle Dateien", "*.*")
+        except Exception:
+            pass
+        if fp.execute() != 1:  # 1 = OK
+            return None
+        files = fp.getSelectedFiles() or fp.getFiles()
+        if not files:
+            return None
+        return uno.fileUrlToSystemPath(files[0])
+    except Exception:
+        return None
+
+def _status_indicator(doc):
+    try:
+        return doc.CurrentController.StatusIndicator
+    except Exception:
+        return None
+
+def _first_field(line: str) -> str:
+    """First CSV field (separator ; , or TAB), quotes removed."""
+    s = (line or "").strip().lstrip("\ufeff")
+    for sep in (";", "\t", ","):
+        i = s.find(sep)
+        if i >= 0:
+            s = s[:i]
+    return s.strip().strip('"').strip()
+
+def _read_list_block(sheet, L: int):
+    """
+    ONE bulk read of the length block (kreis_schema.read_block).
+    Returns: (trie word->row1, free_rows0 list)
+    """
+    data = read_block(sheet, SCHEMA, L)
+    trie = WordTrie()
+    for row1, fields in iter_entries(SCHEMA, data):
+        w = fields[F_WORD].upper()
+        if w not in trie:
+            trie.add(w, row1)
+    return trie, [r - 1 for r in free_rows(SCHEMA, data)]
+
+def _write_rows_bulk(sheet, L: int, rows):
+    """
+    rows: list of (row0, word, ts_import).
+    Writes word | import ts | used ts ("") with one setDataArray per contiguous run.
+    """
+    write_rows(sheet, SCHEMA, L, [
+        (r0 + 1, {F_WORD: w, F_IMPORTED: ts, F_USED: ""}) for r0, w, ts in rows
+    ])
+
+def import_words_from_file(*args):
+    """
+    Streaming import of a UTF-8 text/CSV file (one word per line, first CSV column):
+    - same pipeline as AA: clean -> spellcheck -> crossword normalize -> length 5..12 -> dedupe
+    - file is read line by line (bounded memory: only the length blocks are held, max.
+      WORDLIST_MAX_ROWS per length, plus up to FILE_IMPORT_BATCH pending rows each)
+    - spellcheck runs in batches of SPELL_BATCH on the worker pool (SPELL_MODE)
+    - new words are written in bulk (setDataArray per contiguous free run)
+    - progress in the status bar; stops early when all lists are full
+    """
+    doc = _get_doc()
+    try:
+        sheet = _get_sheet(doc)
+    except Exception:
+        _msgbox("Datei-Import", f"Sheet '{SHEET_NAME}' nicht gefunden.")
+        return False
+
+    path = args[0] if args and isinstance(args[0], str) else _pick_import_file(doc)
+    if not path:
+        return False
+
+    try:
+        sp = _get_spellchecker_direct()
+    except Exception as e:
+        _msgbox("Datei-Import", f"SpellChecker nicht verfügbar: {e}")
+        return False
+
+    try:
+        total_bytes = os.path.getsize(path)
+    except Exception:
+        total_bytes = 0
+
+    _sync_headers(sheet)
+
+    # one bulk read per length block
+    blocks = {}
+    for L in range(WORDLEN_MIN, WORDLEN_MAX + 1):
+        word_col0 = _word_col0_for_len(L)
+        trie, free_rows0 = _read_list_block(sheet, L)
+        blocks[L] = {"col0": word_col0, "trie": trie, "free": free_rows0, "pending": []}
+
+    stats = {"lines": 0, "new": 0, "present": 0, "not_in_dict": 0, "bad_len": 0, "empty": 0, "full": 0}
+    now = _now_str()
+
+    def flush(L):
+        b = blocks[L]
+        if b["pending"]:
+            _write_rows_bulk(sheet, L, b["pending"])
+            b["pending"] = []
+
+    batch = []  # (cleaned, cw) waiting for the parallel spellcheck
+
+    def check_batch():
+        # results come back in input order -> same outcome as checking one by one
+        results = _spell_check_many(sp, [c for c, _cw in batch], spell)
+        for (_cleaned, cw), ok in zip(batch, results):
+            if not ok:
+                stats["not_in_dict"] += 1
+                continue
+            L = len(cw)
+            b = blocks[L]
+            if cw in b["trie"]:
+                stats["present"] += 1  # twice in the same batch
+                continue
+            if not b["free"]:
+                stats["full"] += 1
+                continue
+            row0 = b["free"].pop(0)
+            b["trie"].add(cw, row0 + 1)
+            b["pending"].append((row0, cw, now))
+            stats["new"] += 1
+            if len(b["pending"]) >= FILE_IMPORT_BATCH:
+                flush(L)
+        batch.clear()
+
+    ind = _status_indicator(doc)
+    if ind is not None:
+        try:
+            ind.start("Wörter importieren …", max(1, total_bytes))
+        except Exception:
+            ind = None
+
+    done_bytes = 0
+    spell = _spell_session(sp)  # one pool / dictionary load for all batches
+    doc.lockControllers()
+    try:
+        with open(path, "rb") as f:
+            for raw_line in f:
+                done_bytes += len(raw_line)
+                stats["lines"] += 1
+
+                if ind is not None and stats["lines"] % FILE_IMPORT_PROGRESS_EVERY == 0:
+                    try:
+                        ind.setValue(done_bytes)
+                        ind.setText(f"Wörter importieren … {stats['lines']} Zeilen, {stats['new']} neu")
+                    except Exception:
+                        pass
+
+                cleaned = _clean_candidate_keep_hyphen(_first_field(raw_line.decode("utf-8", "replace")))
+                if not cleaned:
+                    stats["empty"] += 1
+                    continue
+
+                # cheap checks first: length and duplicates need no spellchecker
+                cw = _normalize_crossword(cleaned)
+                L = len(cw)
+                if L < WORDLEN_MIN or L > WORDLEN_MAX:
+                    stats["bad_len"] += 1
+                    continue
+
+                b = blocks[L]
+                if cw in b["trie"]:
+                    stats["present"] += 1
+                    continue
+                if not b["free"]:
+                    stats["full"] += 1
+                    if all(not x["free"] for x in blocks.values()):
+                        break  # every list is full -> stop reading
+                    continue
+
+                batch.append((cleaned, cw))
+                if len(batch) >= SPELL_BATCH:
+                    check_batch()
+
+        if batch:
+            check_batch()
+        for L in blocks:
+            flush(L)
+
+        # counts from the index of this run: occupied rows = max rows - free rows
+        _update_all_wordlist_counts(sheet, {L: WORDLIST_MAX_ROWS - len(b["free"]) for L, b in blocks.items()})
+        _update_timestamp_labels_row2(sheet)
+
+    except Exception as e:
+        for L in blocks:
+            try:
+                flush(L)
+            except Exception:
+                pass
+        _msgbox("Datei-Import", f"Import abgebrochen nach {stats['lines']} Zeilen:\n{e}")
+        return False
+
+    finally:
+        spell.close()
+        try:
+            doc.unlockControllers()
+        except Exception:
+            pass
+        if ind is not None:
+            try:
+                ind.end()
+            except Exception:
+                pass
+
+    _msgbox(
+        "Datei-Import",
+        f"Zeilen gelesen: {stats['lines']}\n"
+        f"Neu aufgenommen: {stats['new']}\n"
+        f"Schon vorhanden: {stats['present']}\n"
+        f"Nicht im LO Wörterbuch: {stats['not_in_dict']}\n"
+        f"Länge nicht 5..12: {stats['bad_len']}\n"
+        f"Liste voll: {stats['full']}\n"
+        f"Leer/keine Buchstaben: {stats['empty']}"
+    )
+    return True
+
+
 # ============================================================
 # 8) EXPORTED MACROS
 # ============================================================
 
 g_exportedScripts = (
     import_candidates_from_AA,
+    import_words_from_file,
     show_wordlists,
     hide_wordlists,
     clear_candidates_AA_AB,
@@ -4,10 +4,30 @@
 # ============================================================
 import uno
 import random
-import math
 import time
 from datetime import datetime, timedelta
 
+# Shared helpers (Scripts/python/pythonpath/)
+from kreis_scramble import plan_scramble
+from kreis_model import num_circles_for_len, rows_from_model, model_from_words
+from kreis_difficulty import score_puzzle, make_scramble_score_fn
+from kreis_solver import build_word_index, verify_unique
+from kreis_analytics import analyze_rows, format_report, layout_col_span
+from kreis_docprops import ensure_layout, get_user_prop, set_user_prop
+from kreis_layout import apply_row_heights, apply_col_widths
+from kreis_styles import (ensure_cell_styles, apply_style, STYLE_CENTER, STYLE_HEADER, STYLE_WORDLIST_META,
+                          STYLE_WORDLIST_HEADER)
+from kreis_schema import get_schema, word_col0, field_col0, field_offset, read_block, iter_entries, F_WORD, F_USED
+from kreis_puzzle import new_puzzle, with_steps, solution_model, scrambled_model, to_json, from_json, to_bytes, load_any
+from kreis_archive import open_archive, word_key
+from kreis_render import write_pdf, with_answer_keys
+from kreis_shapes import CircleTemplate
+from kreis_uno import hori, vert, bold, cell_flags, message_box
+from kreis_pairing import (
+    build_pair_table, best_partner_index, best_pair_order,
+    symmetric_pair_mask, drop_symmetric_partners, pair_has_symmetric_circle,
+)
+
 # --- robust fallback: Point/Size always available ---
 try:
     from com.sun.star.awt import Point, Size
@@ -28,6 +48,15 @@ except Exception:
 # --- GENERAL ---
 SHEET_NAME = "KREIS_WORTRAETSEL"
 MARK_DESC  = "KREIS_WORTRAETSEL_V1"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout shared with the importer (kreis_schema.py)
+
+# Sheet formatting runs once per document and layout version (document user property)
+LAYOUT_FLAG = "KREIS_WORTRAETSEL_LAYOUT"
+LAYOUT_VERSION = 3  # raise when _init_sheet_layout changes (2: named cell styles, 3: wordlist header style)
+
+# Last generated puzzle (kreis_puzzle JSON: words + rotations + seed), stored with the document
+PUZZLE_PROP = "KREIS_WORTRAETSEL_PUZZLE"
+PUZZLE_FILE_EXT = ".krz"
 
 # --- TEST / PROTECTION (TESTPHASE: OFF) ---
 ENABLE_SHEET_PROTECTION = False
@@ -82,35 +111,37 @@ ANCHOR_COL0 = 4  # E (0-based)
 # Maximum circles per row (for 11/12 letters -> 6 circles)
 MAX_CIRCLES = 6
 
-# --- WORDLIST LAYOUT (BLOCKS FROM AG, 5..12 LETTERS) ---
-WORDLIST_BASE_COL0 = 32         # AG
-WORDLIST_BLOCK_STEP = 7         # 7 columns per length block
-WORDLIST_LEN_MIN = 5
-WORDLIST_LEN_MAX = 12
+# --- WORDLIST LAYOUT (BLOCKS FROM AG, 5..12 LETTERS, see kreis_schema.py) ---
+WORDLIST_LEN_MIN = SCHEMA["len_min"]
+WORDLIST_LEN_MAX = SCHEMA["len_max"]
 
-WORDLIST_HEADER_ROW_1BASED = 3  # Überschrift steht über der Liste (Liste startet in Zeile 4)
-WORDLIST_START_ROW_1BASED  = 4  # first word row
-WORDLIST_MAX_ROWS = 300         # scan/format depth for list content
+WORDLIST_HEADER_ROW_1BASED = SCHEMA["header_row"]  # Überschrift steht über der Liste (Liste startet in Zeile 4)
+WORDLIST_START_ROW_1BASED  = SCHEMA["start_row"]   # first word row
+WORDLIST_MAX_ROWS = 300         # format depth for list content (reads use SCHEMA["max_rows"])
 
 # Row height rule for list area
 ROWHEIGHT_FROM_ROW_1BASED = 13  # set row height from row 13 downward
 ROWHEIGHT_ROWS_COUNT = 300      # how far down to apply row height (safe buffer)
 
 # ---------- CONFIG FOR WORDLIST LAYOUT ----------
-# You told: 8-letter words are in BI (and timestamp is +2 columns => BK).
-WORDLIST_ANCHOR_LEN = 8
-WORDLIST_ANCHOR_COL_A1 = "BB"     # word column for 8-letter list
-WORDLIST_COL_STEP = 7             # move 7 columns per length (adjust if needed)
-TIMESTAMP_COL_OFFSET = 2          # timestamp is +2 columns from word column
+# 8-letter words are in BB, the "used" timestamp is +2 columns (kreis_schema F_USED)
+TIMESTAMP_COL_OFFSET = field_offset(SCHEMA, F_USED)
 RECENT_DAYS = 30
 
+# --- DIFFICULTY (kreis_difficulty.py) ---
+# None = take the first random draw (old behaviour).
+# Otherwise draw DIFFICULTY_CANDIDATES puzzles and keep the one closest to the target score.
+# The scramble then aims at the target as well (may leave up to 1-2 circles solved = easier).
+DIFFICULTY_TARGET = None
+DIFFICULTY_CANDIDATES = 12
+
 # Slots (where we store picked words in Y and map to circle halves)
 SLOT_ROWS = [4, 5, 7, 8, 10, 11]     # top/bot for 3 circle rows
 STORE_COL_Y0 = 24                    # Y
 
 
 # ============================================================
-# 2) UNO & Cell Helpers (_cell, _set_row_height, _debug_a1, …)
+# 2) UNO & Cell Helpers (_cell, _debug_a1, …; row heights/widths: kreis_layout)
 # ============================================================
 
 def _get_doc():
@@ -124,12 +155,7 @@ def _get_draw_page(sheet):
 
 def _msgbox(doc, title, message):
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "WARNINGBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "WARNINGBOX")
     except Exception:
         pass
 
@@ -139,20 +165,6 @@ def _debug_a1(sheet, msg):
     except Exception:
         pass
 
-def _set_center(rng):
-    try:
-        rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-        rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
-    except Exception:
-        pass
-
-def _set_bold(rng, pt=14):
-    try:
-        rng.CharHeight = pt
-        rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-    except Exception:
-        pass
-
 def _read_int(sheet, a1, default=0):
     """
     Reads an integer from a single cell (A1 address).
@@ -174,22 +186,6 @@ def _read_int(sheet, a1, default=0):
         return default
 
 
-def _set_row_height(sheet, row_1based, height_u100mm):
-    rr = sheet.Rows.getByIndex(row_1based - 1)
-    try:
-        rr.OptimalHeight = False
-    except Exception:
-        pass
-    rr.Height = int(height_u100mm)
-
-def _set_col_width(sheet, col0, width_u100mm):
-    cc = sheet.Columns.getByIndex(col0)
-    try:
-        cc.OptimalWidth = False
-    except Exception:
-        pass
-    cc.Width = int(width_u100mm)
-
 def _row_top_y(sheet, row_1based):
     y = 0
     rows = sheet.Rows
@@ -269,15 +265,20 @@ def _read_manual_D_overrides(sheet, cap_letters: int):
     return manual, rows_to_clear
 
 
-def _touch_timestamps_for_used_words(word_to_item: dict, used_words: set, now_str: str):
+def _touch_timestamps_for_used_words(word_to_item: dict, used_words: set, now_str: str, tx=None):
     """
     Sets timestamp ONLY for words that are actually used in final result.
     word_to_item: mapping word -> candidate item dict from _read_candidates (contains 'tcell').
+    tx: optional undo log (see _commit_fill) – old timestamps are restored on rollback.
+        With tx a failed write raises (-> rollback), without tx it is ignored.
     """
     for w in used_words:
         it = word_to_item.get(w)
         if it is None:
             continue
+        if tx is not None:
+            _tx_set_cell_string(tx, it["tcell"], now_str)
+            continue
         try:
             it["tcell"].setString(now_str)
         except Exception:
@@ -314,8 +315,7 @@ def _update_left_labels(sheet, L: int):
         except Exception:
             pass
         sheet.getCellByPosition(1, r1 - 1).setString(txt)
-        _set_center(rng)
-        _set_bold(rng, pt=14)
+        apply_style(rng, STYLE_HEADER)  # 14 pt bold, centered (kreis_styles)
 
 
 # ============================================================
@@ -326,6 +326,7 @@ def format_wordlist_layout(*args):
     """Callable macro: formats the wordlist blocks (AG..)."""
     doc = _get_doc()
     sheet = _get_sheet(doc)
+    ensure_cell_styles(doc)
     _format_wordlist_blocks(sheet)
     _debug_a1(sheet, "Wordlist layout formatted (AG.. blocks + row heights from 13).")
     return True
@@ -333,7 +334,7 @@ def format_wordlist_layout(*args):
 
 def _wordlist_word_col0_for_len_from_AG(L: int) -> int:
     # 5 -> AG, 6 -> AN, 7 -> AU, 8 -> BB, ... 12 -> CD
-    return WORDLIST_BASE_COL0 + (L - WORDLIST_LEN_MIN) * WORDLIST_BLOCK_STEP
+    return word_col0(SCHEMA, L)
 
 
 def _format_wordlist_blocks(sheet):
@@ -347,47 +348,44 @@ def _format_wordlist_blocks(sheet):
     wide_w   = cm(3.8)
     narrow_w = cm(1.0)
 
+    widths = {}
     for L in range(WORDLIST_LEN_MIN, WORDLIST_LEN_MAX + 1):  # <-- IMPORTANT +1
         block0 = _wordlist_word_col0_for_len_from_AG(L)
 
-        # widths: [word] + [3x 3.8cm] + [3x 1.0cm]
-        _set_col_width(sheet, block0 + 0, cm(word_col_width_cm(L)))
-        _set_col_width(sheet, block0 + 1, wide_w)
-        _set_col_width(sheet, block0 + 2, wide_w)
-        _set_col_width(sheet, block0 + 3, wide_w)
-        _set_col_width(sheet, block0 + 4, narrow_w)
-        _set_col_width(sheet, block0 + 5, narrow_w)
-        _set_col_width(sheet, block0 + 6, narrow_w)
+        # widths: [word] + [3x 3.8cm] + [3x 1.0cm]  (applied below, range-wise)
+        widths[block0 + 0] = cm(word_col_width_cm(L))
+        for off in (1, 2, 3):
+            widths[block0 + off] = wide_w
+        for off in (4, 5, 6):
+            widths[block0 + off] = narrow_w
 
-        # header row formatting across the whole block
+        # header row across the whole block: 10.5 pt bold (kreis_styles)
         try:
-            hdr_rng = sheet.getCellRangeByPosition(block0, hdr_r0, block0 + 6, hdr_r0)
-            hdr_rng.CharHeight = 10.5
-            hdr_rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
+            apply_style(sheet.getCellRangeByPosition(block0, hdr_r0, block0 + 6, hdr_r0),
+                        STYLE_WORDLIST_HEADER)
         except Exception:
             pass
 
-        # AH..AM style within each block: +1..+6
+        # AH..AM style within each block: +1..+6 (12 pt, centered)
         try:
-            rng = sheet.getCellRangeByPosition(block0 + 1, start_r0, block0 + 6, end_r0)
-            rng.CharHeight = 12
-            rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-            rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+            apply_style(sheet.getCellRangeByPosition(block0 + 1, start_r0, block0 + 6, end_r0),
+                        STYLE_WORDLIST_META)
         except Exception:
             pass
 
-    # row height from row 13 downward
+    # all block widths: one call per run of equal widths
+    apply_col_widths(sheet, widths)
+
+    # row height from row 13 downward: one range instead of one call per row
     rh = cm(0.7)
-    for r in range(ROWHEIGHT_FROM_ROW_1BASED, ROWHEIGHT_FROM_ROW_1BASED + ROWHEIGHT_ROWS_COUNT):
-        try:
-            _set_row_height(sheet, r, rh)
-        except Exception:
-            break
+    apply_row_heights(sheet, {r: rh for r in range(ROWHEIGHT_FROM_ROW_1BASED,
+                                                   ROWHEIGHT_FROM_ROW_1BASED + ROWHEIGHT_ROWS_COUNT)})
 
 def sync_wordlist_headers(*args):
     """Callable macro: fix/update all headers 5..12."""
     doc = _get_doc()
     sheet = _get_sheet(doc)
+    ensure_cell_styles(doc)
     _sync_wordlist_headers(sheet, overwrite=True)
     _debug_a1(sheet, "Wordlist headers synced (5..12).")
     return True
@@ -412,11 +410,7 @@ def _sync_wordlist_headers(sheet, overwrite=True):
         if overwrite or (not cur):
             cell.setString(wanted)
 
-        try:
-            cell.CharHeight = 10.5
-            cell.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-        except Exception:
-            pass
+        apply_style(cell, STYLE_WORDLIST_HEADER)
 
 
 # ---------- helpers Spaltenindex → Buchstaben ----------
@@ -488,15 +482,11 @@ def _wordcount_from_C3(sheet) -> int:
     return v
 
 def _num_circles_for_len(L: int) -> int:
-    # 5-6->3, 7-8->4, 9-10->5, 11-12->6
-    n = int(math.ceil(L / 2.0))
-    if n < 3: n = 3
-    if n > 6: n = 6
-    return n
+    # 5-6->3, 7-8->4, 9-10->5, 11-12->6 (shared rule, see kreis_model.py)
+    return num_circles_for_len(L)
 
 def _wordlist_word_col0_for_len(L: int) -> int:
-    anchor0 = _col_letters_to_index(WORDLIST_ANCHOR_COL_A1)  # BB
-    return anchor0 + (L - WORDLIST_ANCHOR_LEN) * WORDLIST_COL_STEP
+    return word_col0(SCHEMA, L)
 
 
 def _read_candidates(sheet, L: int):
@@ -504,41 +494,63 @@ def _read_candidates(sheet, L: int):
     Read all non-empty cells in the word column for length L.
     Candidate is valid iff normalized word length == L.
     Timestamp cell is at (word_col + TIMESTAMP_COL_OFFSET).
+    One bulk read of the block (kreis_schema.read_block), cells only for the hits.
     """
-    col_word = _wordlist_word_col0_for_len(L)
-    col_ts = col_word + TIMESTAMP_COL_OFFSET
-    start0 = WORDLIST_START_ROW_1BASED - 1
-    end0 = start0 + WORDLIST_MAX_ROWS - 1
+    col_ts = field_col0(SCHEMA, L, F_USED)
 
     items = []
-    for r0 in range(start0, end0 + 1):
-        wcell = sheet.getCellByPosition(col_word, r0)
-        tcell = sheet.getCellByPosition(col_ts, r0)
-
-        raw = (wcell.getString() or "").strip()
-        if not raw:
-            continue
-
-        w = _normalize_crossword(raw)
+    for row1, fields in iter_entries(SCHEMA, read_block(sheet, SCHEMA, L)):
+        w = _normalize_crossword(fields[F_WORD])
         if len(w) != L:
             continue
 
-        ts_s = (tcell.getString() or "").strip()
-        ts_dt = _parse_ts_string(ts_s)
-
         items.append({
-            "row0": r0,
+            "row0": row1 - 1,
             "word": w,
-            "wcell": wcell,
-            "tcell": tcell,
-            "ts": ts_dt
+            "tcell": sheet.getCellByPosition(col_ts, row1 - 1),
+            "ts": _parse_ts_string(fields[F_USED])
         })
     return items
 
-def _pick_random_with_30day_rule(items, k: int):
+def _open_archive():
+    """Puzzle archive (kreis_archive) or None – the archive must never block a run."""
+    try:
+        return open_archive()
+    except Exception:
+        return None
+
+
+def _apply_archive_dates(items):
+    """30-day rule: a later use in the archive counts like a later timestamp in the list."""
+    arc = _open_archive()
+    if arc is None:
+        return
+    try:
+        recent = arc.recent(RECENT_DAYS)
+    except Exception:
+        return
+    for it in items:
+        ts = _parse_ts_string(recent.get(word_key(it["word"]), ""))
+        if ts is not None and (it["ts"] is None or ts > it["ts"]):
+            it["ts"] = ts
+
+
+def _archive_puzzle(puzzle):
+    """Append the committed puzzle to the archive (after the commit, never rolled back)."""
+    arc = _open_archive()
+    if arc is None:
+        return
+    try:
+        arc.add(puzzle["words"], when=puzzle["created"], source=MARK_DESC, data=puzzle)
+    except Exception:
+        pass
+
+
+def _pick_random_with_30day_rule(items, k: int, rng=random):
     """
     Prefer items with ts older than RECENT_DAYS or empty.
     If not enough, fall back to all items.
+    rng: random.Random(seed) for a reproducible draw (default: module random)
     """
     if k <= 0:
         return [], []
@@ -549,154 +561,62 @@ def _pick_random_with_30day_rule(items, k: int):
     pool = eligible if len(eligible) >= k else items
     if len(pool) < k:
         return [], [f"Zu wenige gültige Wörter in der Liste (benötigt {k}, verfügbar {len(pool)})."]
-    chosen = random.sample(pool, k)
+    chosen = rng.sample(pool, k)
     return chosen, []
 
 
-def _write_words_to_circles(sheet, desired_len: int, words_by_slotrow: dict):
+def _build_quad_model(desired_len: int, words_by_slotrow: dict):
     """
-    Write letters into the existing circle shapes.
+    In-memory quadrant model (no UNO access).
     For each circle row:
       - top half word comes from slot row (4,7,10)
       - bottom half word comes from slot row (5,8,11)
     Each circle shows 2 letters top (UL/UR) and 2 letters bottom (LL/LR).
+    Returns: list of (idx_tag, [UL, UR, LL, LR]) for 3 rows x n circles.
+    Words longer than the circles are truncated (kreis_model.model_from_words).
     """
-    dp = _get_draw_page(sheet)
-    name_map = _name_map_from_drawpage(dp)
+    return model_from_words(desired_len, [
+        (_normalize_crossword(words_by_slotrow.get(top_r, "")),
+         _normalize_crossword(words_by_slotrow.get(bot_r, "")))
+        for top_r, bot_r in [(4, 5), (7, 8), (10, 11)]
+    ])
 
-    n_circles = _num_circles_for_len(desired_len)
-    cap = 2 * n_circles
 
-    for row_index, (top_r, bot_r) in enumerate([(4,5), (7,8), (10,11)]):
-        top_w = _normalize_crossword(words_by_slotrow.get(top_r, ""))
-        bot_w = _normalize_crossword(words_by_slotrow.get(bot_r, ""))
-
-        # safety truncate (shouldn't happen if list is correct)
-        if len(top_w) > cap: top_w = top_w[:cap]
-        if len(bot_w) > cap: bot_w = bot_w[:cap]
-
-        for c in range(n_circles):
+def _read_quad_model_from_shapes(name_map, L: int):
+    """Fallback only (scramble without fill): read the current letters back from the text shapes."""
+    model = []
+    for row_index in range(3):
+        for c in range(_num_circles_for_len(L)):
             idx_tag = f"r{row_index}_c{c}"
-
-            t = top_w[c*2:(c*2)+2]
-            b = bot_w[c*2:(c*2)+2]
-
-            ul = t[0] if len(t) > 0 else " "
-            ur = t[1] if len(t) > 1 else " "
-            ll = b[0] if len(b) > 0 else " "
-            lr = b[1] if len(b) > 1 else " "
-
-            vals = (ul, ur, ll, lr)
-            for q, ch in enumerate(vals, start=1):
-                nm = f"{MARK_DESC}_text_{idx_tag}_{q}"
-                sh = name_map.get(nm)
+            vals = []
+            for q in range(1, 5):
+                sh = name_map.get(f"{MARK_DESC}_text_{idx_tag}_{q}")
                 if sh is None:
-                    continue
+                    vals = None
+                    break
                 try:
-                    sh.String = ch
+                    vals.append((sh.String or " ")[:1])
                 except Exception:
                     try:
-                        sh.Text.setString(ch)
+                        vals.append((sh.Text.getString() or " ")[:1])
                     except Exception:
-                        pass
-
-
-def _rotate_cw(vals):
-    """
-    vals order: [UL, UR, LL, LR]
-    90° clockwise => [LL, UL, LR, UR]
-    """
-    return [vals[2], vals[0], vals[3], vals[1]]
-
-def _rotate_ccw(vals):
-    """
-    vals order: [UL, UR, LL, LR]
-    90° counterclockwise => [UR, LR, UL, LL]
-    """
-    return [vals[1], vals[3], vals[0], vals[2]]
-
-def _rotate_vals_signed(vals, steps_signed):
-    v = list(vals)
-    s = int(steps_signed) % 4
-    if s == 0:
-        return v
-
-    if steps_signed > 0:
-        for _ in range(s):
-            v = _rotate_cw(v)
-    else:
-        for _ in range(s):
-            v = _rotate_ccw(v)
-    return v
+                        vals.append(" ")
+            if vals is not None:
+                model.append((idx_tag, vals))
+    return model
 
 
-def scramble_circles_after_fill(sheet, L):
-    """
-    Scramble ONLY visible circle letters (text shapes).
-    - Randomly rotates left or right (CW/CCW), steps 1..3
-    - NEVER keeps a circle unchanged on purpose.
-    - Only circles that are rotation-symmetric/empty may remain unchanged.
-    - Allowed unchanged (upper bound, not a target):
-        L>=8  -> <=2
-        L<8   -> <=1
-    """
+def _write_quad_model_to_circles(sheet, model):
+    """Write a quadrant model into the existing circle shapes (one String write per quadrant)."""
     dp = _get_draw_page(sheet)
     name_map = _name_map_from_drawpage(dp)
 
-    n_circles = _num_circles_for_len(L)
-    allowed_unchanged = 2 if L >= 8 else 1
-
-    total = 0
-    unchanged = 0
-    forced_unchanged = 0
-
-    circles = []
-    for row_index in range(3):
-        for c in range(n_circles):
-            idx_tag = f"r{row_index}_c{c}"
-
-            shapes = []
-            base_vals = []
-            missing = False
-            for q in range(1, 5):
-                nm = f"{MARK_DESC}_text_{idx_tag}_{q}"
-                sh = name_map.get(nm)
-                if sh is None:
-                    missing = True
-                    break
-                shapes.append(sh)
-                try:
-                    base_vals.append((sh.String or " ")[:1])
-                except Exception:
-                    try:
-                        base_vals.append((sh.Text.getString() or " ")[:1])
-                    except Exception:
-                        base_vals.append(" ")
-
-            if not missing:
-                circles.append((idx_tag, shapes, base_vals))
-
-    for idx_tag, shapes, base_vals in circles:
-        total += 1
-
-        candidates = []
-        for steps in (1, 2, 3):
-            cw_vals  = _rotate_vals_signed(base_vals, +steps)
-            ccw_vals = _rotate_vals_signed(base_vals, -steps)
-            if cw_vals != base_vals:
-                candidates.append(cw_vals)
-            if ccw_vals != base_vals:
-                candidates.append(ccw_vals)
-
-        if not candidates:
-            # cannot be changed (symmetric/empty)
-            forced_unchanged += 1
-            unchanged += 1
-            continue
-
-        # IMPORTANT: never choose "no rotation" -> always change if possible
-        new_vals = random.choice(candidates)
-        for sh, ch in zip(shapes, new_vals):
+    for idx_tag, vals in model:
+        for q, ch in enumerate(vals, start=1):
+            nm = f"{MARK_DESC}_text_{idx_tag}_{q}"
+            sh = name_map.get(nm)
+            if sh is None:
+                continue
             try:
                 sh.String = ch
             except Exception:
@@ -705,155 +625,416 @@ def scramble_circles_after_fill(sheet, L):
                 except Exception:
                     pass
 
-    # Only warn if we exceed the allowed max (usually only because of symmetry)
-    if unchanged > allowed_unchanged:
-        try:
-            doc = _get_doc()
-            _msgbox(
-                doc,
-                "Scramble Hinweis",
-                # f"{unchanged} Kreise sind unverändert (erlaubt max.: {allowed_unchanged}).\n"
-                f"Grund: {forced_unchanged} Kreise sind rotationssymmetrisch/leer."
-            )
-        except Exception:
-            pass
 
+def _write_words_to_circles(sheet, desired_len: int, words_by_slotrow: dict):
+    """Write letters (solution position) into the existing circle shapes."""
+    _write_quad_model_to_circles(sheet, _build_quad_model(desired_len, words_by_slotrow))
 
-# ---------- MAIN MACRO ----------
-def part2a_fill_random_from_wordlist(*args):
 
+def _plan_scramble(model, L, score_fn=None, target=None, rng=None):
     """
-    PART 2A + D override (no D length validation):
-    1) Clamp G3 to 5..12 (write back) and update left labels.
-    2) Ensure circle count matches G3 and clear all quadrant letters.
-    3) Pick N words (C3) from wordlist (30-day rule), NO timestamp yet.
-    4) Apply manual D overrides (truncate only).
-    5) If one half of a row-pair is filled, fill the other half from list (if possible).
-    6) Write final words to Y, clear used D cells.
-    7) Timestamp ONLY for words actually used.
-    8) Write letters into circles + scramble.
-    9) Write duration to F2 (10pt).
+    Scramble planner on the in-memory model (no UNO access).
+    All circles are planned together (kreis_scramble.plan_scramble):
+    - every circle that can change is rotated (never "no rotation" on purpose)
+    - only rotation-symmetric/empty circles may remain unchanged
+    - never the full solution
+    - with a difficulty target (score_fn/target) up to `allowed` circles may stay in
+      solution position on purpose (easier) and the plan closest to the target wins
+    Returns: (scrambled_model, info) with info = {"total", "unchanged", "forced_unchanged", "allowed_unchanged", "score", "steps"}
     """
-    doc = _get_doc()
-    sheet = _get_sheet(doc)
+    # Allowed unchanged (upper bound, not a target): L>=8 -> <=2, L<8 -> <=1
+    allowed = 2 if L >= 8 else 1
+
+    tags = [idx_tag for idx_tag, _vals in model]
+    steps, quads, pinfo = plan_scramble(
+        [vals for _tag, vals in model],
+        max_solved=allowed,
+        allow_solved=score_fn is not None and target is not None,
+        score_fn=score_fn,
+        target=target,
+        rng=rng,
+    )
 
-    t0 = time.perf_counter()
+    info = {
+        "total": pinfo["total"],
+        "unchanged": pinfo["solved_after"],
+        "forced_unchanged": pinfo["forced_solved"],
+        "allowed_unchanged": allowed,
+        "score": pinfo["score"],
+        "steps": steps,  # applied rotation per circle (kreis_puzzle)
+    }
+    return list(zip(tags, quads)), info
+
+
+def _scramble_warning(info):
+    """Message text if more circles than allowed stay unchanged (usually only because of symmetry)."""
+    if info["unchanged"] > info["allowed_unchanged"]:
+        # f"{unchanged} Kreise sind unverändert (erlaubt max.: {allowed_unchanged}).\n"
+        return f"Grund: {info['forced_unchanged']} Kreise sind rotationssymmetrisch/leer."
+    return None
 
-    ok = False
-    err_msg = None
 
-    # Keep these for finally (avoid NameError)
-    L = None
-    N = None
-    used_words_count = 0
-    manual_count = 0
+def _uniqueness_warning(result):
+    """Message text if the scrambled puzzle has more than one solution (or None)."""
+    if not result or result["unique"]:
+        return None
+    lines = []
+    for i in result["ambiguous_rows"]:
+        lines.append(f"Kreisreihe {i + 1}: mehrere Lösungen möglich.")
+    for i in result["unsolvable_rows"]:
+        lines.append(f"Kreisreihe {i + 1}: Wörter nicht in der Wortliste (Eindeutigkeit nicht prüfbar).")
+    return "\n".join(lines) or None
 
-    doc.lockControllers()
-    try:
-        # --- normalize inputs early (single source of truth: L) ---
-        L = _clamp_wordlen_to_5_12(sheet, writeback=True)
-        _update_left_labels(sheet, L)
 
-        # --- make sure the circle grid matches current L and is visually clean ---
-        ensure_circle_count_matches_G3(sheet)
-        clear_all_circle_quadrant_texts(sheet)
+def scramble_circles_after_fill(sheet, L, model=None, word_index=None):
+    """
+    Scramble ONLY visible circle letters (text shapes).
+    model: quadrant model from _build_quad_model (solution position). If given, the
+           shapes are NOT read back – the scrambled result is written exactly once.
+           Without model the current letters are read from the shapes (fallback).
+    word_index: optional kreis_solver index -> check that the solution is unique.
+    """
+    if model is None:
+        model = _read_quad_model_from_shapes(_name_map_from_drawpage(_get_draw_page(sheet)), L)
 
-        # --- clear input/output areas (keep formatting) ---
-        clear_contents_keep_format(sheet, "C4:C12")
-        clear_contents_keep_format(sheet, "Y4:Y12")
+    scrambled, info = _plan_scramble(model, L)
+    _write_quad_model_to_circles(sheet, scrambled)
 
-        # --- read N and compute caps ---
-        N = _wordcount_from_C3(sheet)       # 1..6
-        now = _now_str()
+    msgs = [_scramble_warning(info)]
+    if word_index is not None:
+        msgs.append(_uniqueness_warning(verify_unique(rows_from_model(scrambled), word_index)))
+    msg = "\n".join(m for m in msgs if m)
+    if msg:
+        try:
+            _msgbox(_get_doc(), "Scramble Hinweis", msg)
+        except Exception:
+            pass
+    return scrambled
 
-        n_circles = _num_circles_for_len(L)
-        cap = 2 * n_circles                 # max letters per half-row (2 per circle)
 
-        # --- load candidates from list (once) ---
-        items = _read_candidates(sheet, L)
-        if not items:
-            err_msg = f"Keine gültigen Wörter gefunden für Länge {L}."
-            return False
+# ---------- TRANSACTION (stage -> commit -> rollback) ----------
 
-        # Map word -> candidate item for timestamp (first occurrence wins)
-        word_to_item = {}
-        for it in items:
-            w = it["word"]
-            if w not in word_to_item:
-                word_to_item[w] = it
-
-        # Helper: pick 1 excluding already used words (uses 30-day rule if possible)
-        def pick_one_excluding(used_words: set):
-            pool = [it for it in items if it["word"] not in used_words]
-            if not pool:
-                return None
-            chosen, errs = _pick_random_with_30day_rule(pool, 1)
-            if errs or not chosen:
-                return None
-            return chosen[0]["word"]
-
-        # --- default fill from list (N words), NO timestamp yet ---
-        chosen, errs = _pick_random_with_30day_rule(items, N)
-        if errs:
-            err_msg = "\n".join(errs)
-            return False
+def _tx_set_cell_string(tx: list, cell, value: str):
+    """Writes a cell and remembers its previous content (formula/value/text) for rollback."""
+    old = cell.getFormula()
+    cell.setString(value)
+    tx.append(("cell", cell, old))
+
+def _tx_snapshot_circle_texts(tx: list, sheet):
+    """Remembers ALL quadrant texts once, before the commit touches any shape."""
+    dp = _get_draw_page(sheet)
+    name_map = _name_map_from_drawpage(dp)
+    prefix = f"{MARK_DESC}_text_"
+    for nm, sh in name_map.items():
+        if not nm.startswith(prefix):
+            continue
+        try:
+            old = sh.String
+        except Exception:
+            try:
+                old = sh.Text.getString()
+            except Exception:
+                continue
+        tx.append(("shape", sh, old))
+
+def _missing_circle_texts(sheet, model) -> int:
+    """Number of quadrant text shapes of `model` that do not exist on the draw page."""
+    name_map = _name_map_from_drawpage(_get_draw_page(sheet))
+    return sum(
+        1
+        for idx_tag, vals in model
+        for q in range(1, len(vals) + 1)
+        if f"{MARK_DESC}_text_{idx_tag}_{q}" not in name_map
+    )
+
+def _tx_rollback(tx: list):
+    """Undo in reverse write order. Best effort: one failing entry must not stop the rest."""
+    for kind, obj, old in reversed(tx):
+        try:
+            if kind == "cell":
+                obj.setFormula(old)
+            else:
+                try:
+                    obj.String = old
+                except Exception:
+                    obj.Text.setString(old)
+        except Exception:
+            pass
+    del tx[:]
+
+
+def _stage_fill(sheet, L: int):
+    """
+    STAGE (read only): computes the complete result of PART 2A in memory.
+    Nothing is written here – if this fails, the sheet is untouched.
+    Returns: (plan, err_msg)
+    """
+    N = _wordcount_from_C3(sheet)       # 1..6
+    n_circles = _num_circles_for_len(L)
+    cap = 2 * n_circles                 # max letters per half-row (2 per circle)
+
+    # --- load candidates from list (once) ---
+    items = _read_candidates(sheet, L)
+    if not items:
+        return None, f"Keine gültigen Wörter gefunden für Länge {L}."
+    _apply_archive_dates(items)
+
+    # Map word -> candidate item for timestamp (first occurrence wins)
+    word_to_item = {}
+    for it in items:
+        w = it["word"]
+        if w not in word_to_item:
+            word_to_item[w] = it
+
+    # Pairing table over all candidates (kreis_pairing.py): scores a whole list against one word
+    pair_table = build_pair_table([it["word"] for it in items], L)
+    # Symmetry prefilter: which top/bottom combinations give a circle that cannot be scrambled
+    sym_mask = symmetric_pair_mask(pair_table)
+    word_pos = {}
+    for i, it in enumerate(items):
+        word_pos.setdefault(it["word"], i)
+    cutoff = datetime.now() - timedelta(days=RECENT_DAYS)
+
+    # One seeded generator for all random steps (picks + scramble) -> stored with the puzzle
+    seed = random.randrange(2**63)
+    rng = random.Random(seed)
+
+    # Helper: pick 1 excluding already used words (uses 30-day rule if possible).
+    # With a partner word the best-matching partner wins (fewest shared letters per circle).
+    def pick_one_excluding(used_words: set, partner: str = ""):
+        pool_idx = [i for i, it in enumerate(items) if it["word"] not in used_words]
+        if not pool_idx:
+            return None
+        eligible = [i for i in pool_idx if items[i]["ts"] is None or items[i]["ts"] < cutoff]
+        pool_idx = eligible or pool_idx
+        if partner:
+            pool_idx = drop_symmetric_partners(pair_table, sym_mask, partner, pool_idx, word_pos)
+            i = best_partner_index(pair_table, partner, pool_idx, rng=rng)
+        else:
+            i = rng.choice(pool_idx)
+        return items[i]["word"] if i is not None else None
+
+    # --- manual overrides from column D (truncate only), same for every draft ---
+    manual_map, rows_to_clear = _read_manual_D_overrides(sheet, cap)
+
+    def draft_once():
+        # default fill from list (N words), NO timestamp yet
+        if N == 2:
+            # one pair: draw the top word, the bottom word is its best partner from the whole list
+            chosen, errs = _pick_random_with_30day_rule(items, 1, rng=rng)
+            if errs:
+                return None, "\n".join(errs)
+            top_w = chosen[0]["word"]
+            bot_w = pick_one_excluding({top_w}, top_w)
+            if not bot_w:
+                return None, "Zu wenige gültige Wörter in der Liste (benötigt 2, verfügbar 1)."
+            words = [top_w, bot_w]
+        else:
+            chosen, errs = _pick_random_with_30day_rule(items, N, rng=rng)
+            if errs:
+                return None, "\n".join(errs)
+            # pair the drawn words jointly: (4,5), (7,8), (10,11) with as few shared letters per circle as possible
+            words = best_pair_order([it["word"] for it in chosen], cap)
 
         assignments = {}  # row1 -> word
-        for i, it in enumerate(chosen):
+        for i, w in enumerate(words):
             if i >= len(SLOT_ROWS):
                 break
-            r = SLOT_ROWS[i]
-            assignments[r] = it["word"]
+            assignments[SLOT_ROWS[i]] = w
 
-        # --- apply manual overrides from column D (truncate only) ---
-        manual_map, rows_to_clear = _read_manual_D_overrides(sheet, cap)
-        manual_count = len(manual_map)
         for r, w in manual_map.items():
             assignments[r] = w
 
-        # --- fill missing half in active row-pairs ---
         used_now = set(w for w in assignments.values() if w)
 
+        # drawn pair still forms a symmetric circle -> replace the drawn (non-manual) half
+        for top_r, bot_r in [(4, 5), (7, 8), (10, 11)]:
+            top_w = assignments.get(top_r)
+            bot_w = assignments.get(bot_r)
+            if not (top_w and bot_w) or not pair_has_symmetric_circle(top_w, bot_w, cap):
+                continue
+            if bot_r not in manual_map:
+                keep_r, swap_r = top_r, bot_r
+            elif top_r not in manual_map:
+                keep_r, swap_r = bot_r, top_r
+            else:
+                continue  # both manual: user's choice
+            w = pick_one_excluding(used_now, assignments[keep_r])
+            if w and not pair_has_symmetric_circle(assignments[keep_r], w, cap):
+                used_now.discard(assignments[swap_r])
+                assignments[swap_r] = w
+                used_now.add(w)
+
+        # fill missing half in active row-pairs
         for top_r, bot_r in [(4, 5), (7, 8), (10, 11)]:
             top_has = bool(assignments.get(top_r))
             bot_has = bool(assignments.get(bot_r))
 
             if top_has and not bot_has:
-                w = pick_one_excluding(used_now)
+                w = pick_one_excluding(used_now, assignments[top_r])
                 if w:
                     assignments[bot_r] = w
                     used_now.add(w)
             elif bot_has and not top_has:
-                w = pick_one_excluding(used_now)
+                w = pick_one_excluding(used_now, assignments[bot_r])
                 if w:
                     assignments[top_r] = w
                     used_now.add(w)
+        return assignments, None
 
-        # --- determine actually used words (for timestamps) ---
-        used_words = set(w for w in assignments.values() if w)
-        used_words_count = len(used_words)
+    # --- draft candidates; with a difficulty target keep the closest one ---
+    # manual D words count as valid solutions too
+    word_index = build_word_index(
+        list(word_to_item) + list(manual_map.values()), L, cache_name=f"wortraetsel_{L}"
+    )
+    drafts = DIFFICULTY_CANDIDATES if DIFFICULTY_TARGET is not None else 1
+
+    best = None
+    for _ in range(max(1, int(drafts))):
+        assignments, err = draft_once()
+        if err:
+            return None, err
+        model = _build_quad_model(L, assignments)
+        difficulty = score_puzzle(rows_from_model(model), word_index)
+        dist = abs(difficulty["score"] - DIFFICULTY_TARGET) if DIFFICULTY_TARGET is not None else 0.0
+        if best is None or dist < best[0]:
+            best = (dist, assignments, model, difficulty)
+
+    _dist, assignments, model, difficulty = best
+
+    # --- scramble (in memory) + unique-solution check on the scrambled rows ---
+    # with a target the rotations are chosen towards it too (kreis_difficulty adapter);
+    # the readings of the chosen draft do not depend on the rotation -> reused
+    score_fn = None
+    if DIFFICULTY_TARGET is not None:
+        score_fn = make_scramble_score_fn(rows_from_model(model), word_index, readings=difficulty["readings"])
+    scrambled, scramble_info = _plan_scramble(model, L, score_fn=score_fn, target=DIFFICULTY_TARGET, rng=rng)
+    if score_fn is not None:
+        difficulty = score_puzzle(rows_from_model(model), word_index, scramble_info["steps"],
+                                  readings=difficulty["readings"])
+    uniqueness = verify_unique(rows_from_model(scrambled), word_index)
+
+    plan = {
+        "L": L,
+        "N": N,
+        "assignments": assignments,
+        "quads": scrambled,
+        "scramble_info": scramble_info,
+        "difficulty": difficulty,
+        "uniqueness": uniqueness,
+        "rows_to_clear": rows_to_clear,
+        "manual_count": len(manual_map),
+        # determine actually used words (for timestamps)
+        "used_words": set(w for w in assignments.values() if w),
+        "word_to_item": word_to_item,
+        # serializable puzzle (kreis_puzzle): words in slot order + applied rotations
+        "puzzle": new_puzzle(
+            L, [_normalize_crossword(assignments.get(r, "")) for r in SLOT_ROWS],
+            scramble_info["steps"], seed=seed, score=difficulty["score"],
+        ),
+    }
+    return plan, None
+
+
+def _commit_fill(sheet, plan: dict, tx: list):
+    """
+    COMMIT: applies a staged plan (sheet cells + circle shapes).
+    Every write goes through the undo log `tx`; timestamps are written LAST,
+    so a failure earlier never burns words for 30 days.
+    The circle grid must already match L (ensure_circle_count_matches_G3 before the
+    transaction – deleting/redrawing shapes cannot be undone).
+    """
+    assignments = plan["assignments"]
 
-        # --- write final words to Y ---
-        for r, w in assignments.items():
-            try:
-                sheet.getCellByPosition(STORE_COL_Y0, r - 1).setString(w)
-            except Exception:
-                pass
+    _tx_snapshot_circle_texts(tx, sheet)
 
-        # --- clear used D input cells ---
-        for r in rows_to_clear:
-            try:
-                sheet.getCellByPosition(INPUT_COL_D0, r - 1).setString("")
-            except Exception:
-                pass
+    # --- clear input/output areas (C4:C12, Y4:Y12) and write final words to Y ---
+    for r in range(4, 13):
+        _tx_set_cell_string(tx, sheet.getCellByPosition(2, r - 1), "")
+        _tx_set_cell_string(tx, sheet.getCellByPosition(STORE_COL_Y0, r - 1), assignments.get(r, "") or "")
+
+    # --- clear used D input cells ---
+    for r in plan["rows_to_clear"]:
+        _tx_set_cell_string(tx, sheet.getCellByPosition(INPUT_COL_D0, r - 1), "")
+
+    # --- write scrambled letters into circles (exactly one write per quadrant) ---
+    _write_quad_model_to_circles(sheet, plan["quads"])
+
+    # --- timestamp ONLY for words that are really used AND exist in the list ---
+    _touch_timestamps_for_used_words(plan["word_to_item"], plan["used_words"], _now_str(), tx=tx)
 
-        # --- timestamp ONLY for words that are really used AND exist in the list ---
-        _touch_timestamps_for_used_words(word_to_item, used_words, now)
 
-        # --- write letters into circles + scramble ---
-        _write_words_to_circles(sheet, L, assignments)
-        scramble_circles_after_fill(sheet, L)
+# ---------- MAIN MACRO ----------
+def part2a_fill_random_from_wordlist(*args):
 
+    """
+    PART 2A + D override (no D length validation), staged:
+    1) Clamp G3 to 5..12 (write back) and update left labels.
+    STAGE (in memory, nothing written):
+    2) Pick N words (C3) from wordlist (30-day rule).
+    3) Apply manual D overrides (truncate only).
+    4) If one half of a row-pair is filled, fill the other half from list (if possible).
+    5) Build the quadrant model, plan the scramble and check the solution is unique.
+    PREPARE (not undoable, checked before the commit):
+    6) Ensure circle count matches G3 and every needed quadrant text exists.
+    COMMIT (undo log, rollback on error):
+    6b) Write final words to Y, clear used D cells.
+    7) Write the scrambled letters into the circles (model from STAGE, one write).
+    8) Timestamp ONLY for words actually used (last step).
+    9) Write duration to F2 (10pt).
+    """
+    doc = _get_doc()
+    sheet = _get_sheet(doc)
+
+    t0 = time.perf_counter()
+
+    ok = False
+    err_msg = None
+
+    # Keep these for finally (avoid NameError)
+    L = None
+    N = None
+    used_words_count = 0
+    manual_count = 0
+    scramble_msg = None
+
+    doc.lockControllers()
+    try:
+        # --- normalize inputs early (single source of truth: L) ---
+        L = _clamp_wordlen_to_5_12(sheet, writeback=True)
+        ensure_cell_styles(doc)
+        _update_left_labels(sheet, L)
+
+        # --- STAGE ---
+        plan, err_msg = _stage_fill(sheet, L)
+        if plan is None:
+            return False
+
+        N = plan["N"]
+        manual_count = plan["manual_count"]
+        used_words_count = len(plan["used_words"])
+
+        # --- PREPARE: circle grid must match L before the transaction (redraw is not undoable) ---
+        ensure_circle_count_matches_G3(sheet)
+        missing = _missing_circle_texts(sheet, plan["quads"])
+        if missing:
+            err_msg = f"{missing} Kreis-Textfelder fehlen – bitte Kreise neu zeichnen (draw_circles_from_G3)."
+            return False
+
+        # --- COMMIT ---
+        tx = []
+        try:
+            _commit_fill(sheet, plan, tx)
+        except Exception as e:
+            _tx_rollback(tx)
+            err_msg = f"Fehler beim Übernehmen – alle Änderungen zurückgenommen.\n{e}"
+            return False
+        _store_puzzle(doc, plan["puzzle"])
+        _archive_puzzle(plan["puzzle"])
+
+        scramble_msg = "\n".join(
+            m for m in (_scramble_warning(plan["scramble_info"]), _uniqueness_warning(plan["uniqueness"])) if m
+        ) or None
         ok = True
         return True
 
@@ -890,6 +1071,11 @@ def part2a_fill_random_from_wordlist(*args):
                 _msgbox(doc, "Wortliste", err_msg)
             except Exception:
                 pass
+        if ok and scramble_msg:
+            try:
+                _msgbox(doc, "Scramble Hinweis", scramble_msg)
+            except Exception:
+                pass
 
 # ============================================================
 # 4) INIT: set row heights BEFORE drawing
@@ -904,19 +1090,8 @@ def set_left_labels_from_G3(*args):
         return False
 
     x = _read_int(sheet, CELL_WORDLEN, DEFAULT_WORDLEN)
-    txt = f"Begriffe\nmit {x} Buchstaben"
-
-    for (r1, r2) in LABEL_BLOCKS:
-        rng = sheet.getCellRangeByPosition(1, r1-1, 1, r2-1)  # column B
-        try:
-            rng.merge(True)
-        except Exception:
-            pass
-        sheet.getCellByPosition(1, r1 - 1).setString(txt)  # Spalte B, Startzeile
-
-        _set_center(rng)
-        _set_bold(rng, pt=14)
-
+    ensure_cell_styles(doc)
+    _update_left_labels(sheet, x)
     return True
 
 def _apply_sheet_protection(sheet):
@@ -945,7 +1120,7 @@ def _apply_sheet_protection(sheet):
         pass
 
 
-def ensure_initialized(*args):
+def ensure_initialized(*args, force=True):
     """
     Final init (test phase, protection disabled):
     - Rows 1..3: 0.9 cm
@@ -963,6 +1138,8 @@ def ensure_initialized(*args):
     - AA3 input formatting: centered, 20 pt, bold
     - Left labels in B4/5, B7/8, B10/11: "Begriffe\nmit X Buchstaben" (X from G3)
     - Freeze panes after row 3
+    Inputs (defaults, clamping, AA3) are checked on every call; the formatting itself
+    only runs once per document and LAYOUT_VERSION unless force=True (the Init button).
     """
     doc = _get_doc()
     try:
@@ -971,6 +1148,62 @@ def ensure_initialized(*args):
         _msgbox(doc, "Init", f"Sheet '{SHEET_NAME}' not found.")
         return False
 
+    # --- Defaults (C3 = wordcount, G3 = wordlen) ---
+    wc = _cell(sheet, "C3")
+    if not wc.getValue():
+        wc.setValue(DEFAULT_WORDCOUNT)
+
+    wl = _cell(sheet, "G3")
+    if not wl.getValue():
+        wl.setValue(DEFAULT_WORDLEN)
+
+    # --- Clamp inputs to valid ranges ---
+    # C3: 1..6
+    n = int(round(wc.getValue() or 0))
+    if n < 1: n = 1
+    if n > 6: n = 6
+    wc.setValue(n)
+
+    # G3: 5..12
+    x = int(round(wl.getValue() or 0))
+    if x < 5: x = 5
+    if x > 12: x = 12
+    wl.setValue(x)
+
+    # --- If AA3 is empty: copy content from G3 into AA3 (value only, keep AA3 formatting) ---
+    try:
+        aa3_cell = _cell(sheet, "AA3")
+        aa3_txt  = (aa3_cell.getString() or "").strip()
+
+        # "empty" means: no text and no numeric value
+        if not aa3_txt and (aa3_cell.getValue() == 0):
+            g3_cell = _cell(sheet, "G3")
+
+            # prefer numeric value from G3
+            gv = g3_cell.getValue()
+            if gv and gv != 0:
+                aa3_cell.setString(str(int(round(gv))))
+            else:
+                aa3_cell.setString((g3_cell.getString() or "").strip())
+    except Exception:
+        pass
+
+    ensure_layout(doc, LAYOUT_FLAG, LAYOUT_VERSION, lambda d: _init_sheet_layout(d, sheet), force=force)
+
+    # TESTPHASE: protection disabled
+    # try:
+    #     _apply_sheet_protection(sheet)
+    # except Exception:
+    #     pass
+
+    _debug_a1(sheet, "Init OK: rows set, B/D/F=5.1cm, labels written, inputs C3(1-6)/G3(5-12).")
+    return True
+
+
+def _init_sheet_layout(doc, sheet):
+    """Static formatting of the sheet (labels, widths, heights, word list blocks)."""
+    ensure_cell_styles(doc)
+
     # --- Keep B2 and C2 empty ---
     _cell(sheet, "B2").setString("")
     _cell(sheet, "C2").setString("")
@@ -979,21 +1212,21 @@ def ensure_initialized(*args):
     b3 = _cell(sheet, "B3")
     b3.setString("Anzahl Wörter (1-6):")
     b3.CharHeight = 14
-    b3.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
+    b3.CharWeight = bold()
 
     f3 = _cell(sheet, "F3")
     f3.setString("Anzahl der gewünschten\nBuchstaben pro Wort (5-12):")
     f3.CharHeight = 10.5
-    f3.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
+    f3.CharWeight = bold()
 
     # Z3 label: bold 10.5 pt, left aligned
     z3 = _cell(sheet, "Z3")
     z3.setString("Anzahl\nBuchstaben:")
     z3.CharHeight = 10.5
-    z3.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
+    z3.CharWeight = bold()
     try:
-        z3.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "LEFT")
-        z3.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+        z3.HoriJustify = hori("LEFT")
+        z3.VertJustify = vert("CENTER")
     except Exception:
         pass
 
@@ -1003,9 +1236,9 @@ def ensure_initialized(*args):
         rng.merge(True)
         _cell(sheet, "AA2").setString("Eingabe von gültigen Wörter,\ndie aufgenommen werden sollen")
         rng.CharHeight = 12
-        rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-        rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "LEFT")
-        rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+        rng.CharWeight = bold()
+        rng.HoriJustify = hori("LEFT")
+        rng.VertJustify = vert("CENTER")
     except Exception:
         pass
 
@@ -1013,9 +1246,9 @@ def ensure_initialized(*args):
     aa3 = _cell(sheet, "AA3")
     try:
         aa3.CharHeight = 20
-        aa3.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-        aa3.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-        aa3.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+        aa3.CharWeight = bold()
+        aa3.HoriJustify = hori("CENTER")
+        aa3.VertJustify = vert("CENTER")
     except Exception:
         pass
 
@@ -1025,76 +1258,35 @@ def ensure_initialized(*args):
     except Exception:
         pass
 
-    # --- Defaults (C3 = wordcount, G3 = wordlen) ---
-    wc = _cell(sheet, "C3")
-    if not wc.getValue():
-        wc.setValue(DEFAULT_WORDCOUNT)
-
-    wl = _cell(sheet, "G3")
-    if not wl.getValue():
-        wl.setValue(DEFAULT_WORDLEN)
-
-    # --- Clamp inputs to valid ranges ---
-    # C3: 1..6
-    n = int(round(wc.getValue() or 0))
-    if n < 1: n = 1
-    if n > 6: n = 6
-    wc.setValue(n)
-
-    # G3: 5..12
-    x = int(round(wl.getValue() or 0))
-    if x < 5: x = 5
-    if x > 12: x = 12
-    wl.setValue(x)
-
-    # --- If AA3 is empty: copy content from G3 into AA3 (value only, keep AA3 formatting) ---
-    try:
-        aa3_cell = _cell(sheet, "AA3")
-        aa3_txt  = (aa3_cell.getString() or "").strip()
-
-        # "empty" means: no text and no numeric value
-        if not aa3_txt and (aa3_cell.getValue() == 0):
-            g3_cell = _cell(sheet, "G3")
-
-            # prefer numeric value from G3
-            gv = g3_cell.getValue()
-            if gv and gv != 0:
-                aa3_cell.setString(str(int(round(gv))))
-            else:
-                aa3_cell.setString((g3_cell.getString() or "").strip())
-    except Exception:
-        pass
-
     # Optional: center input cells
     try:
-        _set_center(sheet.getCellRangeByName("C3"))
-        _set_center(sheet.getCellRangeByName("G3"))
+        apply_style(sheet.getCellRangeByName("C3"), STYLE_CENTER)
+        apply_style(sheet.getCellRangeByName("G3"), STYLE_CENTER)
     except Exception:
         pass
 
-    # --- Row heights ---
+    # --- Row heights (range-wise, kreis_layout) ---
     header_h = cm(0.90)  # keep as requested
-    for r in HEADER_ROWS_1BASED:
-        _set_row_height(sheet, r, header_h)
-
     grid_h = cm(ROW_H_CM)  # 1.11 cm
-    for r in GRID_ROWS_1BASED:  # must include 12
-        _set_row_height(sheet, r, grid_h)
+    heights = {r: header_h for r in HEADER_ROWS_1BASED}
+    heights.update({r: grid_h for r in GRID_ROWS_1BASED})  # must include 12
+    apply_row_heights(sheet, heights)
 
-    # --- Column widths requested: B, D, F = 5.1 cm ---
-    _set_col_width(sheet, 1, cm(5.1))  # B
-    _set_col_width(sheet, 3, cm(5.1))  # D
-    _set_col_width(sheet, 5, cm(5.1))  # F
-
-    # --- Column widths: A, C, E, G, Z = 2.5 cm ---
+    # --- Column widths: B, D, F = 5.1 cm; A = 1.4; C = 3.6; E, G, Z = 2.5 cm ---
     w14 = cm(1.4)
     w25 = cm(2.5)
     w36 = cm(3.6)
-    _set_col_width(sheet, 0,  w14)  # A
-    _set_col_width(sheet, 2,  w36)  # C
-    _set_col_width(sheet, 4,  w25)  # E
-    _set_col_width(sheet, 6,  w25)  # G
-    _set_col_width(sheet, 25, w25)  # Z
+    w51 = cm(5.1)
+    apply_col_widths(sheet, {
+        0: w14,   # A
+        1: w51,   # B
+        2: w36,   # C
+        3: w51,   # D
+        4: w25,   # E
+        5: w51,   # F
+        6: w25,   # G
+        25: w25,  # Z
+    })
 
     # IMPORTANT:
     # Do NOT set circle-column widths from E onwards here,
@@ -1102,16 +1294,7 @@ def ensure_initialized(*args):
     # Circles use a fixed step_x in draw_circles_from_G3().
 
     # --- Left labels "Begriffe mit X Buchstaben" in column B blocks ---
-    txt = f"Begriffe\nmit {x} Buchstaben"
-    for (r1, r2) in LABEL_BLOCKS:
-        rng = sheet.getCellRangeByPosition(1, r1 - 1, 1, r2 - 1)  # B(r1):B(r2)
-        try:
-            rng.merge(True)
-        except Exception:
-            pass
-        sheet.getCellByPosition(1, r1 - 1).setString(txt)
-        _set_center(rng)
-        _set_bold(rng, pt=14)
+    _update_left_labels(sheet, _clamp_wordlen_to_5_12(sheet, writeback=False))
 
     # Freeze after row 3
     try:
@@ -1126,107 +1309,18 @@ def ensure_initialized(*args):
         pass
 
 
-    # TESTPHASE: protection disabled
-    # try:
-    #     _apply_sheet_protection(sheet)
-    # except Exception:
-    #     pass
-
-    _debug_a1(sheet, "Init OK: rows set, B/D/F=5.1cm, labels written, inputs C3(1-6)/G3(5-12).")
-    return True
-
-
 # ============================================================
 # 5) DRAWING PRIMITIVES (shapes)
 # ============================================================
 
-def _mark_shape(shape, name_suffix):
-    try:
-        shape.Name = f"{MARK_DESC}_{name_suffix}"
-    except Exception:
-        pass
-    try:
-        shape.Description = MARK_DESC
-    except Exception:
-        pass
-
-def _draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
-    line = doc.createInstance("com.sun.star.drawing.LineShape")
-    _mark_shape(line, name_suffix)
-    draw_page.add(line)
-    line.Position = Point(int(x1), int(y1))
-    line.Size = Size(int(x2 - x1), int(y2 - y1))
-    try:
-        line.LineColor = 0x000000
-    except Exception:
-        pass
-    return line
-
-def _draw_text_center(doc, draw_page, cx, cy, text, name_suffix):
-    t = doc.createInstance("com.sun.star.drawing.TextShape")
-    _mark_shape(t, name_suffix)
-    draw_page.add(t)
-
-    # small fixed text box
-    w = cm(0.60)
-    h = cm(0.60)
-    t.Size = Size(int(w), int(h))
-    t.Position = Point(int(cx - w/2), int(cy - h/2))
-
-    try:
-        t.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "NONE")
-        t.LineStyle = uno.Enum("com.sun.star.drawing.LineStyle", "NONE")
-    except Exception:
-        pass
-
-    try:
-        t.String = text
-    except Exception:
-        try:
-            t.Text.setString(text)
-        except Exception:
-            pass
-
-    try:
-        t.CharHeight = 16
-        t.TextHorizontalAdjust = 1  # CENTER
-        t.TextVerticalAdjust   = 1  # CENTER
-    except Exception:
-        pass
-
-    return t
+# Template for circle + cross + 4 texts (kreis_shapes): properties prepared ONCE,
+# one setPropertyValues per shape instead of single assignments
+_CIRCLE_TEMPLATE = CircleTemplate(MARK_DESC, char_height=16, bold=False, text_box=cm(0.60),
+                                  solid_fill=True)
 
 def _draw_circle_with_quadrants(doc, draw_page, x, y, size, fill_color, idx_tag):
-    circle = doc.createInstance("com.sun.star.drawing.EllipseShape")
-    _mark_shape(circle, f"circle_{idx_tag}")
-    draw_page.add(circle)
-
-    circle.Position = Point(int(x), int(y))
-    circle.Size = Size(int(size), int(size))
-    try:
-        circle.FillColor = fill_color
-        circle.LineColor = 0x000000
-        circle.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "SOLID")
-    except Exception:
-        pass
-
-    # Cross lines
-    cx = x + size // 2
-    cy = y + size // 2
-    _draw_line(doc, draw_page, cx, y,  cx, y + size, f"vline_{idx_tag}")
-    _draw_line(doc, draw_page, x,  cy, x + size, cy, f"hline_{idx_tag}")
-
-    # Quadrant centers
-    q1x = x + size // 4
-    q3x = x + (3 * size) // 4
-    q1y = y + size // 4
-    q3y = y + (3 * size) // 4
-
-    centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]
-
-    # Create 4 empty text shapes (later you will fill them)
-    for i, (tcx, tcy) in enumerate(centers, start=1):
-        _draw_text_center(doc, draw_page, tcx, tcy, " ", f"text_{idx_tag}_{i}")
+    # 4 empty text shapes (filled later)
+    return _CIRCLE_TEMPLATE.draw(doc, draw_page, x, y, size, fill_color, [" "] * 4, idx_tag)
 
 
 # ============================================================
@@ -1277,11 +1371,7 @@ def _name_map_from_drawpage(dp):
 def clear_contents_keep_format(sheet, a1_range: str):
     """Clear values/strings/formulas only (keep formatting/styles)."""
     rng = sheet.getCellRangeByName(a1_range)
-    flags = (
-        uno.getConstantByName("com.sun.star.sheet.CellFlags.VALUE")   |
-        uno.getConstantByName("com.sun.star.sheet.CellFlags.STRING")  |
-        uno.getConstantByName("com.sun.star.sheet.CellFlags.FORMULA")
-    )
+    flags = cell_flags("VALUE", "STRING", "FORMULA")
     rng.clearContents(flags)
 
 def clear_all_circle_quadrant_texts(sheet):
@@ -1509,8 +1599,8 @@ def draw_circles_from_G3(*args):
     t0 = time.perf_counter()
 
     
-    # Init is mandatory
-    if not ensure_initialized():
+    # Init is mandatory (formatting only on first use / new LAYOUT_VERSION)
+    if not ensure_initialized(force=False):
         return False
 
     word_len = _clamp_wordlen_to_5_12(sheet, writeback=True)
@@ -1547,16 +1637,7 @@ def draw_circles_from_G3(*args):
 
     # Update left labels too (in case G3 changed)
     try:
-        txt = f"Begriffe\nmit {word_len} Buchstaben"
-        for (r1, r2) in LABEL_BLOCKS:
-            rng = sheet.getCellRangeByPosition(1, r1 - 1, 1, r2 - 1)
-            try:
-                rng.merge(True)
-            except Exception:
-                pass
-            sheet.getCellByPosition(1, r1 - 1).setString(txt)
-            _set_center(rng)
-            _set_bold(rng, pt=14)
+        _update_left_labels(sheet, word_len)
     except Exception:
         pass
         
@@ -1575,6 +1656,237 @@ def draw_circles_from_G3(*args):
     return True
 
 
+# ============================================================
+# 8B) WORDLIST ANALYTICS (one bulk read of AG..CD blocks)
+# ============================================================
+
+def wordlist_analytics_report(*args):
+    """
+    Per length 5..12: list size, used in last RECENT_DAYS, never used, fresh words and
+    how many days the fresh pool lasts at the current usage rate, letter/pair frequency.
+    Reads the whole list area with ONE getDataArray (no per-cell loop).
+    """
+    doc = _get_doc()
+    sheet = _get_sheet(doc)
+
+    layout = {
+        L: (word_col0(SCHEMA, L), field_col0(SCHEMA, L, F_USED))
+        for L in range(WORDLIST_LEN_MIN, WORDLIST_LEN_MAX + 1)
+    }
+    c0, c1 = layout_col_span(layout)
+    r0 = WORDLIST_START_ROW_1BASED - 1
+    r1 = r0 + SCHEMA["max_rows"] - 1
+
+    try:
+        rows = sheet.getCellRangeByPosition(c0, r0, c1, r1).getDataArray()
+    except Exception as e:
+        _msgbox(doc, "Wortlisten-Analyse", f"Liste konnte nicht gelesen werden:\n{e}")
+        return False
+
+    stats = analyze_rows(rows, layout, col0_offset=c0, recent_days=RECENT_DAYS)
+    _msgbox(doc, "Wortlisten-Analyse", format_report(stats))
+    return True
+
+
+# ============================================================
+# 8C) PUZZLE SAVE / LOAD / ARCHIVE (kreis_puzzle, kreis_archive; no sheet re-read)
+# ============================================================
+
+def _store_puzzle(doc, puzzle):
+    """Keeps the puzzle with the document (user property, compact JSON)."""
+    set_user_prop(doc, PUZZLE_PROP, to_json(puzzle))
+
+
+def _stored_puzzle(doc):
+    raw = get_user_prop(doc, PUZZLE_PROP, "")
+    if not raw:
+        return None
+    try:
+        return from_json(raw)
+    except ValueError:
+        return None
+
+
+def _apply_puzzle(doc, sheet, puzzle):
+    """
+    Puzzle -> sheet: G3 = L, circle grid for L, words in Y4:Y12, scrambled letters in the circles.
+    No word list read, no timestamps touched.
+    """
+    L = puzzle["L"]
+    doc.lockControllers()
+    try:
+        _cell(sheet, CELL_WORDLEN).setValue(float(L))
+        ensure_cell_styles(doc)
+        _update_left_labels(sheet, L)
+        ensure_circle_count_matches_G3(sheet)  # may redraw (clears Y4:Y12) -> write Y afterwards
+
+        words = dict(zip(SLOT_ROWS, puzzle["words"]))
+        for r in range(4, 13):
+            sheet.getCellByPosition(STORE_COL_Y0, r - 1).setString(words.get(r, ""))
+
+        _write_quad_model_to_circles(sheet, scrambled_model(puzzle))
+    finally:
+        try:
+            doc.unlockControllers()
+        except Exception:
+            pass
+
+
+def _pick_puzzle_file():
+    """FilePicker -> system path or None."""
+    try:
+        ctx = XSCRIPTCONTEXT.getComponentContext()
+        fp = ctx.ServiceManager.createInstanceWithContext("com.sun.star.ui.dialogs.FilePicker", ctx)
+        try:
+            fp.appendFilter("Kreis-Rätsel", f"*{PUZZLE_FILE_EXT};*.json")
+            fp.appendFilter("Alle Dateien", "*.*")
+        except Exception:
+            pass
+        if fp.execute() != 1:  # 1 = OK
+            return None
+        files = fp.getSelectedFiles() or fp.getFiles()
+        if not files:
+            return None
+        return uno.fileUrlToSystemPath(files[0])
+    except Exception:
+        return None
+
+
+def save_puzzle_file(*args):
+    """
+    Writes the last generated puzzle (binary, kreis_puzzle) next to the document:
+    <document>_raetsel_<created>.krz
+    """
+    doc = _get_doc()
+    puzzle = _stored_puzzle(doc)
+    if puzzle is None:
+        _msgbox(doc, "Rätsel speichern", "Noch kein Rätsel erzeugt (PART 2A).")
+        return False
+    try:
+        base = uno.fileUrlToSystemPath(doc.getURL())
+    except Exception:
+        base = ""
+    if not base:
+        _msgbox(doc, "Rätsel speichern", "Dokument bitte zuerst speichern (Datei landet daneben).")
+        return False
+
+    stamp = puzzle["created"].replace("-", "").replace(":", "").replace(" ", "_")
+    path = f"{base.rsplit('.', 1)[0]}_raetsel_{stamp}{PUZZLE_FILE_EXT}"
+    try:
+        with open(path, "wb") as f:
+            f.write(to_bytes(puzzle))
+    except Exception as e:
+        _msgbox(doc, "Rätsel speichern", f"Speichern fehlgeschlagen:\n{e}")
+        return False
+
+    _debug_a1(_get_sheet(doc), f"Rätsel gespeichert: {path}")
+    return True
+
+
+def load_puzzle_file(*args):
+    """Loads a saved puzzle (.krz or JSON) and shows it exactly as generated (same rotations)."""
+    doc = _get_doc()
+    sheet = _get_sheet(doc)
+    path = _pick_puzzle_file()
+    if not path:
+        return False
+    try:
+        with open(path, "rb") as f:
+            puzzle = load_any(f.read())
+    except (OSError, ValueError) as e:
+        _msgbox(doc, "Rätsel laden", f"Datei kann nicht gelesen werden:\n{e}")
+        return False
+
+    _apply_puzzle(doc, sheet, puzzle)
+    _store_puzzle(doc, puzzle)
+    _debug_a1(sheet, f"Rätsel geladen: L={puzzle['L']}, erstellt {puzzle['created']}")
+    return True
+
+
+def rescramble_puzzle(*args):
+    """
+    New rotations for the stored puzzle (same words): planned on the stored solution,
+    no sheet/word-list read and no new random picks.
+    """
+    doc = _get_doc()
+    sheet = _get_sheet(doc)
+    puzzle = _stored_puzzle(doc)
+    if puzzle is None:
+        _msgbox(doc, "Neu mischen", "Noch kein Rätsel erzeugt (PART 2A).")
+        return False
+
+    seed = random.randrange(2**63)
+    _scrambled, info = _plan_scramble(solution_model(puzzle), puzzle["L"], rng=random.Random(seed))
+    puzzle = with_steps(puzzle, info["steps"], seed=seed)
+
+    _apply_puzzle(doc, sheet, puzzle)
+    _store_puzzle(doc, puzzle)
+
+    msg = _scramble_warning(info)
+    if msg:
+        _msgbox(doc, "Scramble Hinweis", msg)
+    return True
+
+
+def print_stored_puzzle(*args):
+    """
+    Renders the stored puzzle (kreis_render, no shapes) next to the document:
+    <document>_raetsel_<created>.pdf – page 1 scrambled, page 2 solution.
+    Other saved puzzles: python kreis_render.py raetsel.krz --solution
+    """
+    doc = _get_doc()
+    puzzle = _stored_puzzle(doc)
+    if puzzle is None:
+        _msgbox(doc, "Rätsel drucken", "Noch kein Rätsel erzeugt (PART 2A).")
+        return False
+    try:
+        base = uno.fileUrlToSystemPath(doc.getURL())
+    except Exception:
+        base = ""
+    if not base:
+        _msgbox(doc, "Rätsel drucken", "Dokument bitte zuerst speichern (Datei landet daneben).")
+        return False
+
+    stamp = puzzle["created"].replace("-", "").replace(":", "").replace(" ", "_")
+    path = f"{base.rsplit('.', 1)[0]}_raetsel_{stamp}.pdf"
+    try:
+        write_pdf(path, with_answer_keys([puzzle]))
+    except Exception as e:
+        _msgbox(doc, "Rätsel drucken", f"Export fehlgeschlagen:\n{e}")
+        return False
+
+    _debug_a1(_get_sheet(doc), f"Rätsel gedruckt: {path}")
+    return True
+
+
+def archive_lookup_selection(*args):
+    """Selected cell(s): when was each word last used (puzzle archive, all documents)?"""
+    doc = _get_doc()
+    try:
+        data = doc.CurrentSelection.getDataArray()
+        words = [str(v).strip() for row in data for v in row if str(v).strip()]
+    except Exception:
+        words = []
+    if not words:
+        _msgbox(doc, "Archiv", "Bitte Zelle(n) mit Wörtern markieren.")
+        return False
+
+    arc = _open_archive()
+    if arc is None:
+        _msgbox(doc, "Archiv", "Archiv kann nicht geöffnet werden.")
+        return False
+
+    lines = []
+    for w in words[:25]:
+        uses = arc.history(w)
+        if uses:
+            lines.append(f"{word_key(w)}: zuletzt {uses[-1][0]} ({len(uses)}x)")
+        else:
+            lines.append(f"{word_key(w)}: nie")
+    _msgbox(doc, "Archiv", "\n".join(lines))
+    return True
+
+
 # ============================================================
 # 9) EXPORTED MACROS
 # ============================================================
@@ -1586,4 +1898,10 @@ g_exportedScripts = (
     delete_all_circles,
     delete_circles_with_content_only,
     part2a_fill_random_from_wordlist,
+    wordlist_analytics_report,
+    save_puzzle_file,
+    load_puzzle_file,
+    rescramble_puzzle,
+    print_stored_puzzle,
+    archive_lookup_selection,
 )
@@ -11,25 +11,56 @@ Purpose:
 - Umlaut conversion for crossword logic (ÄÖÜß -> ae/oe/ue/ss)
 - Length validation and result listing
 - Store words (converted/upper) into length-specific lists + timestamp next to it
-- One-time formatting + headers for all word blocks (5..12 + secondary 8 list)
+- One-time formatting + headers for all word blocks (5..12; BI is only an alias of the 8 list in AG)
 """
 
 import uno
 from datetime import datetime
 from com.sun.star.uno import Exception as UnoException
 
+# Shared helper (Scripts/python/pythonpath/kreis_spellpool.py)
+from kreis_spellpool import check_words
+# Shared helper (Scripts/python/pythonpath/kreis_schema.py)
+from kreis_schema import get_schema, word_col0, col_letters, alias_col0s, migrate_alias_block, cell_text
+# Shared helper (Scripts/python/pythonpath/kreis_extent.py)
+from kreis_extent import ColumnExtents
+# Shared helper (Scripts/python/pythonpath/kreis_layout.py)
+from kreis_layout import apply_col_widths
+# Shared helper (Scripts/python/pythonpath/kreis_styles.py)
+from kreis_styles import (
+    ensure_cell_styles, apply_style,
+    STYLE_WORDLIST, STYLE_WORDLIST_META, STYLE_COUNTER, STYLE_LIST_HEADER,
+)
+# Shared helper (Scripts/python/pythonpath/kreis_headers.py)
+from kreis_headers import HeaderWriter
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import hori, vert
+# Shared helper (Scripts/python/pythonpath/kreis_docprops.py)
+from kreis_docprops import ensure_layout, get_user_prop, set_user_prop
+
 # ============================================================
 # CONFIG
 # ============================================================
 
 DEBUG = True
 INIT_RUNNING = False
-INITIALIZED = False
 
 SHEET_NAME = "KREIS_WORTSPIEL"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout (kreis_schema.py)
+
+# Sheet formatting runs once per document and layout version (document user property)
+LAYOUT_FLAG = "KREIS_WORTSPIEL_PRUEFER_LAYOUT"
+LAYOUT_VERSION = 3  # raise when _init_sheet_layout changes (2: named cell styles, 3: BI -> AG migration)
+
+# Old documents kept a second 8-letter list in BI; it is migrated into AG by the layout
+# migration to version 3. The flag is "1" when done, LEN8_ALIAS_PENDING while words are
+# left in BI because AG was full (then only the data step is retried on each check).
+LEN8_ALIAS_FLAG = "KREIS_WORTSPIEL_LEN8_ALIAS_MIGRATED"
+LEN8_ALIAS_PENDING = "pending"
 
 CELL_HEADER_AA3 = "AA3"
 CELL_LENGTH_AB3 = "AB3"
+COUNT_ROW = SCHEMA["count_row"]  # "Anzahl Wörter" je Liste (Zeile 2)
 HEADER_ROW = 3
 HEADER_START_COL = "AA"
 HEADER_EMPTY_STREAK_STOP = 22
@@ -48,6 +79,13 @@ MAX_LEN = 12
 
 GERMAN_LOCALE = "de-DE"
 
+# Parallel spellcheck (kreis_spellpool): "off" = one by one (default, safe),
+# "process" = offline word list SPELL_OFFLINE_DICT,
+# "thread" = one LO SpellChecker per worker thread (opt-in; UNO calls from Python threads)
+SPELL_MODE = "off"
+SPELL_WORKERS = 4
+SPELL_OFFLINE_DICT = ""
+
 UMLAUT_MAP = {
     "Ä": "ae", "Ö": "oe", "Ü": "ue", "ß": "ss",
     "ä": "ae", "ö": "oe", "ü": "ue",
@@ -58,8 +96,7 @@ BASE_COL_LEN8 = "AG"     # 8er-Liste fix
 BLOCK_WIDTH = 7          # Raster-Blockbreite (dein Layout)
 WORD_COL_WIDTH_CM = 5.0  # Wortspalte Breite
 META_COL_WIDTH_CM = 5.0  # 4 Nachbarspalten Breite
-WORD_PT = 16.0           # Wortspalte Schriftgröße
-META_PT = 12.0           # Nachbarspalten Schriftgröße
+# Schrift/Ausrichtung der Listen: Zellvorlagen "Kreis-Wortliste" (16 pt) / "Kreis-Wortliste-Info" (12 pt)
 AB_INPUT_PT = 14.0       # AB Eingabe
 
 # ============================================================
@@ -189,65 +226,32 @@ def commit_edit_by_parking_left_of_last_word(doc, sheet, words_col="AB", start_r
 # ============================================================
 
 def count_non_empty_in_col(sheet, col_letter: str, start_row: int = START_ROW) -> int:
-    """Count non-empty cells in a column from start_row down to last used row of that column."""
-    last = get_last_row_with_content(sheet, col_letter, start_row)
-    if last < start_row:
-        return 0
-
-    n = 0
-    for r in range(start_row, last + 1):
-        if get_cell(sheet, f"{col_letter}{r}").String.strip():
-            n += 1
-    return n
+    """Count non-empty cells in a column from start_row (occupied ranges of the extents query)."""
+    return column_extents(sheet).count(col_to_index(col_letter) - 1, start_row)
 
 
-def write_count_header(cell, label: str, n: int) -> None:
+def update_word_counts_row2(doc, sheet, target_len: int, known_counts: dict = None) -> None:
     """
-    Writes:
-      <label>
-      <n>
-    and makes <n> bold.
+    Row 2: "Anzahl Eingaben" (AB) and "Anzahl Wörter" per list.
+    known_counts {L: n} come from the list index of this run (e.g. after compacting);
+    all other counts from the occupied ranges of ONE queryContentCells call (no column scans).
+    Only headers whose count changed are rewritten (kreis_headers).
     """
-    text = cell.Text
-    text.setString("")
-
-    line1 = f"{label}\n"
-    num_str = str(n)
-
-    cursor = text.createTextCursor()
-    text.insertString(cursor, line1, False)
-
-    start = cursor.getStart()
-    text.insertString(cursor, num_str, False)
-    end = cursor.getEnd()
+    known_counts = known_counts or {}
+    ext = column_extents(sheet)
+    inputs0 = col_to_index(WORDS_COL) - 1
+    list_cols = {n: col_to_index(get_list_start_col_for_length(n)) - 1 for n in range(MIN_LEN, MAX_LEN + 1)}
+    ext.prefetch([inputs0] + [c0 for n, c0 in list_cols.items() if n not in known_counts])
 
-    num_cursor = text.createTextCursorByRange(start)
-    num_cursor.gotoRange(end, True)
-    num_cursor.CharWeight = 150.0  # bold
-
-def update_word_counts_row2(sheet, target_len: int) -> None:
     # (Optional) AB2 Eingaben – wenn du das behalten willst:
-    n_inputs = count_non_empty_in_col(sheet, WORDS_COL, START_ROW)
-    write_count_header(get_cell(sheet, "AB2"), "Anzahl Eingaben:", n_inputs)
-
-    # Hauptblöcke (Startspalten) für Längen 5..12
-    for length in range(MIN_LEN, MAX_LEN + 1):
-        list_col = get_list_start_col_for_length(length)
-        n_words = count_non_empty_in_col(sheet, list_col, START_ROW)
-
-        if n_words > 0:
-            write_count_header(get_cell(sheet, f"{list_col}2"), "Anzahl Wörter:", n_words)
-        else:
-            get_cell(sheet, f"{list_col}2").String = ""   # leer lassen statt 0
-
-    # Sekundärer 8er-Block (BI)
-    sec8 = get_secondary_list_col_for_len8()
-    n_words2 = count_non_empty_in_col(sheet, sec8, START_ROW)
+    items = {inputs0: ("Anzahl Eingaben:\n", ext.count(inputs0, START_ROW))}
+    for length, c0 in list_cols.items():
+        n_words = known_counts.get(length)
+        if n_words is None:
+            n_words = ext.count(c0, START_ROW)
+        items[c0] = ("Anzahl Wörter:\n", n_words) if n_words > 0 else None  # leer lassen statt 0
 
-    if n_words2 > 0:
-        write_count_header(get_cell(sheet, f"{sec8}2"), "Anzahl Wörter:", n_words2)
-    else:
-        get_cell(sheet, f"{sec8}2").String = ""
+    count_headers().update_row(sheet, COUNT_ROW, items, doc=doc)
 
 
 # ============================================================
@@ -256,41 +260,38 @@ def update_word_counts_row2(sheet, target_len: int) -> None:
 def set_headers(sheet) -> None:
     label = "Anzahl Buchstaben \n pro Wort"
 
+    ext = column_extents(sheet)
+
     # ------------------------------------------------------------
     # 1) Letzte relevante Header-Spalte finden:
-    #    Wir laufen in HEADER_ROW ab HEADER_START_COL nach rechts.
-    #    Sobald HEADER_EMPTY_STREAK_STOP Header-Zellen hintereinander leer sind,
-    #    brechen wir ab. Die letzte nicht-leere Headerzelle ist unser Ende.
+    #    HEADER_ROW ab HEADER_START_COL mit EINEM getDataArray lesen (bis Ende Used Area).
+    #    Regel wie bisher: nach HEADER_EMPTY_STREAK_STOP leeren Headerzellen in Folge ist Schluss,
+    #    die letzte nicht-leere Headerzelle davor ist unser Ende.
     # ------------------------------------------------------------
-    empty_streak = 0
-    col_idx0 = col_to_index(HEADER_START_COL) - 1          # 0-basiert
-    last_filled_col_idx0 = col_idx0 - 1                    # falls AA3 direkt leer wäre
-
-    while True:
-        col_letter = index_to_col(col_idx0 + 1)            # zurück nach "AA", "AB", ...
-        txt = (get_cell(sheet, f"{col_letter}{HEADER_ROW}").String or "").strip()
+    hdr_c0 = col_to_index(HEADER_START_COL) - 1          # 0-basiert
+    headers = ext.row_values(HEADER_ROW, hdr_c0)
 
+    empty_streak = 0
+    last_filled_col_idx0 = hdr_c0 - 1                    # falls AA3 direkt leer wäre
+    for i, txt in enumerate(headers):
         if txt == "":
             empty_streak += 1
             if empty_streak >= HEADER_EMPTY_STREAK_STOP:
                 break
         else:
             empty_streak = 0
-            last_filled_col_idx0 = col_idx0
-
-        col_idx0 += 1
+            last_filled_col_idx0 = hdr_c0 + i
 
     # Wenn wir gar keine gefüllte Headerzelle gefunden haben, nichts tun
-    if last_filled_col_idx0 < 0:
+    if last_filled_col_idx0 < hdr_c0:
         return
 
     end_col_idx0 = last_filled_col_idx0
 
     # ------------------------------------------------------------
-    # 2) Ab AB (= WORDS_COL) bis zur gefundenen Endspalte laufen
-    #    und nur in Spalten mit Inhalt ab START_ROW den Header setzen.
-    #    Überschriften, die schon existieren (z.B. "Wörter in AU ..."),
-    #    werden NICHT überschrieben.
+    # 2) Ab AB (= WORDS_COL) bis zur gefundenen Endspalte:
+    #    Inhalt ab START_ROW über EINE queryContentCells-Abfrage (kreis_extent),
+    #    Header nur dort setzen, wo die Headerzelle leer ist (nichts überschreiben!).
     # ------------------------------------------------------------
     start_col_idx0 = col_to_index(WORDS_COL) - 1  # AB -> 0-basiert
 
@@ -298,20 +299,18 @@ def set_headers(sheet) -> None:
     if end_col_idx0 < start_col_idx0:
         return
 
-    for c0 in range(start_col_idx0, end_col_idx0 + 1):
-        col_letter = index_to_col(c0 + 1)
+    ext.prefetch(range(start_col_idx0, end_col_idx0 + 1))
 
-        # Prüfen: gibt es ab Zeile 4 (START_ROW) irgendeinen Inhalt in dieser Spalte?
-        last = get_last_row_with_content(sheet, col_letter, START_ROW)
-        if last < START_ROW:
+    for c0 in range(start_col_idx0, end_col_idx0 + 1):
+        if headers[c0 - hdr_c0] != "":
+            continue
+        if ext.last_row(c0, START_ROW) < START_ROW:
             continue
 
-        # Header nur setzen, wenn die Headerzelle leer ist (nichts überschreiben!)
-        hdr = get_cell(sheet, f"{col_letter}{HEADER_ROW}")
-        if (hdr.String or "").strip() == "":
-            hdr.String = label
-            hdr.CharWeight = 150.0
-            hdr.IsTextWrapped = True
+        hdr = sheet.getCellByPosition(c0, HEADER_ROW - 1)
+        hdr.String = label
+        hdr.CharWeight = 150.0
+        hdr.IsTextWrapped = True
 
 
 def apply_basic_formats(sheet) -> None:
@@ -329,8 +328,8 @@ def apply_basic_formats(sheet) -> None:
     # AB: Eingabeformat ab Zeile 4
     rng_ab = sheet.getCellRangeByName(f"AB{START_ROW}:AB{LAST_ROW}")
     rng_ab.CharHeight = AB_INPUT_PT
-    rng_ab.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-    rng_ab.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+    rng_ab.HoriJustify = hori("CENTER")
+    rng_ab.VertJustify = vert("CENTER")
     
 def set_ts_header(sheet, word_start_col: str) -> None:
     """
@@ -390,19 +389,30 @@ def read_length_setting(sheet) -> int:
 # RANGE / ROW HELPERS
 # ============================================================
 
-def get_last_row_with_content(sheet, col_letter: str, start_row: int) -> int:
-    cursor = sheet.createCursor()
-    cursor.gotoStartOfUsedArea(False)
-    cursor.gotoEndOfUsedArea(True)
-    used_end_row = cursor.RangeAddress.EndRow + 1  # 1-based
+_EXTENTS = None  # ColumnExtents of the current run (kreis_extent.py), reset by every entry point
+
+def column_extents(sheet) -> ColumnExtents:
+    """Per-run cache of last rows per column (queryContentCells, one query for many columns)."""
+    global _EXTENTS
+    if _EXTENTS is None:
+        _EXTENTS = ColumnExtents(sheet)
+    return _EXTENTS
+
+_HEADERS = HeaderWriter()  # last written count/list headers (kreis_headers.py), kept between runs
 
-    if used_end_row < start_row:
-        return start_row - 1
+def count_headers() -> HeaderWriter:
+    return _HEADERS
 
-    for r in range(used_end_row, start_row - 1, -1):
-        if get_cell(sheet, f"{col_letter}{r}").String.strip() != "":
-            return r
-    return start_row - 1
+def reset_column_extents() -> None:
+    """
+    Call first in every macro entry point (the user may have edited the sheet in between)
+    and again after committing an open cell edit.
+    """
+    global _EXTENTS
+    _EXTENTS = None
+
+def get_last_row_with_content(sheet, col_letter: str, start_row: int) -> int:
+    return column_extents(sheet).last_row(col_to_index(col_letter) - 1, start_row)
 
 def find_first_empty_row(sheet, col_letter: str, start_row: int) -> int:
     last = get_last_row_with_content(sheet, col_letter, start_row)
@@ -464,6 +474,30 @@ def is_word_in_dictionary(speller, word: str, locale_str: str = "de-DE") -> bool
         log(f"Spellcheck error for '{word.lower()}': {e}")
         return False
 
+def check_words_in_dictionary(doc, speller, words, locale_str: str = "de-DE") -> dict:
+    """
+    Batch version of is_word_in_dictionary (worker pool, see SPELL_MODE).
+    Returns {word: bool}; results are merged in input order before anything is written.
+    """
+    words = list(dict.fromkeys(w for w in words if w))
+    if not words:
+        return {}
+    if SPELL_MODE == "off":
+        return {w: is_word_in_dictionary(speller, w, locale_str) for w in words}
+    try:
+        results = check_words(
+            words,
+            check=lambda sp, w: is_word_in_dictionary(sp, w, locale_str),
+            make_checker=lambda: get_spellchecker(doc),
+            mode=SPELL_MODE,
+            workers=SPELL_WORKERS,
+            dict_path=SPELL_OFFLINE_DICT,
+        )
+    except Exception as e:
+        log(f"Parallel spellcheck failed, checking one by one: {e}")
+        results = [is_word_in_dictionary(speller, w, locale_str) for w in words]
+    return dict(zip(words, results))
+
 def get_nearest_suggestion(speller, word: str, locale_str: str = "de-DE") -> str:
     if speller is None or not word:
         return ""
@@ -527,106 +561,128 @@ def get_list_start_col_for_length(length: int) -> str:
     9 -> AG + 28
     ...
     """
-    if length == 8:
-        return BASE_COL_LEN8
-    if length in (5, 6, 7, 9, 10, 11, 12):
-        offset_blocks = (length - 5)  # 5->0, 6->1, 7->2, 9->4, ...
-        return shift_col(BASE_COL_LEN8, 7 + offset_blocks * BLOCK_WIDTH)
-    raise RuntimeError(f"Unsupported length: {length}")
+    try:
+        return col_letters(word_col0(SCHEMA, length))
+    except ValueError:
+        raise RuntimeError(f"Unsupported length: {length}")
 
 def get_secondary_list_col_for_len8() -> str:
-    # BI bei deinem Raster
-    return shift_col(BASE_COL_LEN8, 7 + (8 - 5) * BLOCK_WIDTH)
+    # BI bei deinem Raster – nur noch Alias der 8er-Liste (AG), kein eigener Datenbestand
+    return col_letters(alias_col0s(SCHEMA, 8)[0])
+
+# ============================================================
+# LEN-8 ALIAS MIGRATION (BI -> AG, layout migration to version 3)
+# ============================================================
+
+def _len8_alias_state(doc) -> str:
+    return str(get_user_prop(doc, LEN8_ALIAS_FLAG, "")).strip()
+
+def _set_len8_alias_state(doc, state: str) -> None:
+    if not set_user_prop(doc, LEN8_ALIAS_FLAG, state):
+        log("Alias flag not stored")
+
+def write_alias_header(sheet, alias_col: str, target_col: str) -> None:
+    cell = get_cell(sheet, f"{alias_col}3")
+    cell.String = f"8 Buchstaben:\nsiehe {target_col}"
+    cell.IsTextWrapped = True
+    cell.HoriJustify = 2
+    cell.VertJustify = 1
+    get_cell(sheet, f"{alias_col}2").String = ""
+
+def migrate_len8_alias(doc, sheet, notify: bool = True) -> bool:
+    """
+    Moves words of the old secondary 8-block (BI) into the 8 list (AG), then clears BI.
+    Layout migration step (ensure_sheet_layout). Words left behind (list full) mark the
+    migration as pending: retry_len8_alias repeats only this data step, without a message.
+    Returns True when BI is empty.
+    """
+    if _len8_alias_state(doc) == "1":
+        return True
+    target_col = get_list_start_col_for_length(8)
+    left_total = 0
+    for alias0 in alias_col0s(SCHEMA, 8):
+        moved, dup, left = migrate_alias_block(sheet, SCHEMA, alias0)
+        left_total += left
+        log(f"Len-8 alias {col_letters(alias0)} -> {target_col}: moved={moved}, dup={dup}, left={left}")
+        write_alias_header(sheet, col_letters(alias0), target_col)
+    column_extents(sheet).invalidate()  # AG and BI changed
+    if left_total:
+        _set_len8_alias_state(doc, LEN8_ALIAS_PENDING)
+        if notify:
+            show_messagebox("Info", f"8er-Liste {target_col} ist voll – {left_total} Wörter bleiben in "
+                                    f"{get_secondary_list_col_for_len8()} stehen.")
+        return False
+    _set_len8_alias_state(doc, "1")
+    return True
+
+def retry_len8_alias(doc, sheet) -> None:
+    """Pending migration only (AG was full): move what fits now – no formatting, no message."""
+    if _len8_alias_state(doc) == LEN8_ALIAS_PENDING:
+        migrate_len8_alias(doc, sheet, notify=False)
 
 # ============================================================
 # COMPACT LISTS
 # ============================================================
 
-def compact_two_columns(sheet, col_a: str, col_b: str, start_row: int) -> None:
-    last = get_last_row_with_content(sheet, col_a, start_row)
+def compact_two_columns(sheet, col_a: str, col_b: str, start_row: int) -> int:
+    ext = column_extents(sheet)
+    a0 = col_to_index(col_a) - 1
+    b0 = col_to_index(col_b) - 1
+    last = ext.last_row(a0, start_row)
     if last < start_row:
-        return
+        return 0
+
+    range_a = sheet.getCellRangeByName(f"{col_a}{start_row}:{col_a}{last}")
+    range_b = sheet.getCellRangeByName(f"{col_b}{start_row}:{col_b}{last}")
+    data_a = range_a.getDataArray()
+    data_b = range_b.getDataArray()
 
+    # words as text (1.0 -> "1", kreis_schema.cell_text), column B keeps its values (numbers stay numbers)
     items = []
-    for r in range(start_row, last + 1):
-        a_cell = get_cell(sheet, f"{col_a}{r}")
-        b_cell = get_cell(sheet, f"{col_b}{r}")
-        a = (a_cell.String or "").strip()
-        b = b_cell.String if hasattr(b_cell, "String") else ""
+    for ra, rb in zip(data_a, data_b):
+        a = cell_text(ra[0])
         if a != "":
-            items.append((a, b))
+            items.append((a, rb[0]))
 
-    range_a = sheet.getCellRangeByName(f"{col_a}{start_row}:{col_a}{last}")
-    range_b = sheet.getCellRangeByName(f"{col_b}{start_row}:{col_b}{last}")
     range_a.clearContents(23)
     range_b.clearContents(23)
 
-    for i, (a, b) in enumerate(items):
-        r = start_row + i
-        get_cell(sheet, f"{col_a}{r}").String = a
-        get_cell(sheet, f"{col_b}{r}").String = b
+    if items:
+        end = start_row + len(items) - 1
+        sheet.getCellRangeByName(f"{col_a}{start_row}:{col_a}{end}").setDataArray(tuple((a,) for a, _b in items))
+        sheet.getCellRangeByName(f"{col_b}{start_row}:{col_b}{end}").setDataArray(tuple((b,) for _a, b in items))
+
+    ext.invalidate(a0)
+    ext.invalidate(b0)
+    return len(items)
 
 def build_existing_list_map_for_col(sheet, col_letter: str) -> dict:
-    last = get_last_row_with_content(sheet, col_letter, START_ROW)
     m = {}
-    if last < START_ROW:
-        return m
-    for r in range(START_ROW, last + 1):
-        v = get_cell(sheet, f"{col_letter}{r}").String.strip()
+    values = column_extents(sheet).column_values(col_to_index(col_letter) - 1, START_ROW)
+    for i, v in enumerate(values):
         if v != "":
-            m[v.upper()] = r
+            m[v.upper()] = START_ROW + i
     return m
 
 # ============================================================
 # BLOCK HEADERS + FORMATTING FOR ALL WORD COLUMNS
 # ============================================================
 
-def write_list_header_with_bold_number(cell, n: int, col_label: str) -> None:
+def list_header_item(n: int, col_label: str):
     """
-    Header:
+    Header (for HeaderWriter.update_row):
       Wörter in <COL>
       <N> Buchstaben
     (N fett)
     """
-    text = cell.Text
-    text.setString("")
-
-    line1 = f"Wörter in {col_label}\n"
-    num_str = str(n)
-    tail = " Buchstaben"
-
-    cursor = text.createTextCursor()
-    text.insertString(cursor, line1, False)
-
-    start = cursor.getStart()
-    text.insertString(cursor, num_str, False)
-    end = cursor.getEnd()
-
-    num_cursor = text.createTextCursorByRange(start)
-    num_cursor.gotoRange(end, True)
-    num_cursor.CharWeight = 150.0
-
-    cursor = text.createTextCursor()
-    cursor.gotoEnd(False)
-    text.insertString(cursor, tail, False)
-
-    cell.IsTextWrapped = True
-    cell.HoriJustify = 2
-    cell.VertJustify = 1
-    cell.CharHeight = 14.0
+    return (f"Wörter in {col_label}\n", n, " Buchstaben")
 
-def _set_col_width(sheet, col_letter: str, cm_width: float):
-    col = sheet.getColumns().getByName(col_letter)
-    col.Width = cm_to_100mm(cm_width)
+def _style_col_range(sheet, col_letter: str, style: str, last_col: str = None):
+    """Zellvorlage für col_letter..last_col ab START_ROW (Breiten: kreis_layout)."""
+    rng = sheet.getCellRangeByName(f"{col_letter}{START_ROW}:{last_col or col_letter}{LAST_ROW}")
+    apply_style(rng, style)
 
-def _format_col_range(sheet, col_letter: str, pt: float, hori: str, vert: str, width_cm: float):
-    _set_col_width(sheet, col_letter, width_cm)
-    rng = sheet.getCellRangeByName(f"{col_letter}{START_ROW}:{col_letter}{LAST_ROW}")
-    rng.CharHeight = float(pt)
-    rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", hori)
-    rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", vert)
-
-def format_all_word_blocks(sheet):
+def format_all_word_blocks(doc, sheet):
     """
     Formatiert ALLE Wortspalten-Blöcke:
     - Startspalte (Wort): 5cm, 16pt, rechts, vertikal mittig
@@ -640,41 +696,39 @@ def format_all_word_blocks(sheet):
     hdr.IsTextWrapped = True
 
     # Alle Längen 5..12
+    widths = {}
+    headers = {}
     for length in range(5, 13):
         start_col = get_list_start_col_for_length(length)
 
-        # Header in <start_col>3 setzen (damit AU3 sicher gesetzt ist)
-        write_list_header_with_bold_number(get_cell(sheet, f"{start_col}3"), length, start_col)
+        # Header in <start_col>3 (damit AU3 sicher gesetzt ist) – unten gesammelt geschrieben
+        headers[col_to_index(start_col) - 1] = list_header_item(length, start_col)
         set_ts_header(sheet, start_col)
 
         # Wortspalte
-        _format_col_range(sheet, start_col, WORD_PT, "CENTER", "CENTER", WORD_COL_WIDTH_CM)
+        _style_col_range(sheet, start_col, STYLE_WORDLIST)
+
+        # 4 Nachbarspalten (Timestamp + 3 weitere) als EIN Bereich
+        _style_col_range(sheet, shift_col(start_col, 1), STYLE_WORDLIST_META, shift_col(start_col, 4))
 
-        # 4 Nachbarspalten (Timestamp + 3 weitere)
+        c0 = col_to_index(start_col) - 1
+        widths[c0] = cm_to_100mm(WORD_COL_WIDTH_CM)
         for off in (1, 2, 3, 4):
-            c = shift_col(start_col, off)
-            _format_col_range(sheet, c, META_PT, "CENTER", "CENTER", META_COL_WIDTH_CM)
+            widths[c0 + off] = cm_to_100mm(META_COL_WIDTH_CM)
 
-    # Sekundärblock für Länge 8 (BI) – optional, aber sauber inkl. Header/Format
-    sec8 = get_secondary_list_col_for_len8()
-    write_list_header_with_bold_number(get_cell(sheet, f"{sec8}3"), 8, sec8)
-    set_ts_header(sheet, sec8)
-    
-    # Wortspalte
-    _format_col_range(sheet, sec8, WORD_PT, "CENTER", "CENTER", WORD_COL_WIDTH_CM)
+    # Breiten aller Blöcke: ein Aufruf je Lauf gleicher Breite
+    apply_col_widths(sheet, widths)
 
-    # 4 Nachbarspalten (Timestamp + 3 weitere)
-    for off in (1, 2, 3, 4):
-        c = shift_col(sec8, off)
-        _format_col_range(sheet, c, META_PT, "CENTER", "CENTER", META_COL_WIDTH_CM)
+    # Listen-Header: nur geänderte Zellen neu (Rich Text), dann 14 pt / umbrechen / mittig
+    count_headers().update_row(sheet, HEADER_ROW, headers,
+                               on_write=lambda cell: apply_style(cell, STYLE_LIST_HEADER), doc=doc)
+
+    # BI (Rasterplatz von 8) ist nur ein Alias der 8er-Liste -> Hinweis statt eigener Liste
+    write_alias_header(sheet, get_secondary_list_col_for_len8(), get_list_start_col_for_length(8))
 
 def format_count_cells_row2(sheet, cols: list[str]) -> None:
     for c in cols:
-        rng = sheet.getCellRangeByName(f"{c}2")
-        rng.HoriJustify = 2  # center (oder 3 für rechts, je nach LO-Wert; bei dir nutzt du 2=center)
-        rng.VertJustify = 1  # middle
-        rng.CharHeight = 12.0
-        rng.IsTextWrapped = True
+        apply_style(sheet.getCellRangeByName(f"{c}2"), STYLE_COUNTER)  # 12 pt, mittig, umbrechen
 
 # ============================================================
 # CORE PROCESS
@@ -701,19 +755,19 @@ def process_words(sheet, doc, target_len: int) -> None:
     # Build a map of existing entries in the chosen list column
     existing_map = build_existing_list_map_for_col(sheet, list_col)
 
-    # For length 8: additionally write into secondary 8-block
-    list_col2 = None
-    ts_col2 = None
-    next_row2 = None
-    existing_map2 = {}
-
-    if target_len == 8:
-        list_col2 = get_secondary_list_col_for_len8()
-        if not list_col2:
-            raise RuntimeError("Secondary list column mapping failed for length=8")
-        ts_col2 = shift_col(list_col2, 1)
-        next_row2 = find_first_empty_row(sheet, list_col2, START_ROW)
-        existing_map2 = build_existing_list_map_for_col(sheet, list_col2)
+    # Dictionary check for all new candidates at once (worker pool), one bulk read of AB
+    col0 = col_to_index(WORDS_COL) - 1
+    try:
+        inputs = sheet.getCellRangeByPosition(col0, START_ROW - 1, col0, last_row - 1).getDataArray()
+    except Exception:
+        inputs = ()
+    candidates = []
+    for row in inputs:
+        w = str(row[0] or "").strip() if row else ""
+        up = convert_umlauts_for_crossword(w).upper()
+        if w and up not in existing_map:
+            candidates.append(w)
+    in_dict = check_words_in_dictionary(doc, speller, candidates, GERMAN_LOCALE)
 
     for r in range(START_ROW, last_row + 1):
         word_cell = get_cell(sheet, f"{WORDS_COL}{r}")
@@ -737,14 +791,11 @@ def process_words(sheet, doc, target_len: int) -> None:
             result_cell.String = f"Wort in {list_col} {row_found}"
             continue
 
-        # Duplicate check in secondary list (only for len=8)
-        if target_len == 8 and converted_upper in existing_map2:
-            row_found = existing_map2[converted_upper]
-            result_cell.String = f"Wort in {list_col2} {row_found}"
-            continue
-
         # 3) Dictionary check (original word) after duplicate check
-        if not is_word_in_dictionary(speller, original, GERMAN_LOCALE):
+        ok = in_dict.get(original)
+        if ok is None:
+            ok = is_word_in_dictionary(speller, original, GERMAN_LOCALE)
+        if not ok:
             sug = get_nearest_suggestion(speller, original, GERMAN_LOCALE)
             if sug:
                 result_cell.String = f"Wort nicht im LO-Wörterbuch – Vorschlag: {sug}"
@@ -767,21 +818,14 @@ def process_words(sheet, doc, target_len: int) -> None:
         get_cell(sheet, f"{list_col}{next_row}").String = converted_upper
         get_cell(sheet, f"{ts_col}{next_row}").String = stamp
         existing_map[converted_upper] = next_row
+        column_extents(sheet).note_write(col_to_index(list_col) - 1, next_row)
+        column_extents(sheet).note_write(col_to_index(ts_col) - 1, next_row)
         next_row += 1
 
-        # Secondary list write (only for len=8)
-        if target_len == 8:
-            get_cell(sheet, f"{list_col2}{next_row2}").String = converted_upper
-            get_cell(sheet, f"{ts_col2}{next_row2}").String = stamp
-            existing_map2[converted_upper] = next_row2
-            next_row2 += 1
-
     # Compact list + timestamp columns (remove gaps)
-    compact_two_columns(sheet, list_col, ts_col, START_ROW)
-    if target_len == 8:
-        compact_two_columns(sheet, list_col2, ts_col2, START_ROW)
-    # -> NEU: Counts aktualisieren
-    update_word_counts_row2(sheet, target_len)
+    n_list = compact_two_columns(sheet, list_col, ts_col, START_ROW)
+    # -> NEU: Counts aktualisieren (Zielliste: Anzahl aus dem Kompaktieren)
+    update_word_counts_row2(doc, sheet, target_len, {target_len: n_list})
     
 # ============================================================
 # WORKFLOW
@@ -789,9 +833,10 @@ def process_words(sheet, doc, target_len: int) -> None:
 
 def run_workflow(doc) -> None:
     sheet = get_sheet(doc, SHEET_NAME)
+    reset_column_extents()  # the parked cell edit may have changed a column
 
+    ensure_sheet_layout(doc, sheet)
     set_headers(sheet)
-    apply_basic_formats(sheet)
 
     ensure_default_length(sheet)
     target_len = read_length_setting(sheet)
@@ -802,11 +847,36 @@ def run_workflow(doc) -> None:
 # INIT (ONE-TIME)
 # ============================================================
 
-def is_initialized() -> bool:
-    return INITIALIZED
+def _init_sheet_layout(doc, sheet) -> None:
+    """Static formatting only (fonts, widths, count cells) – no content."""
+    apply_basic_formats(sheet)
+
+    # >>> alle Wortspalten-Header + Formatierung (inkl. AU3)
+    format_all_word_blocks(doc, sheet)
+
+    cols = ["AB"]  # AB2 Eingaben
+    for length in range(MIN_LEN, MAX_LEN + 1):
+        cols.append(get_list_start_col_for_length(length))  # AG/AN/AU/...
+    log("format_count_cells_row2 -> Spaltenliste cols = " + ", ".join(cols))
+    format_count_cells_row2(sheet, cols)
+
+def ensure_sheet_layout(doc, sheet, force: bool = False) -> bool:
+    """
+    Formats once per document and LAYOUT_VERSION (instead of on every check), migrations first.
+    A pending alias migration (AG was full) is retried as data step only.
+    """
+    def _apply(d):
+        ensure_cell_styles(d)
+        _init_sheet_layout(d, sheet)
+    migrated = []
+    migrations = {3: lambda d: migrated.append(migrate_len8_alias(d, sheet))}
+    done = ensure_layout(doc, LAYOUT_FLAG, LAYOUT_VERSION, _apply, migrations=migrations, force=force)
+    if not migrated:
+        retry_len8_alias(doc, sheet)
+    return done
 
 def init_kreis_wortspiel(*args):
-    global INIT_RUNNING, INITIALIZED
+    global INIT_RUNNING
 
     INIT_RUNNING = True
     try:
@@ -814,31 +884,16 @@ def init_kreis_wortspiel(*args):
         desktop = get_desktop(ctx)
         doc = get_document(desktop)
         sheet = get_sheet(doc, SHEET_NAME)
+        reset_column_extents()
 
+        # explicit init: always re-apply the layout
+        ensure_sheet_layout(doc, sheet, force=True)
         set_headers(sheet)
-        apply_basic_formats(sheet)
-
-        # >>> alle Wortspalten-Header + Formatierung (inkl. AU3)
-        format_all_word_blocks(sheet)
-        
-        # format_count_cells_row2(sheet, ["AB", "AG", "AH", "AN", "AO", "AU", "AV"]) diese Zeile wurde ersetzt durch den unteren Block und ist dadurch flexibler geworden
-        
-        cols = ["AB"]  # AB2 Eingaben
-        for length in range(MIN_LEN, MAX_LEN + 1):
-            cols.append(get_list_start_col_for_length(length))  # AG/AN/AU/...
-        cols.append(get_secondary_list_col_for_len8())          # BI-Block       
-        format_count_cells_row2(sheet, cols)
- 
-        log("format_count_cells_row2 -> Spaltenliste cols = " + ", ".join(cols))
-        
-        format_count_cells_row2(sheet, cols)
 
         # Counts auch beim Init aktualisieren (wenn Listen schon gefüllt sind)
         ensure_default_length(sheet)
         target_len = read_length_setting(sheet)   # braucht update_word_counts_row2 wegen AB2 (Eingaben)
-        update_word_counts_row2(sheet, target_len)
-
-        INITIALIZED = True
+        update_word_counts_row2(doc, sheet, target_len)
     finally:
         INIT_RUNNING = False
 
@@ -856,6 +911,7 @@ def clear_input_and_results_range(*args):
     doc = get_document(desktop)
     assert_calc_document(doc)
     sheet = get_sheet(doc, SHEET_NAME)
+    reset_column_extents()
 
     # Falls gerade eine Zelle im Editmodus ist: erst committen
     commit_edit_by_parking_left_of_last_word(doc, sheet, words_col=WORDS_COL, start_row=START_ROW)
@@ -865,6 +921,7 @@ def clear_input_and_results_range(*args):
     # 23 = löscht Inhalte (Value, String, Formel, Notizen, etc.), lässt Formatierung stehen
     rng.clearContents(23)
     sheet.getCellRangeByName("AB2").clearContents(23)
+    reset_column_extents()
 
     # optional: Cursor wieder auf AB4 setzen
     set_cursor_to_cell(doc, sheet, "AB4")
@@ -875,15 +932,13 @@ def clear_input_and_results_range(*args):
 # ============================================================
 
 def check_words_for_kreis_wordgame(*args):
-    if not is_initialized():
-        init_kreis_wortspiel()
-
     try:
         ctx = get_context()
         desktop = get_desktop(ctx)
         doc = get_document(desktop)
         assert_calc_document(doc)
         sheet = get_sheet(doc, SHEET_NAME)
+        reset_column_extents()
 
         # >>> WICHTIG: Editmodus verlassen / Cursor aus aktiver Zelle raus
         # commit_any_active_cell_edit(doc, sheet, "AB2")
@@ -4,13 +4,32 @@
 import uno
 import random
 from datetime import datetime, timedelta
-from com.sun.star.awt import Point, Size
+from com.sun.star.awt import Point
+
+# Shared helper (Scripts/python/pythonpath/kreis_scramble.py)
+from kreis_scramble import plan_scramble
+# Shared helper (Scripts/python/pythonpath/kreis_docprops.py)
+from kreis_docprops import ensure_layout
+# Shared helper (Scripts/python/pythonpath/kreis_layout.py)
+from kreis_layout import apply_row_heights, apply_col_widths
+# Shared helper (Scripts/python/pythonpath/kreis_styles.py)
+from kreis_styles import ensure_cell_styles, apply_style, STYLE_CENTER, STYLE_HEADER
+# Shared helper (Scripts/python/pythonpath/kreis_shapes.py)
+from kreis_shapes import CircleTemplate
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import message_box
+# Shared helper (Scripts/python/pythonpath/kreis_schema.py)
+from kreis_schema import (
+    get_schema, word_col0, read_block, iter_entries, write_rows,
+    col_letters as _schema_col_letters, F_WORD, F_USED_WORD, F_USED,
+)
 
 # ============================================================
 # 1) KONFIGURATION
 # ============================================================
 
 SHEET_NAME = "KREIS_WORTSPIEL"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout (kreis_schema.py)
 MARK_DESC  = "KREIS_Wortspiel_GUI"   # Marker zum Löschen (Description)
 
 EF_ROWS   = (3, 6, 8, 11, 13, 16)
@@ -37,7 +56,7 @@ GROUPS = [
 # +1 = Zeitstempel Wortliste (existiert schon)
 # +3 = verwendetes Wort im Kreis (same row)
 # +4 = Zeitstempel für 30 Tage (same row)
-WORDLIST_COLS = {8: "AG", 5: "AN", 6: "AU", 7: "BB"}
+WORDLIST_COLS = {L: _schema_col_letters(word_col0(SCHEMA, L)) for L in (8, 5, 6, 7)}
 
 # ============================================================
 # 2) UNO / CALC HELFER
@@ -57,6 +76,7 @@ INIT_ROW_H_09     = cm(0.9)
 INIT_ROWS_H17     = (1, 2, 17, 18)
 
 SHEET_INIT_FLAG = "KREIS_WORTSPIEL_INIT_DONE"
+LAYOUT_VERSION = 2  # raise to re-run _init_sheet_layout once in existing documents
 
 def _get_doc():
     return XSCRIPTCONTEXT.getDocument()
@@ -80,12 +100,7 @@ def _a1(col0, row0):
 
 def _msgbox(doc, title, message):
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "WARNINGBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "WARNINGBOX")
     except Exception:
         pass
 
@@ -101,35 +116,6 @@ def _format_messages(title: str, items: list, max_lines: int = 25) -> str:
     rest = len(items) - max_lines
     return f"{title} ({len(items)}):\n{head}\n...\n(+{rest} weitere)"
 
-def _doc_user_props(doc):
-    return doc.getDocumentProperties().getUserDefinedProperties()
-
-def _get_init_done(doc) -> bool:
-    props = _doc_user_props(doc)
-    try:
-        if props.hasByName(SHEET_INIT_FLAG):
-            return str(props.getPropertyValue(SHEET_INIT_FLAG)) == "1"
-    except Exception:
-        pass
-    return False
-
-def _set_init_done(doc):
-    props = _doc_user_props(doc)
-    try:
-        if not props.hasByName(SHEET_INIT_FLAG):
-            props.addProperty(SHEET_INIT_FLAG, 0, "0")
-        props.setPropertyValue(SHEET_INIT_FLAG, "1")
-    except Exception:
-        pass
-
-def _set_center(rng):
-    rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-    rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
-
-def _set_bold_14(rng):
-    rng.CharHeight = 14
-    rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-
 def disable_spellcheck_for_range(sheet, a1_range: str):
     try:
         rng = sheet.getCellRangeByName(a1_range)
@@ -324,19 +310,17 @@ def _pick_random_word_from_lists(sheet):
     candidates = []
     cutoff = datetime.now() - timedelta(days=30)
 
+    # one bulk read per block (kreis_schema.read_block) instead of a cell loop
     for L, col_letters in WORDLIST_COLS.items():
-        col0 = _col0_from_letters(col_letters)
-        for r in range(4, 600):
-            w = (_cell(sheet, col0, r).getString() or "").strip()
-            if not w:
-                continue
+        for r, fields in iter_entries(SCHEMA, read_block(sheet, SCHEMA, L)):
+            w = fields[F_WORD]
 
             # NUR 5..8 zulassen (mit deiner Umlaut-Normalisierung)
             norm = _normalize_for_pairs_keep_umlauts(w)
             if not (5 <= len(norm) <= 8):
                 continue
 
-            used_dt = _parse_ts(_cell(sheet, col0 + 4, r).getString())
+            used_dt = _parse_ts(fields[F_USED])
             if used_dt is None or used_dt < cutoff:
                 candidates.append((w, L, col_letters, r))
 
@@ -347,8 +331,9 @@ def _pick_random_word_from_lists(sheet):
 
 def _mark_word_used(sheet, list_col_letters: str, row_1based: int, used_word: str):
     col0 = _col0_from_letters(list_col_letters)
-    _cell(sheet, col0 + 3, row_1based).setString(_to_upper_visual(used_word))
-    _cell(sheet, col0 + 4, row_1based).setString(_now_ts())
+    write_rows(sheet, SCHEMA, None, [
+        (row_1based, {F_USED_WORD: _to_upper_visual(used_word), F_USED: _now_ts()})
+    ], col0=col0)
 
 def _get_pairs_for_half(sheet, doc, title, ef_row_1based, fallback_row_1based, allow_random=False):
     """
@@ -437,82 +422,13 @@ def set_cursor_next_input(doc, sheet):
 # 6) ZEICHNEN (SHAPES)
 # ============================================================
 
-def _mark_shape(shape, name_suffix):
-    try:
-        shape.Name = f"{MARK_DESC}_{name_suffix}"
-    except Exception:
-        pass
-    try:
-        shape.Description = MARK_DESC
-    except Exception:
-        pass
-
-def draw_text_center(doc, draw_page, cx, cy, text, name_suffix):
-    t = doc.createInstance("com.sun.star.drawing.TextShape")
-    _mark_shape(t, name_suffix)
-    draw_page.add(t)
-
-    text = _to_upper_visual(text)
-    w, h = 700, 700
-    t.Size = Size(w, h)
-    t.Position = Point(int(cx - w/2), int(cy - h/2))
-
-    try:
-        t.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "NONE")
-        t.LineStyle = uno.Enum("com.sun.star.drawing.LineStyle", "NONE")
-    except Exception:
-        pass
-
-    try:
-        t.String = text
-    except Exception:
-        try:
-            t.Text.setString(text)
-        except Exception:
-            pass
-
-    try:
-        t.CharHeight = CHAR_HEIGHT
-        t.CharWeight = 150
-        t.TextHorizontalAdjust = 1
-        t.TextVerticalAdjust   = 1
-    except Exception:
-        pass
-
-    return t
-
-def draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
-    line = doc.createInstance("com.sun.star.drawing.LineShape")
-    _mark_shape(line, name_suffix)
-    draw_page.add(line)
-    line.Position = Point(x1, y1)
-    line.Size = Size(x2 - x1, y2 - y1)
-    line.LineColor = 0x000000
+# Vorlage für Kreis + Kreuz + 4 Texte (kreis_shapes): Eigenschaften EINMAL vorbereitet,
+# je Shape EIN setPropertyValues statt Einzelzuweisungen
+_CIRCLE_TEMPLATE = CircleTemplate(MARK_DESC, char_height=CHAR_HEIGHT, bold=True, text_box=700)
 
 def draw_circle_with_quadrants(doc, draw_page, x, y, size, fill_color, label_texts, idx_tag):
-    circle = doc.createInstance("com.sun.star.drawing.EllipseShape")
-    _mark_shape(circle, f"circle_{idx_tag}")
-    draw_page.add(circle)
-
-    circle.Position  = Point(x, y)
-    circle.Size      = Size(size, size)
-    circle.FillColor = fill_color
-    circle.LineColor = 0x000000
-
-    cx = x + size // 2
-    cy = y + size // 2
-
-    draw_line(doc, draw_page, cx, y,  cx, y + size, f"vline_{idx_tag}")
-    draw_line(doc, draw_page, x,  cy, x + size, cy, f"hline_{idx_tag}")
-
-    q1x = x + size // 4
-    q3x = x + (3 * size) // 4
-    q1y = y + size // 4
-    q3y = y + (3 * size) // 4
-
-    centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]
-    for i, ((tcx, tcy), txt) in enumerate(zip(centers, label_texts), start=1):
-        draw_text_center(doc, draw_page, tcx, tcy, txt, f"text_{idx_tag}_{i}")
+    texts = [_to_upper_visual(t) for t in label_texts]
+    return _CIRCLE_TEMPLATE.draw(doc, draw_page, x, y, size, fill_color, texts, idx_tag)
 
 # ============================================================
 # 7) ROW-HEIGHT / POSITION
@@ -588,6 +504,7 @@ def delete_all_circles(*args):
 
 def _init_sheet_layout(doc):
     sheet = doc.Sheets.getByName(SHEET_NAME)
+    ensure_cell_styles(doc)
 
     disable_spellcheck_for_range(sheet, "E3:F3")
     disable_spellcheck_for_range(sheet, "E6:F6")
@@ -605,21 +522,17 @@ def _init_sheet_layout(doc):
     sheet.getCellRangeByName("E2").setString("Kreis \n-3-")
     sheet.getCellRangeByName("F2").setString("Kreis \n-4-")
 
+    # B2:F50 mittig (hori + vert), danach die fetten Bereiche darüber (Vorlagen, kreis_styles)
+    apply_style(sheet.getCellRangeByName(INIT_CENTER_RANGE), STYLE_CENTER)
+
     hdr = sheet.getCellRangeByName(INIT_HEADER_RANGE)
-    _set_center(hdr)
-    _set_bold_14(hdr)
+    apply_style(hdr, STYLE_HEADER)
 
     hint = "Begriffe\n(5–8)"
     for r in (3, 6, 8, 11, 13, 16):
         cell = sheet.getCellByPosition(1, r - 1)
         cell.setString(hint)
-        try:
-            cell.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-            cell.CharHeight = 14
-        except Exception:
-            pass
-
-    _set_center(sheet.getCellRangeByName(INIT_CENTER_RANGE))
+        apply_style(cell, STYLE_HEADER)
 
     for r in INIT_WORD_ROWS:
         r0 = r - 1
@@ -628,12 +541,10 @@ def _init_sheet_layout(doc):
             ef.merge(True)
         except Exception:
             pass
-        _set_center(ef)
-        _set_bold_14(ef)
+        apply_style(ef, STYLE_HEADER)
 
     cols = sheet.Columns
-    for col in range(2, 7):  # C..G
-        cols.getByIndex(col).Width = INIT_COL_W_C_TO_G
+    apply_col_widths(sheet, {col: INIT_COL_W_C_TO_G for col in range(2, 7)})  # C..G
 
     col_b = cols.getByIndex(1)
     try:
@@ -643,9 +554,7 @@ def _init_sheet_layout(doc):
     except Exception:
         pass
 
-    rows = sheet.Rows
-    for r in INIT_ROWS_H17:
-        rows.getByIndex(r - 1).Height = INIT_ROW_H_17
+    apply_row_heights(sheet, {r: INIT_ROW_H_17 for r in INIT_ROWS_H17})
 
     adjust_rows_to_circle_radius(sheet)
 
@@ -655,10 +564,8 @@ def _init_sheet_layout(doc):
         pass
 
 def _ensure_initialized(doc):
-    if _get_init_done(doc):
-        return
-    _init_sheet_layout(doc)
-    _set_init_done(doc)
+    # formatting runs once per document and LAYOUT_VERSION
+    ensure_layout(doc, SHEET_INIT_FLAG, LAYOUT_VERSION, _init_sheet_layout)
 
 # ============================================================
 # 9) UPDATE / CREATE
@@ -810,15 +717,6 @@ def create_circle_grid(*args):
 
 MAX_SOLVED_CIRCLES = 2
 
-def _rotate_right_vals(vals):
-    return [vals[2], vals[0], vals[3], vals[1]]
-
-def _rotate_vals(vals, steps_clockwise):
-    v = list(vals)
-    for _ in range(steps_clockwise % 4):
-        v = _rotate_right_vals(v)
-    return v
-
 def scramble_all_circles_no_solution(*args):
     doc = _get_doc()
     sheet = _get_sheet(doc)
@@ -826,9 +724,8 @@ def scramble_all_circles_no_solution(*args):
     name_map = _name_map_from_drawpage(dp)
 
     missing = []
-    forced_solved = 0
-    total = 0
-    plan = []
+    tags = []
+    bases = []
 
     for gi, (title, ef_top, top_row, bot_row, ef_bot) in enumerate(GROUPS):
         top_pairs, _, ok1 = _get_pairs_for_half(sheet, doc, title, ef_top, top_row, allow_random=False)
@@ -843,7 +740,6 @@ def scramble_all_circles_no_solution(*args):
                 missing.append(f"{title}: Kreis fehlt")
                 continue
 
-            total += 1
             t = top_pairs[c] if c < len(top_pairs) else ""
             b = bot_pairs[c] if c < len(bot_pairs) else ""
 
@@ -851,25 +747,17 @@ def scramble_all_circles_no_solution(*args):
             ur = t[1] if len(t) > 1 else " "
             ll = b[0] if len(b) > 0 else " "
             lr = b[1] if len(b) > 1 else " "
-            base = [ul, ur, ll, lr]
-
-            candidates = [k for k in (1, 2, 3) if _rotate_vals(base, k) != base]
-            if candidates:
-                step = random.choice(candidates)
-            else:
-                step = 0
-                forced_solved += 1
-            plan.append((idx_tag, base, step))
+            tags.append(idx_tag)
+            bases.append([ul, ur, ll, lr])
 
     if missing:
         _maybe_msgbox(doc, "Scramble", "Es fehlen Shapes – bitte neu zeichnen.")
         return
 
-    solved_after = 0
-    for idx_tag, base, step in plan:
-        vals = _rotate_vals(base, step)
-        if vals == base:
-            solved_after += 1
+    # alle Kreise gemeinsam planen: Limit + "nie komplette Lösung" in einem Durchgang
+    _steps, scrambled, info = plan_scramble(bases, max_solved=MAX_SOLVED_CIRCLES)
+
+    for idx_tag, vals in zip(tags, scrambled):
         for q, val in enumerate(vals, start=1):
             nm = f"{MARK_DESC}_text_{idx_tag}_{q}"
             sh = name_map.get(nm)
@@ -879,11 +767,14 @@ def scramble_all_circles_no_solution(*args):
                 except Exception:
                     pass
 
+    # Meldung nur noch, wenn es durch Symmetrie nicht anders geht
+    total = info["total"]
+    solved_after = info["solved_after"]
     allowed = min(MAX_SOLVED_CIRCLES, max(total - 1, 0))
     if total > 0 and solved_after > allowed:
         _maybe_msgbox(doc, "Scramble Hinweis",
                 f"{solved_after} Kreise stehen in Ausgangsstellung (erlaubt: {allowed}).\n"
-                f"Grund: {forced_solved} Kreise rotationssymmetrisch/leer.")
+                f"Grund: {info['forced_solved']} Kreise rotationssymmetrisch/leer.")
 
 def _clear_manual_input_C3_F16(sheet):
     # NUR hier löschen (dein Wunsch)
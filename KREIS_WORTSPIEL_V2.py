@@ -1,15 +1,33 @@
 # -*- coding: utf-8 -*-
 
-import uno
 import random
 from datetime import datetime, timedelta
-from com.sun.star.awt import Point, Size
+from com.sun.star.awt import Point
+
+# Shared helper (Scripts/python/pythonpath/kreis_scramble.py)
+from kreis_scramble import plan_scramble
+# Shared helper (Scripts/python/pythonpath/kreis_docprops.py)
+from kreis_docprops import ensure_layout
+# Shared helper (Scripts/python/pythonpath/kreis_layout.py)
+from kreis_layout import apply_row_heights, apply_col_widths
+# Shared helper (Scripts/python/pythonpath/kreis_styles.py)
+from kreis_styles import ensure_cell_styles, apply_style, STYLE_CENTER, STYLE_HEADER
+# Shared helper (Scripts/python/pythonpath/kreis_shapes.py)
+from kreis_shapes import CircleTemplate
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import message_box
+# Shared helper (Scripts/python/pythonpath/kreis_schema.py)
+from kreis_schema import (
+    get_schema, word_col0, read_block, iter_entries, write_rows,
+    col_letters as _schema_col_letters, F_WORD, F_USED_WORD, F_USED,
+)
 
 # ============================================================
 # KONFIG
 # ============================================================
 
 SHEET_NAME = "KREIS_WORTSPIEL"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout (kreis_schema.py)
 MARK_DESC  = "KREIS_Wortspiel_GUI"
 
 # Kreise: 3 Gruppen, je Gruppe 4 Kreise (C..F)
@@ -33,13 +51,14 @@ EF_ROWS   = (3, 6, 8, 11, 13, 16)
 GRID_ROWS = (4, 5, 9, 10, 14, 15)
 
 # Wortspalten (1. Zahl nur Info, genutzt wird der Spaltenbuchstabe)
-WORDLIST_COLS = {8: "AG", 5: "AN", 6: "AU", 7: "BB"}
+WORDLIST_COLS = {L: _schema_col_letters(word_col0(SCHEMA, L)) for L in (8, 5, 6, 7)}
 RANDOM_DAYS_LOCK = 30
 
 # Layout (minimal – kann erweitert werden)
 INIT_HEADER_RANGE = "B2:F2"
 INIT_CENTER_RANGE = "B2:F50"
 SHEET_INIT_FLAG   = "KREIS_WORTSPIEL_INIT_DONE"
+LAYOUT_VERSION = 2  # raise to re-run _init_sheet_layout once in existing documents
 
 U100MM_PER_CM = 1000
 def cm(v): return int(round(v * U100MM_PER_CM))
@@ -58,12 +77,7 @@ def _get_doc():
 
 def _msgbox(doc, title, message):
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "INFOBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "INFOBOX")
     except Exception:
         pass
 
@@ -77,27 +91,6 @@ def _format_messages(title: str, items: list, max_lines: int = 35) -> str:
     rest = len(items) - max_lines
     return f"{title} ({len(items)}):\n{head}\n...\n(+{rest} weitere)"
 
-def _doc_user_props(doc):
-    return doc.getDocumentProperties().getUserDefinedProperties()
-
-def _get_init_done(doc) -> bool:
-    props = _doc_user_props(doc)
-    try:
-        if props.hasByName(SHEET_INIT_FLAG):
-            return str(props.getPropertyValue(SHEET_INIT_FLAG)) == "1"
-    except Exception:
-        pass
-    return False
-
-def _set_init_done(doc):
-    props = _doc_user_props(doc)
-    try:
-        if not props.hasByName(SHEET_INIT_FLAG):
-            props.addProperty(SHEET_INIT_FLAG, 0, "0")
-        props.setPropertyValue(SHEET_INIT_FLAG, "1")
-    except Exception:
-        pass
-
 def _get_sheet(doc):
     try:
         return doc.Sheets.getByName(SHEET_NAME)
@@ -292,19 +285,16 @@ def _pick_random_word_from_lists(sheet):
     candidates = []
     cutoff = datetime.now() - timedelta(days=RANDOM_DAYS_LOCK)
 
-    for _L, col_letters in WORDLIST_COLS.items():
-        col0 = _col0_from_letters(col_letters)
-
-        for r in range(4, 600):
-            w = (_cell(sheet, col0, r).getString() or "").strip()
-            if not w:
-                continue
+    # one bulk read per block (kreis_schema.read_block) instead of a cell loop
+    for L, col_letters in WORDLIST_COLS.items():
+        for r, fields in iter_entries(SCHEMA, read_block(sheet, SCHEMA, L)):
+            w = fields[F_WORD]
 
             norm = _normalize_keep_umlauts_no_spaces(w)
             if not (5 <= len(norm) <= 8):
                 continue
 
-            used_dt = _parse_ts(_cell(sheet, col0 + 4, r).getString())
+            used_dt = _parse_ts(fields[F_USED])
             if used_dt is None or used_dt < cutoff:
                 candidates.append((w, col_letters, r))
 
@@ -315,8 +305,9 @@ def _pick_random_word_from_lists(sheet):
 
 def _mark_word_used(sheet, list_col_letters: str, row_1based: int, used_word: str):
     col0 = _col0_from_letters(list_col_letters)
-    _cell(sheet, col0 + 3, row_1based).setString(_to_upper_visual(used_word))
-    _cell(sheet, col0 + 4, row_1based).setString(_now_ts())
+    write_rows(sheet, SCHEMA, None, [
+        (row_1based, {F_USED_WORD: _to_upper_visual(used_word), F_USED: _now_ts()})
+    ], col0=col0)
 
 # ============================================================
 # Paare für Halbkreis holen: EF -> Grid -> Random (wenn EF+Grid leer)
@@ -385,82 +376,13 @@ def _get_pairs_for_half(sheet, title, ef_row_1based, grid_row_1based, allow_rand
 # SHAPES zeichnen / updaten
 # ============================================================
 
-def _mark_shape(shape, name_suffix):
-    try:
-        shape.Name = f"{MARK_DESC}_{name_suffix}"
-    except Exception:
-        pass
-    try:
-        shape.Description = MARK_DESC
-    except Exception:
-        pass
-
-def draw_text_center(doc, draw_page, cx, cy, text, name_suffix):
-    t = doc.createInstance("com.sun.star.drawing.TextShape")
-    _mark_shape(t, name_suffix)
-    draw_page.add(t)
-
-    text = _to_upper_visual(text)
-    w, h = 700, 700
-    t.Size = Size(w, h)
-    t.Position = Point(int(cx - w/2), int(cy - h/2))
-
-    try:
-        t.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "NONE")
-        t.LineStyle = uno.Enum("com.sun.star.drawing.LineStyle", "NONE")
-    except Exception:
-        pass
-
-    try:
-        t.String = text
-    except Exception:
-        try:
-            t.Text.setString(text)
-        except Exception:
-            pass
-
-    try:
-        t.CharHeight = CHAR_HEIGHT
-        t.CharWeight = 150
-        t.TextHorizontalAdjust = 1
-        t.TextVerticalAdjust   = 1
-    except Exception:
-        pass
-
-    return t
-
-def draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
-    line = doc.createInstance("com.sun.star.drawing.LineShape")
-    _mark_shape(line, name_suffix)
-    draw_page.add(line)
-    line.Position = Point(x1, y1)
-    line.Size = Size(x2 - x1, y2 - y1)
-    line.LineColor = 0x000000
+# Vorlage für Kreis + Kreuz + 4 Texte (kreis_shapes): Eigenschaften EINMAL vorbereitet,
+# je Shape EIN setPropertyValues statt Einzelzuweisungen
+_CIRCLE_TEMPLATE = CircleTemplate(MARK_DESC, char_height=CHAR_HEIGHT, bold=True, text_box=700)
 
 def draw_circle_with_quadrants(doc, draw_page, x, y, size, fill_color, label_texts, idx_tag):
-    circle = doc.createInstance("com.sun.star.drawing.EllipseShape")
-    _mark_shape(circle, f"circle_{idx_tag}")
-    draw_page.add(circle)
-
-    circle.Position  = Point(x, y)
-    circle.Size      = Size(size, size)
-    circle.FillColor = fill_color
-    circle.LineColor = 0x000000
-
-    cx = x + size // 2
-    cy = y + size // 2
-
-    draw_line(doc, draw_page, cx, y,  cx, y + size, f"vline_{idx_tag}")
-    draw_line(doc, draw_page, x,  cy, x + size, cy, f"hline_{idx_tag}")
-
-    q1x = x + size // 4
-    q3x = x + (3 * size) // 4
-    q1y = y + size // 4
-    q3y = y + (3 * size) // 4
-
-    centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]
-    for i, ((tcx, tcy), txt) in enumerate(zip(centers, label_texts), start=1):
-        draw_text_center(doc, draw_page, tcx, tcy, txt, f"text_{idx_tag}_{i}")
+    texts = [_to_upper_visual(t) for t in label_texts]
+    return _CIRCLE_TEMPLATE.draw(doc, draw_page, x, y, size, fill_color, texts, idx_tag)
 
 def _name_map_from_drawpage(dp):
     m = {}
@@ -504,15 +426,9 @@ def delete_all_circles(*args):
 # INIT Layout (minimal)
 # ============================================================
 
-def _set_center(rng):
-    rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-    rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
-
-def _set_bold_14(rng):
-    rng.CharHeight = 14
-    rng.CharWeight = uno.getConstantByName("com.sun.star.awt.FontWeight.BOLD")
-
 def _init_sheet_layout(doc, sheet):
+    ensure_cell_styles(doc)
+
     # Header
     sheet.getCellRangeByName("B2").setString("Bezeichnung")
     sheet.getCellRangeByName("C2").setString("Kreis \n-1-")
@@ -520,17 +436,17 @@ def _init_sheet_layout(doc, sheet):
     sheet.getCellRangeByName("E2").setString("Kreis \n-3-")
     sheet.getCellRangeByName("F2").setString("Kreis \n-4-")
 
+    # B2:F50 mittig (hori + vert), danach die fetten Bereiche darüber (Vorlagen, kreis_styles)
+    apply_style(sheet.getCellRangeByName(INIT_CENTER_RANGE), STYLE_CENTER)
+
     hdr = sheet.getCellRangeByName(INIT_HEADER_RANGE)
-    _set_center(hdr)
-    _set_bold_14(hdr)
+    apply_style(hdr, STYLE_HEADER)
 
     # Hinweis in Spalte B bei EF-Zeilen
     hint = "Begriffe\n(5–8)"
     for r in EF_ROWS:
         sheet.getCellByPosition(1, r - 1).setString(hint)
 
-    _set_center(sheet.getCellRangeByName(INIT_CENTER_RANGE))
-
     # EF-Zellen (E..F) mergen
     for r in EF_ROWS:
         r0 = r - 1
@@ -539,16 +455,11 @@ def _init_sheet_layout(doc, sheet):
             ef.merge(True)
         except Exception:
             pass
-        _set_center(ef)
-        _set_bold_14(ef)
+        apply_style(ef, STYLE_HEADER)
 
     # Spaltenbreiten
     cols = sheet.Columns
-    for col in range(2, 7):  # C..G
-        try:
-            cols.getByIndex(col).Width = INIT_COL_W_C_TO_G
-        except Exception:
-            pass
+    apply_col_widths(sheet, {col: INIT_COL_W_C_TO_G for col in range(2, 7)})  # C..G
 
     # Spalte B max Breite
     col_b = cols.getByIndex(1)
@@ -560,18 +471,11 @@ def _init_sheet_layout(doc, sheet):
         pass
 
     # Zeilenhöhen
-    rows = sheet.Rows
-    for r in INIT_ROWS_H17:
-        try:
-            rows.getByIndex(r - 1).Height = INIT_ROW_H_17
-        except Exception:
-            pass
+    apply_row_heights(sheet, {r: INIT_ROW_H_17 for r in INIT_ROWS_H17})
 
 def _ensure_initialized(doc, sheet):
-    if _get_init_done(doc):
-        return
-    _init_sheet_layout(doc, sheet)
-    _set_init_done(doc)
+    # formatting runs once per document and LAYOUT_VERSION
+    ensure_layout(doc, SHEET_INIT_FLAG, LAYOUT_VERSION, lambda d: _init_sheet_layout(d, sheet))
 
 # ============================================================
 # CREATE / UPDATE (mit allow_random-Option!)
@@ -717,8 +621,7 @@ def _row_top_y(sheet, row_1based):
 # SCRAMBLE (optional, keine Meldung außer Shapes fehlen)
 # ============================================================
 
-def _rotate_right(vals):
-    return [vals[2], vals[0], vals[3], vals[1]]
+MAX_SOLVED_CIRCLES = 2
 
 def scramble_all_circles_no_solution(*args):
     doc = _get_doc()
@@ -730,6 +633,8 @@ def scramble_all_circles_no_solution(*args):
     if not name_map:
         return
 
+    tags = []
+    bases = []
     for gi in range(len(GROUPS)):
         for c in range(NUM_COLS):
             idx_tag = f"b{gi}_c{c}"
@@ -743,19 +648,20 @@ def scramble_all_circles_no_solution(*args):
                 vals.append((sh.String or " ").strip()[:1] or " ")
             if not vals:
                 continue
-
-            steps = random.choice([0, 1, 2, 3])
-            v = vals
-            for _ in range(steps):
-                v = _rotate_right(v)
-
-            for q, val in enumerate(v, start=1):
-                sh = name_map.get(f"{MARK_DESC}_text_{idx_tag}_{q}")
-                if sh is not None:
-                    try:
-                        sh.String = val
-                    except Exception:
-                        pass
+            tags.append(idx_tag)
+            bases.append(vals)
+
+    # alle Kreise gemeinsam: 0° bleibt erlaubt, aber max. MAX_SOLVED_CIRCLES und nie die komplette Lösung
+    _steps, scrambled, _info = plan_scramble(bases, max_solved=MAX_SOLVED_CIRCLES, allow_solved=True)
+
+    for idx_tag, v in zip(tags, scrambled):
+        for q, val in enumerate(v, start=1):
+            sh = name_map.get(f"{MARK_DESC}_text_{idx_tag}_{q}")
+            if sh is not None:
+                try:
+                    sh.String = val
+                except Exception:
+                    pass
 
 # ============================================================
 # CLEAR INPUT C3:F16 (dein Wunsch)
@@ -1,14 +1,31 @@
 # -*- coding: utf-8 -*-
-import uno
 import random
 from datetime import datetime, timedelta
-from com.sun.star.awt import Point, Size
+
+# Shared helper (Scripts/python/pythonpath/kreis_scramble.py)
+from kreis_scramble import plan_scramble
+# Shared helper (Scripts/python/pythonpath/kreis_docprops.py)
+from kreis_docprops import ensure_layout
+# Shared helper (Scripts/python/pythonpath/kreis_schema.py)
+from kreis_schema import (
+    get_schema, word_col0, read_block, iter_entries, write_rows,
+    col_letters as _schema_col_letters, F_WORD, F_USED_WORD, F_USED,
+)
+# Shared helper (Scripts/python/pythonpath/kreis_archive.py)
+from kreis_archive import open_archive, word_key
+# Shared helper (Scripts/python/pythonpath/kreis_shapes.py)
+from kreis_shapes import CircleTemplate
+# Shared helper (Scripts/python/pythonpath/kreis_uno.py)
+from kreis_uno import hori, vert, message_box
 
 # =========================
 # KONFIG
 # =========================
 SHEET_NAME = "KREIS_WORTSPIEL"
+SCHEMA = get_schema(SHEET_NAME)  # word list layout (kreis_schema.py)
 MARK_DESC  = "KREIS_Wortspiel_GUI_V3"
+LAYOUT_FLAG = "KREIS_WORTSPIEL_V3_LAYOUT"  # Y/Z format once per document (user property)
+LAYOUT_VERSION = 1
 
 SUPPRESS_AUTO_RUN = False
 
@@ -29,10 +46,9 @@ ROW_COLORS = [0xCCE5FF, 0xFBE5B6, 0xCCFFCC]
 CHAR_HEIGHT = 16
 
 # Wortspalten (gleicher Sheet) + used-Spalten sind +3/+4
-WORDLIST_COLS = ["AG", "AN", "AU", "BB"]
+WORDLIST_LENS = (8, 5, 6, 7)
+WORDLIST_COLS = [_schema_col_letters(word_col0(SCHEMA, L)) for L in WORDLIST_LENS]
 RANDOM_DAYS_LOCK = 30
-WORDLIST_ROW_START = 4
-WORDLIST_ROW_END   = 500
 
 # Debug: True zeigt eine Info, wenn Random-Kandidaten = 0
 DEBUG = False
@@ -45,12 +61,7 @@ def _get_doc():
 
 def _msgbox(doc, title, message):
     try:
-        parent = doc.CurrentController.Frame.ContainerWindow
-        toolkit = parent.getToolkit()
-        buttons = uno.getConstantByName("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK")
-        box_type = uno.Enum("com.sun.star.awt.MessageBoxType", "INFOBOX")
-        box = toolkit.createMessageBox(parent, box_type, buttons, title, message)
-        box.execute()
+        message_box(doc, title, message, "INFOBOX")
     except Exception:
         pass
 
@@ -310,26 +321,30 @@ def _now_ts():
 
 def _mark_word_used(sheet, col_letters: str, row_1based: int, used_word: str):
     col0 = _col0_from_letters(col_letters)
-    _cell(sheet, col0 + 3, row_1based).setString(_to_upper_visual(used_word))
-    _cell(sheet, col0 + 4, row_1based).setString(_now_ts())
+    write_rows(sheet, SCHEMA, None, [
+        (row_1based, {F_USED_WORD: _to_upper_visual(used_word), F_USED: _now_ts()})
+    ], col0=col0)
 
-def _pick_random_word(sheet):
+def _pick_random_word(sheet, recent=None):
+    """
+    recent: {WORT: zuletzt benutzt} aus dem Rätsel-Archiv (kreis_archive) -> zählt wie die
+    Zeitstempel-Spalte (ein Wort aus einem anderen Dokument ist ebenfalls gesperrt)
+    """
     candidates = []
     cutoff = datetime.now() - timedelta(days=RANDOM_DAYS_LOCK)
+    recent = recent or {}
 
-    for col_letters in WORDLIST_COLS:
-        col0 = _col0_from_letters(col_letters)
-        for r in range(WORDLIST_ROW_START, WORDLIST_ROW_END):
-            w = (_cell(sheet, col0, r).getString() or "").strip()
-            if not w:
-                continue
-            norm = _normalize_keep_umlauts_no_spaces(w)
+    # one bulk read per block (kreis_schema.read_block) instead of a cell loop
+    for L, col_letters in zip(WORDLIST_LENS, WORDLIST_COLS):
+        for r, fields in iter_entries(SCHEMA, read_block(sheet, SCHEMA, L)):
+            norm = _normalize_keep_umlauts_no_spaces(fields[F_WORD])
             if not (5 <= len(norm) <= 8):
                 continue
 
-            used_dt = _parse_ts(_cell(sheet, col0 + 4, r).getString())
+            used_dt = _parse_ts(fields[F_USED])
             if used_dt is None or used_dt < cutoff:
-                candidates.append((norm, col_letters, r))
+                if word_key(norm) not in recent:
+                    candidates.append((norm, col_letters, r))
 
     if DEBUG:
         doc = _get_doc()
@@ -437,44 +452,34 @@ def _set_shape_text(sh, s: str):
             pass
 
 
-def _rotate_quad_texts(texts, steps_cw: int):
-    """
-    texts = [UL, UR, LL, LR] (entspricht Textshape _1,_2,_3,_4)
-    steps_cw: 0..3 (90° pro Schritt im Uhrzeigersinn)
-    """
-    steps_cw %= 4
-    if steps_cw == 0:
-        return texts[:]
-
-    # Uhrzeigersinn 90°: UL->UR, UR->LR, LR->LL, LL->UL
-    # also neues [UL,UR,LL,LR] aus altem:
-    # newUL = oldLL, newUR = oldUL, newLL = oldLR, newLR = oldUR  (für 90° CW)
-    def rot90(t):
-        ul, ur, ll, lr = t
-        return [ll, ul, lr, ur]
-
-    out = texts[:]
-    for _ in range(steps_cw):
-        out = rot90(out)
-    return out
-
-
-def _rotate_one_circle_letters(draw_page, idx_tag: str, steps_cw: int):
+def _scramble_circle_letters(draw_page, tags, max_solved: int = 1):
     """
-    Rotiert die Buchstaben innerhalb eines Kreises, indem die Texte der 4 TextShapes vertauscht werden.
-    steps_cw: 0..3
+    Rotiert die Buchstaben innerhalb der Kreise (tags), indem die Texte der 4 TextShapes vertauscht werden.
+    Alle Kreise werden gemeinsam geplant (kreis_scramble.plan_scramble):
+    - 0° ist erlaubt, aber höchstens max_solved Kreise bleiben in Ausgangsstellung
+      (symmetrische/leere Kreise zählen mit)
+    - nie die komplette Lösung, solange ein Kreis drehbar ist
     """
-    d = _get_circle_text_shapes(draw_page, idx_tag)
-    if len(d) != 4:
-        return  # Kreis (noch) nicht vorhanden oder Namen passen nicht
+    circles = []
+    for idx_tag in tags:
+        d = _get_circle_text_shapes(draw_page, idx_tag)
+        if len(d) != 4:
+            continue  # Kreis (noch) nicht vorhanden oder Namen passen nicht
+        shapes = [d[1], d[2], d[3], d[4]]
+        circles.append((shapes, [_get_shape_text(s) for s in shapes]))  # [UL,UR,LL,LR]
 
-    shapes = [d[1], d[2], d[3], d[4]]
-    texts = [_get_shape_text(s) for s in shapes]  # [UL,UR,LL,LR]
+    if not circles:
+        return
 
-    new_texts = _rotate_quad_texts(texts, steps_cw)
+    _steps, scrambled, _info = plan_scramble(
+        [texts for _shapes, texts in circles], max_solved=max_solved, allow_solved=True
+    )
 
-    for sh, tx in zip(shapes, new_texts):
-        _set_shape_text(sh, tx)
+    for (shapes, texts), new_texts in zip(circles, scrambled):
+        if new_texts == texts:
+            continue
+        for sh, tx in zip(shapes, new_texts):
+            _set_shape_text(sh, tx)
 
 def _rotate_block_if_two_random(draw_page, gi: int):
     """
@@ -484,16 +489,7 @@ def _rotate_block_if_two_random(draw_page, gi: int):
     (es muss keiner 0° haben).
     """
     tags = [f"b{gi}_c{c}" for c in range(NUM_COLS)]
-
-    # Standard: alle drehen (90/180/270)
-    steps_map = {tag: random.choice([1, 2, 3]) for tag in tags}
-
-    # optional: genau ein Kreis darf 0° behalten
-    if random.choice([True, False]):
-        steps_map[random.choice(tags)] = 0
-
-    for tag, steps in steps_map.items():
-        _rotate_one_circle_letters(draw_page, tag, steps)
+    _scramble_circle_letters(draw_page, tags, max_solved=1)
 
 
 # =========================
@@ -533,80 +529,14 @@ def delete_all_circles(*args):
     if DEBUG:
         _msgbox(doc, "Löschen", f"Entfernt: {removed}\nControls: {skipped}")
 
-def _mark_shape(shape, name_suffix):
-    try:
-        shape.Name = f"{MARK_DESC}_{name_suffix}"
-    except Exception:
-        pass
-    try:
-        shape.Description = MARK_DESC
-    except Exception:
-        pass
-
-def _draw_text_center(doc, draw_page, cx, cy, text, name_suffix):
-    t = doc.createInstance("com.sun.star.drawing.TextShape")
-    _mark_shape(t, name_suffix)
-    draw_page.add(t)
-
-    text = _to_upper_visual(text)
-    w, h = 700, 700
-    t.Size = Size(w, h)
-    t.Position = Point(int(cx - w/2), int(cy - h/2))
-
-    try:
-        t.FillStyle = uno.Enum("com.sun.star.drawing.FillStyle", "NONE")
-        t.LineStyle = uno.Enum("com.sun.star.drawing.LineStyle", "NONE")
-    except Exception:
-        pass
-
-    try:
-        t.String = text
-    except Exception:
-        try:
-            t.Text.setString(text)
-        except Exception:
-            pass
-
-    try:
-        t.CharHeight = CHAR_HEIGHT
-        t.CharWeight = 150
-        t.TextHorizontalAdjust = 1
-        t.TextVerticalAdjust   = 1
-    except Exception:
-        pass
-    return t
-
-def _draw_line(doc, draw_page, x1, y1, x2, y2, name_suffix):
-    line = doc.createInstance("com.sun.star.drawing.LineShape")
-    _mark_shape(line, name_suffix)
-    draw_page.add(line)
-    line.Position = Point(x1, y1)
-    line.Size = Size(x2 - x1, y2 - y1)
-    line.LineColor = 0x000000
+# Vorlage für Kreis + Kreuz + 4 Texte (kreis_shapes): Eigenschaften EINMAL vorbereitet,
+# je Shape EIN setPropertyValues statt Einzelzuweisungen (Linien heißen hier v_/h_)
+_CIRCLE_TEMPLATE = CircleTemplate(MARK_DESC, char_height=CHAR_HEIGHT, bold=True, text_box=700,
+                                  line_tags=("v", "h"))
 
 def _draw_circle(doc, draw_page, x, y, size, fill_color, quad, idx_tag):
-    circle = doc.createInstance("com.sun.star.drawing.EllipseShape")
-    _mark_shape(circle, f"circle_{idx_tag}")
-    draw_page.add(circle)
-
-    circle.Position  = Point(x, y)
-    circle.Size      = Size(size, size)
-    circle.FillColor = fill_color
-    circle.LineColor = 0x000000
-
-    cx = x + size // 2
-    cy = y + size // 2
-    _draw_line(doc, draw_page, cx, y,  cx, y + size, f"v_{idx_tag}")
-    _draw_line(doc, draw_page, x,  cy, x + size, cy, f"h_{idx_tag}")
-
-    q1x = x + size // 4
-    q3x = x + (3 * size) // 4
-    q1y = y + size // 4
-    q3y = y + (3 * size) // 4
-
-    centers = [(q1x,q1y), (q3x,q1y), (q1x,q3y), (q3x,q3y)]
-    for i, ((tcx,tcy), ch) in enumerate(zip(centers, quad), start=1):
-        _draw_text_center(doc, draw_page, tcx, tcy, ch, f"text_{idx_tag}_{i}")
+    texts = [_to_upper_visual(ch) for ch in quad]
+    return _CIRCLE_TEMPLATE.draw(doc, draw_page, x, y, size, fill_color, texts, idx_tag)
 
 # =========================
 # Prioritätsprüfung pro Halbkreis (EF -> GRID -> RANDOM)
@@ -641,6 +571,8 @@ def _pairs_for_half(sheet, title, ef_row, grid_row, state):
     # Das beendet DIE GANZE FUNKTION.
     # GRID und RANDOM werden dann NICHT mehr geprüft.
     if pairs is not None:
+        # fürs Archiv: EF enthält jetzt das bereinigte Wort
+        state["used"].append(_cell(sheet, 4, ef_row).getString())
         return pairs, ok, "EF"
     
     # ============================================================
@@ -672,6 +604,7 @@ def _pairs_for_half(sheet, title, ef_row, grid_row, state):
             _log_used_word(sheet, grid_row, _gword)
         except Exception:
             pass
+        state["used"].append(_gword)
 
         # WICHTIG:
         # Sobald GRID verwendet werden kann -> RETURN.
@@ -686,7 +619,7 @@ def _pairs_for_half(sheet, title, ef_row, grid_row, state):
         return ["  ", "  ", "  ", "  "], True, "EMPTY"
 
     # Zufälliges Wort aus den Wortlisten holen
-    w, col_letters, row1 = _pick_random_word(sheet)
+    w, col_letters, row1 = _pick_random_word(sheet, state["recent"])
     
     # Wenn kein Kandidat gefunden: leer zurück
     if not w:
@@ -698,6 +631,7 @@ def _pairs_for_half(sheet, title, ef_row, grid_row, state):
     # Random-Wort nur in der Wortliste als benutzt markieren (+3/+4)
     _mark_word_used(sheet, col_letters, row1, w)
     state["remaining_random"] -= 1
+    state["used"].append(w)
 
     # Wort in 4 Paare (8 Plätze) -> Rest leer, letzter Einzelbuchstabe gepadded
     pairs = []
@@ -715,6 +649,25 @@ def _pairs_for_half(sheet, title, ef_row, grid_row, state):
 # =========================
 # LOG: Y/Z (Wort + Timestamp)
 # =========================
+# Y/Z zeigt nur den letzten Lauf; dauerhaft (append-only) steht jedes Rätsel im Archiv.
+
+def _archive_recent():
+    """{WORT: zuletzt benutzt} der letzten RANDOM_DAYS_LOCK Tage aus dem Archiv ({} bei Fehler)."""
+    try:
+        return open_archive().recent(RANDOM_DAYS_LOCK)
+    except Exception:
+        return {}
+
+def _archive_words(words):
+    """Alle Wörter eines Laufs als EIN Archiv-Eintrag (Fehler blockieren das Zeichnen nicht)."""
+    words = [w for w in words if (w or "").strip()]
+    if not words:
+        return
+    try:
+        open_archive().add(words, source=MARK_DESC)
+    except Exception:
+        pass
+
 LOG_WORD_COL = "Y"
 LOG_TS_COL   = "Z"
 
@@ -839,16 +792,8 @@ def rotate_letters_in_circles_and_clear_cells(*args):
                 for c in range(NUM_COLS):
                     tags.append(f"b{gi}_c{c}")
 
-            # Standard: alle drehen (1/2/3 = 90/180/270 cw; 3 entspricht 90° ccw)
-            steps_map = {tag: random.choice([1, 2, 3]) for tag in tags}
-
-            # Optional: genau 1 Kreis darf 0° behalten
-            if random.choice([True, False]):
-                steps_map[random.choice(tags)] = 0
-
-            # Anwenden
-            for tag, steps in steps_map.items():
-                _rotate_one_circle_letters(dp, tag, steps)
+            # alle drehen (90/180/270), höchstens 1 Kreis darf 0° behalten – gemeinsam geplant
+            _scramble_circle_letters(dp, tags, max_solved=1)
 
             # Eingabebereich leeren (Format bleibt)
             _clear_cells_keep_format(sheet, "C3:F17")
@@ -874,8 +819,8 @@ def _init_yz_format(sheet, rows: int = 100):
     """
     try:
         rng = sheet.getCellRangeByName(f"Y1:Z{rows}")
-        rng.HoriJustify = uno.Enum("com.sun.star.table.CellHoriJustify", "CENTER")
-        rng.VertJustify = uno.Enum("com.sun.star.table.CellVertJustify", "CENTER")
+        rng.HoriJustify = hori("CENTER")
+        rng.VertJustify = vert("CENTER")
         rng.CharHeight = 12
     except Exception:
         pass
@@ -895,7 +840,7 @@ def run_wordspiel_button(*args):
     
     _commit_current_cell_input(doc)
     _park_cursor_priority(doc, sheet)
-    _init_yz_format(sheet, rows=100)
+    ensure_layout(doc, LAYOUT_FLAG, LAYOUT_VERSION, lambda d: _init_yz_format(sheet, rows=100))
 
     # 1) Ziel J2 (wie viele Halbkreise via Random füllen dürfen)
     target = _read_j2_target(sheet, default=6)
@@ -914,7 +859,8 @@ def run_wordspiel_button(*args):
     if remaining_random < 0:
         remaining_random = 0
 
-    state = {"remaining_random": remaining_random, "msgs": []}
+    # used: Wörter dieses Laufs (-> Archiv), recent: Archiv-Sperrliste für RANDOM
+    state = {"remaining_random": remaining_random, "msgs": [], "used": [], "recent": _archive_recent()}
 
     doc.lockControllers()
     try:
@@ -960,6 +906,8 @@ def run_wordspiel_button(*args):
         except Exception:
             pass
 
+    _archive_words(state["used"])
+
     if state["msgs"]:
         _msgbox(doc, "Hinweise", "\n".join(state["msgs"]))
 
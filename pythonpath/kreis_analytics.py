@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_analytics.py  (shared helper, no UNO) + CLI
+
+Auswertung der Wortlisten (KREIS_WORTRAETSEL, Blöcke AG..CD, Länge 5..12):
+- Listengröße, in den letzten 30 Tagen benutzt, nie benutzt
+- frische Wörter (= was _pick_random_with_30day_rule bevorzugt) und Reichweite in Tagen
+  bei der aktuellen Nutzungsrate (benutzt in 30 Tagen / 30)
+- Buchstaben- und Paarhäufigkeit (Paare = 2er-Stücke je Kreis)
+
+Eingabe ist immer EIN 2D-Block (getDataArray bzw. CSV-Export), keine Einzelzellen.
+
+CLI (CSV-Export des ganzen Blatts, Spalte A = erste Spalte):
+    python kreis_analytics.py export.csv [--start-row 4] [--days 30] [--delimiter ";"]
+"""
+
+import argparse
+import csv
+import sys
+from collections import Counter
+from datetime import datetime, timedelta
+
+from kreis_model import num_circles_for_len
+from kreis_schema import get_schema, word_col0, field_offset, SHEET_WORTRAETSEL, BLOCK_STEP, F_USED
+
+# Layout KREIS_WORTRAETSEL (kreis_schema): Wort in AG + 7*(L-5), Import-Zeitstempel +1, "benutzt" +2
+_SCHEMA = get_schema(SHEET_WORTRAETSEL)
+WORDLIST_LEN_MIN = _SCHEMA["len_min"]
+WORDLIST_LEN_MAX = _SCHEMA["len_max"]
+WORDLIST_BASE_COL0 = word_col0(_SCHEMA, WORDLIST_LEN_MIN)  # AG
+WORDLIST_BLOCK_STEP = BLOCK_STEP
+USED_COL_OFFSET = field_offset(_SCHEMA, F_USED)
+WORDLIST_START_ROW_1BASED = _SCHEMA["start_row"]
+WORDLIST_MAX_ROWS = _SCHEMA["max_rows"]
+RECENT_DAYS = 30
+TOP_N = 8
+
+
+def wordlist_layout(base_col0=WORDLIST_BASE_COL0, step=WORDLIST_BLOCK_STEP, used_offset=USED_COL_OFFSET,
+                    len_min=WORDLIST_LEN_MIN, len_max=WORDLIST_LEN_MAX):
+    """{L: (wort_spalte0, benutzt_spalte0)}"""
+    return {L: (base_col0 + (L - len_min) * step, base_col0 + (L - len_min) * step + used_offset)
+            for L in range(len_min, len_max + 1)}
+
+
+def layout_col_span(layout):
+    """(erste_spalte0, letzte_spalte0) – Bereich für EINEN getDataArray-Aufruf."""
+    cols = [c for pair in layout.values() for c in pair]
+    return min(cols), max(cols)
+
+
+# ============================================================
+# 1) HILFEN
+# ============================================================
+
+def normalize_crossword(raw: str) -> str:
+    """Wie in den Makros: groß, ÄÖÜ -> AE/OE/UE, ß -> SS, nur A-Z."""
+    s = (raw or "").strip().upper()
+    s = (s.replace("Ä", "AE").replace("Ö", "OE").replace("Ü", "UE")
+          .replace("ß", "SS").replace("ẞ", "SS"))
+    return "".join(ch for ch in s if "A" <= ch <= "Z")
+
+
+def parse_ts(value):
+    s = str(value or "").strip()
+    if not s:
+        return None
+    for fmt in ("%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(s, fmt)
+        except Exception:
+            pass
+    return None
+
+
+def _cell(rows, r, c):
+    try:
+        return rows[r][c]
+    except (IndexError, TypeError):
+        return ""
+
+
+# ============================================================
+# 2) AUSWERTUNG
+# ============================================================
+
+def analyze_rows(rows, layout=None, col0_offset=0, now=None, recent_days=RECENT_DAYS, top_n=TOP_N):
+    """
+    rows:        2D-Daten (Zeilen = Listenzeilen ab Startzeile)
+    layout:      {L: (wort_spalte0, benutzt_spalte0)} absolut im Blatt
+    col0_offset: Blatt-Spalte von rows[*][0] (getDataArray ab AG -> 32, CSV -> 0)
+    Returns: {L: {"size", "recent", "never", "fresh", "rate_per_day", "days_left",
+                  "letters", "pairs"}}
+    """
+    layout = layout or wordlist_layout()
+    now = now or datetime.now()
+    cutoff = now - timedelta(days=recent_days)
+
+    stats = {}
+    for L, (wcol, ucol) in sorted(layout.items()):
+        wi = wcol - col0_offset
+        ui = ucol - col0_offset
+        cap = 2 * num_circles_for_len(L)
+
+        size = recent = never = 0
+        letters = Counter()
+        pairs = Counter()
+
+        for r in range(len(rows)):
+            w = normalize_crossword(str(_cell(rows, r, wi) or ""))
+            if len(w) != L:
+                continue
+            size += 1
+            used = parse_ts(_cell(rows, r, ui))
+            if used is None:
+                never += 1
+            elif used >= cutoff:
+                recent += 1
+            letters.update(w)
+            padded = w.ljust(cap)
+            pairs.update(padded[i:i + 2] for i in range(0, cap, 2) if padded[i:i + 2].strip())
+
+        fresh = size - recent
+        rate = recent / float(recent_days) if recent_days else 0.0
+        stats[L] = {
+            "size": size,
+            "recent": recent,
+            "never": never,
+            "fresh": fresh,
+            "rate_per_day": round(rate, 2),
+            "days_left": round(fresh / rate, 1) if rate > 0 else None,
+            "letters": letters.most_common(top_n),
+            "pairs": pairs.most_common(top_n),
+        }
+    return stats
+
+
+def format_report(stats, with_frequencies=True):
+    """Text für MsgBox / Konsole."""
+    lines = ["Länge | Liste | 30 Tage | nie | frisch | pro Tag | reicht (Tage)"]
+    for L, s in sorted(stats.items()):
+        days = "∞" if s["days_left"] is None else str(s["days_left"]).replace(".", ",")
+        rate = str(s["rate_per_day"]).replace(".", ",")
+        lines.append(f"{L:>5} | {s['size']:>5} | {s['recent']:>7} | {s['never']:>3} | "
+                     f"{s['fresh']:>6} | {rate:>7} | {days}")
+    if with_frequencies:
+        for L, s in sorted(stats.items()):
+            if not s["size"]:
+                continue
+            lt = " ".join(f"{ch}:{n}" for ch, n in s["letters"])
+            pr = " ".join(f"{p.strip()}:{n}" for p, n in s["pairs"])
+            lines.append(f"{L}: Buchstaben {lt}")
+            lines.append(f"{L}: Paare {pr}")
+    return "\n".join(lines)
+
+
+# ============================================================
+# 3) CLI (CSV-Export)
+# ============================================================
+
+def read_csv_rows(path, start_row_1based=WORDLIST_START_ROW_1BASED, max_rows=WORDLIST_MAX_ROWS,
+                  delimiter=None):
+    """Liest nur die Listenzeilen (ab start_row, max. max_rows) aus einem CSV-Export."""
+    rows = []
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if delimiter is None:
+            # häufigstes Trennzeichen im Anfang der Datei (csv.Sniffer scheitert an leeren Spalten)
+            sample = f.read(65536)
+            f.seek(0)
+            delimiter = max((",", ";", "\t"), key=sample.count)
+        for i, row in enumerate(csv.reader(f, delimiter=delimiter), start=1):
+            if i < start_row_1based:
+                continue
+            if len(rows) >= max_rows:
+                break
+            rows.append(row)
+    return rows
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Wortlisten-Auswertung (CSV-Export von KREIS_WORTRAETSEL)")
+    ap.add_argument("csv_path")
+    ap.add_argument("--start-row", type=int, default=WORDLIST_START_ROW_1BASED)
+    ap.add_argument("--max-rows", type=int, default=WORDLIST_MAX_ROWS)
+    ap.add_argument("--days", type=int, default=RECENT_DAYS)
+    ap.add_argument("--delimiter", default=None)
+    ap.add_argument("--no-frequencies", action="store_true")
+    args = ap.parse_args(argv)
+
+    rows = read_csv_rows(args.csv_path, args.start_row, args.max_rows, args.delimiter)
+    stats = analyze_rows(rows, wordlist_layout(), col0_offset=0, recent_days=args.days)
+    print(format_report(stats, with_frequencies=not args.no_frequencies))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
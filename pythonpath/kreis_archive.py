@@ -0,0 +1,283 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_archive.py  (shared helper, no UNO) + CLI
+
+Rätsel-Archiv: jedes erzeugte Rätsel wird angehängt (nie überschrieben), mit Index nach
+Wort und Datum. Ersetzt das Suchen in Zeitstempel-Spalten und im Y/Z-Log (wird je Lauf
+überschrieben) für Fragen wie "wann war BAUMHAUS zuletzt dran?" und die 30-Tage-Regel.
+
+- SQLite (Standardbibliothek): Tabellen puzzles + uses, Index auf (word, used) und (used)
+- Fallback ohne sqlite3 (manche LibreOffice-Python-Builds): JSON-Lines-Datei,
+  eine Zeile je Rätsel, Index wird beim Laden im Speicher aufgebaut
+- beide mit derselben API: add, last_used, history, recent, between, count
+
+Zeitstempel als Text "JJJJ-MM-TT HH:MM" (wie die Listen-Spalten) -> sortierbar.
+Wörter werden als Großbuchstaben gespeichert ("ß" bleibt ein Zeichen).
+
+Ablage: ~/kreis_raetsel_archiv.sqlite (bzw. .jsonl), Umgebungsvariable KREIS_ARCHIV überschreibt.
+
+CLI:
+    python kreis_archive.py last BAUMHAUS [HAUSBOOT ...]
+    python kreis_archive.py history BAUMHAUS
+    python kreis_archive.py between 2024-05-01 2024-05-31
+    python kreis_archive.py recent [--days 30]
+"""
+
+import argparse
+import json
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from contextlib import closing
+from datetime import datetime, timedelta
+
+try:
+    import sqlite3
+except Exception:
+    sqlite3 = None
+
+TS_FORMAT = "%Y-%m-%d %H:%M"
+ARCHIVE_NAME = "kreis_raetsel_archiv"
+RECENT_DAYS = 30
+
+
+def word_key(word: str) -> str:
+    return (word or "").strip().replace("ß", "ẞ").upper()
+
+
+def _now_str():
+    return datetime.now().strftime(TS_FORMAT)
+
+
+def _cutoff(days, now=None):
+    return ((now or datetime.now()) - timedelta(days=days)).strftime(TS_FORMAT)
+
+
+def _until(ts: str) -> str:
+    """Nur Datum -> ganzer Tag eingeschlossen."""
+    return ts + " 23:59" if len(ts) == 10 else ts
+
+
+def _unique_keys(words):
+    keys = []
+    for w in words:
+        k = word_key(w)
+        if k and k not in keys:
+            keys.append(k)
+    return keys
+
+
+def default_archive_path(sqlite=None) -> str:
+    env = os.environ.get("KREIS_ARCHIV")
+    if env:
+        return env
+    if sqlite is None:
+        sqlite = sqlite3 is not None
+    return os.path.join(os.path.expanduser("~"), ARCHIVE_NAME + (".sqlite" if sqlite else ".jsonl"))
+
+
+# ============================================================
+# 1) SQLITE
+# ============================================================
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS puzzles (
+    id      INTEGER PRIMARY KEY,
+    created TEXT NOT NULL,
+    source  TEXT NOT NULL DEFAULT '',
+    data    TEXT
+);
+CREATE TABLE IF NOT EXISTS uses (
+    word      TEXT NOT NULL,
+    used      TEXT NOT NULL,
+    puzzle_id INTEGER NOT NULL REFERENCES puzzles(id),
+    source    TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS uses_word ON uses(word, used);
+CREATE INDEX IF NOT EXISTS uses_used ON uses(used);
+CREATE INDEX IF NOT EXISTS puzzles_created ON puzzles(created);
+"""
+
+
+class SqliteArchive:
+    def __init__(self, path: str):
+        self.path = path
+        with closing(self._connect()) as con:
+            con.executescript(_SCHEMA_SQL)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def add(self, words, when=None, source="", data=None) -> int:
+        """Ein Rätsel anhängen. Returns: Rätsel-ID."""
+        when = when or _now_str()
+        with closing(self._connect()) as con, con:
+            cur = con.execute("INSERT INTO puzzles (created, source, data) VALUES (?, ?, ?)",
+                              (when, source, None if data is None else json.dumps(data, ensure_ascii=False)))
+            pid = cur.lastrowid
+            con.executemany("INSERT INTO uses (word, used, puzzle_id, source) VALUES (?, ?, ?, ?)",
+                            [(k, when, pid, source) for k in _unique_keys(words)])
+        return pid
+
+    def last_used(self, word: str):
+        with closing(self._connect()) as con:
+            row = con.execute("SELECT MAX(used) FROM uses WHERE word = ?", (word_key(word),)).fetchone()
+        return row[0] if row else None
+
+    def history(self, word: str):
+        """[(used, puzzle_id, source)] aufsteigend."""
+        with closing(self._connect()) as con:
+            return con.execute("SELECT used, puzzle_id, source FROM uses WHERE word = ? ORDER BY used",
+                               (word_key(word),)).fetchall()
+
+    def recent(self, days=RECENT_DAYS, now=None):
+        """{wort: zuletzt benutzt} für alle Wörter der letzten `days` Tage."""
+        with closing(self._connect()) as con:
+            return dict(con.execute("SELECT word, MAX(used) FROM uses WHERE used >= ? GROUP BY word",
+                                    (_cutoff(days, now),)))
+
+    def between(self, since: str, until: str):
+        """Rätsel mit since <= created <= until (Datum oder Zeitstempel)."""
+        with closing(self._connect()) as con:
+            rows = con.execute("SELECT id, created, source, data FROM puzzles "
+                               "WHERE created >= ? AND created <= ? ORDER BY created, id",
+                               (since, _until(until))).fetchall()
+            out = []
+            for pid, created, source, data in rows:
+                words = [w for (w,) in con.execute("SELECT word FROM uses WHERE puzzle_id = ?", (pid,))]
+                out.append({"id": pid, "created": created, "source": source, "words": words,
+                            "data": json.loads(data) if data else None})
+        return out
+
+    def count(self) -> int:
+        with closing(self._connect()) as con:
+            return con.execute("SELECT COUNT(*) FROM puzzles").fetchone()[0]
+
+
+# ============================================================
+# 2) JSON-LINES (Fallback)
+# ============================================================
+
+class JsonlArchive:
+    """Eine Zeile je Rätsel; Index nach Wort/Datum im Speicher, neu geladen wenn die Datei wächst."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._stamp = None
+        self._puzzles = []   # nach created sortiert
+        self._created = []   # parallele Schlüsselliste für bisect
+        self._by_word = {}   # wort -> [(used, id, source)] sortiert
+
+    def _load(self):
+        try:
+            st = os.stat(self.path)
+            stamp = (st.st_size, st.st_mtime)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return
+        puzzles = []
+        if stamp is not None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        puzzles.append(json.loads(line))
+                    except ValueError:
+                        continue  # abgebrochene letzte Zeile
+        puzzles.sort(key=lambda p: (p["created"], p["id"]))
+        by_word = {}
+        for p in puzzles:
+            for w in p["words"]:
+                by_word.setdefault(w, []).append((p["created"], p["id"], p.get("source", "")))
+        for uses in by_word.values():
+            uses.sort()
+        self._puzzles = puzzles
+        self._created = [p["created"] for p in puzzles]
+        self._by_word = by_word
+        self._stamp = stamp
+
+    def add(self, words, when=None, source="", data=None) -> int:
+        self._load()
+        pid = max((p["id"] for p in self._puzzles), default=0) + 1
+        rec = {"id": pid, "created": when or _now_str(), "source": source,
+               "words": _unique_keys(words), "data": data}
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(rec, ensure_ascii=False, separators=(",", ":")) + "\n")
+        return pid
+
+    def last_used(self, word: str):
+        self._load()
+        uses = self._by_word.get(word_key(word))
+        return uses[-1][0] if uses else None
+
+    def history(self, word: str):
+        self._load()
+        return list(self._by_word.get(word_key(word), []))
+
+    def recent(self, days=RECENT_DAYS, now=None):
+        self._load()
+        out = {}
+        for p in self._puzzles[bisect_left(self._created, _cutoff(days, now)):]:
+            for w in p["words"]:
+                out[w] = p["created"]  # aufsteigend -> letzter gewinnt
+        return out
+
+    def between(self, since: str, until: str):
+        self._load()
+        lo = bisect_left(self._created, since)
+        hi = bisect_right(self._created, _until(until))
+        return [dict(p) for p in self._puzzles[lo:hi]]
+
+    def count(self) -> int:
+        self._load()
+        return len(self._puzzles)
+
+
+def open_archive(path: str = None):
+    """SQLite, wenn verfügbar und path nicht auf .jsonl endet; sonst JSON-Lines."""
+    path = path or default_archive_path()
+    if sqlite3 is not None and not path.endswith(".jsonl"):
+        return SqliteArchive(path)
+    return JsonlArchive(path)
+
+
+# ============================================================
+# 3) CLI
+# ============================================================
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Kreis-Rätsel-Archiv abfragen")
+    ap.add_argument("--archive", default=None, help="Archivdatei (.sqlite oder .jsonl)")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p = sub.add_parser("last", help="wann zuletzt benutzt")
+    p.add_argument("words", nargs="+")
+    p = sub.add_parser("history", help="alle Verwendungen eines Worts")
+    p.add_argument("word")
+    p = sub.add_parser("between", help="Rätsel in einem Zeitraum")
+    p.add_argument("since")
+    p.add_argument("until")
+    p = sub.add_parser("recent", help="Wörter der letzten Tage")
+    p.add_argument("--days", type=int, default=RECENT_DAYS)
+    args = ap.parse_args(argv)
+
+    arc = open_archive(args.archive)
+    if args.cmd == "last":
+        for w in args.words:
+            print(f"{word_key(w)}: {arc.last_used(w) or 'nie'}")
+    elif args.cmd == "history":
+        for used, pid, source in arc.history(args.word):
+            print(f"{used}  #{pid}  {source}")
+    elif args.cmd == "between":
+        for rec in arc.between(args.since, args.until):
+            print(f"{rec['created']}  #{rec['id']}  {rec['source']}  {' '.join(rec['words'])}")
+    else:
+        for w, used in sorted(arc.recent(args.days).items(), key=lambda x: x[1]):
+            print(f"{used}  {w}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
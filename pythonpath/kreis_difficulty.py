@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_difficulty.py  (shared helper, no UNO)
+
+Schätzt den Lösungsaufwand eines Kreis-Rätsels (Heuristik, Einheit ~ "Bit").
+
+Bestandteile:
+- search_bits:  log2 der Drehstellungen, die ein Löser durchprobieren müsste
+                (symmetrische Kreise haben 1-2 statt 4 Stellungen, Kreise in
+                Lösungsstellung zählen nicht)
+- readings:     je Kreiszeile die Zahl der Drehkombinationen, bei denen oben UND unten
+                ein Wort aus der Wortliste steht (1 = eindeutig, >1 = Mehrdeutigkeit)
+- commonness:   mittlere Buchstabenhäufigkeit (häufige Buchstaben = weniger Anker)
+
+readings hängen nur von der Lösungsstellung ab, nicht von der Mischung: sie werden
+einmal je Rätsel mit dem Löser aus kreis_solver.py gezählt (Tiefensuche mit
+Präfix-Abbruch). make_scramble_score_fn rechnet je Mischungs-Kandidat nur noch
+search_bits und commonness.
+"""
+
+import math
+
+from kreis_rotation import rotate_quad, symmetry_class, DISTINCT_POSITIONS, SYM_FULL
+from kreis_solver import count_row_solutions
+
+# Buchstabenhäufigkeit Deutsch (Prozent, Kreuzworträtsel-Schreibweise ohne Umlaute)
+DE_LETTER_FREQ = {
+    "E": 16.4, "N": 9.8, "I": 7.6, "S": 7.3, "R": 7.0, "A": 6.5, "T": 6.2,
+    "D": 5.1, "H": 4.8, "U": 4.2, "L": 3.4, "C": 3.1, "G": 3.0, "M": 2.5,
+    "O": 2.5, "B": 1.9, "W": 1.9, "F": 1.7, "K": 1.2, "Z": 1.1, "P": 0.8,
+    "V": 0.7, "J": 0.3, "Y": 0.04, "X": 0.03, "Q": 0.02,
+}
+
+# Gewichte der Bestandteile (Feintuning hier)
+W_SEARCH = 1.0
+W_AMBIGUITY = 3.0
+W_COMMON = 0.5
+
+READINGS_LIMIT = 64  # Zählung je Zeile abbrechen (Mehrdeutigkeit ist dann ohnehin hoch)
+
+
+# ============================================================
+# 1) SCORE
+# ============================================================
+
+def row_readings(rows, index):
+    """Lesarten je Kreiszeile (gedeckelt bei READINGS_LIMIT); [] ohne Index."""
+    if index is None:
+        return []
+    return [count_row_solutions(quads, index, READINGS_LIMIT) for quads in rows]
+
+
+def score_puzzle(rows, index=None, steps=None, letter_freq=None, readings=None):
+    """
+    rows:  Liste von Kreiszeilen (je Liste von [UL, UR, LL, LR]) in Lösungsstellung
+    index: kreis_solver.build_word_index(...) oder None (dann keine Mehrdeutigkeits-Prüfung)
+    steps: optional flache Liste der Scramble-Schritte (Reihenfolge wie rows)
+           -> Kreise mit 0 Schritten stehen schon richtig und kosten nichts
+    readings: optional vorberechnet (row_readings) -> index wird nicht mehr durchsucht
+    Returns: dict {"score", "search_bits", "ambiguity_bits", "readings",
+                   "symmetric", "solved", "commonness"}
+    """
+    freq = letter_freq or DE_LETTER_FREQ
+    max_freq = max(freq.values()) if freq else 1.0
+
+    search_bits = 0.0
+    symmetric = 0
+    solved = 0
+    freq_sum = 0.0
+    letters = 0
+
+    k = 0
+    for quads in rows:
+        for q in quads:
+            sym = symmetry_class(q)
+            if sym == SYM_FULL:
+                symmetric += 1
+            step = steps[k] if steps is not None and k < len(steps) else None
+            k += 1
+            if step is not None and rotate_quad(q, step) == q:
+                solved += 1
+                continue
+            search_bits += math.log2(DISTINCT_POSITIONS[sym])
+            for ch in q:
+                if ch != " ":
+                    freq_sum += freq.get(ch, 0.0)
+                    letters += 1
+
+    if readings is None:
+        readings = row_readings(rows, index)
+    ambiguity_bits = sum(math.log2(r) for r in readings if r > 1)
+
+    commonness = (freq_sum / letters / max_freq) if letters else 0.0
+
+    score = (W_SEARCH * search_bits
+             + W_AMBIGUITY * ambiguity_bits
+             + W_COMMON * search_bits * commonness)
+
+    return {
+        "score": round(score, 3),
+        "search_bits": round(search_bits, 3),
+        "ambiguity_bits": round(ambiguity_bits, 3),
+        "readings": readings,
+        "symmetric": symmetric,
+        "solved": solved,
+        "commonness": round(commonness, 3),
+    }
+
+
+def make_scramble_score_fn(rows, index=None, letter_freq=None, readings=None):
+    """
+    Adapter für kreis_scramble.plan_scramble(score_fn=...).
+    Lesarten werden nur einmal gezählt (oder als readings übernommen, z.B. aus score_puzzle).
+    """
+    if readings is None:
+        readings = row_readings(rows, index)
+
+    def _fn(steps, _scrambled):
+        return score_puzzle(rows, None, steps, letter_freq, readings=readings)["score"]
+    return _fn
@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_docprops.py  (shared helper, no UNO imports – arbeitet auf dem übergebenen Dokument)
+
+Benutzerdefinierte Dokumenteigenschaften (Datei > Eigenschaften > Benutzerdefiniert)
+und Layout-Versionen:
+
+- Jedes Makro-Modul hat einen Schlüssel (z.B. "KREIS_GUI_INIT_DONE") und eine LAYOUT_VERSION.
+- Gespeichert wird die Versionsnummer als Text; der alte Init-Flag "1" zählt als Version 1
+  (bestehende Dokumente werden also nicht erneut formatiert).
+- ensure_layout: Formatierung genau EINMAL je Dokument und Version (statt bei jedem Klick),
+  vorher Migrationsschritte für alle übersprungenen Versionen.
+"""
+
+
+def user_props(doc):
+    return doc.getDocumentProperties().getUserDefinedProperties()
+
+
+def get_user_prop(doc, name: str, default=None):
+    try:
+        props = user_props(doc)
+        if props.hasByName(name):
+            return props.getPropertyValue(name)
+    except Exception:
+        pass
+    return default
+
+
+def set_user_prop(doc, name: str, value: str) -> bool:
+    try:
+        props = user_props(doc)
+        if not props.hasByName(name):
+            props.addProperty(name, 0, "0")
+        props.setPropertyValue(name, str(value))
+        return True
+    except Exception:
+        return False
+
+
+def stored_layout_version(doc, key: str) -> int:
+    """0 = nie formatiert; alter Flag "1" = Version 1."""
+    v = get_user_prop(doc, key, "")
+    try:
+        return int(float(str(v).strip() or 0))
+    except ValueError:
+        return 0
+
+
+def layout_is_current(doc, key: str, version: int) -> bool:
+    return stored_layout_version(doc, key) >= version
+
+
+def ensure_layout(doc, key: str, version: int, apply_fn, migrations=None, force: bool = False) -> bool:
+    """
+    apply_fn(doc):  komplette Formatierung
+    migrations:     {ziel_version: fn(doc)} – Datenanpassungen, die vor apply_fn für jede
+                    Version zwischen gespeicherter und aktueller laufen (aufsteigend).
+                    Ein Schritt, der nicht auf einmal fertig wird, merkt sich seinen Rest selbst
+                    (eigene Dokumenteigenschaft) – die Layout-Version gilt nach apply_fn.
+    force:          trotzdem formatieren (z.B. explizites Init-Makro)
+    Returns: True, wenn formatiert wurde. Die Version wird erst nach Erfolg gespeichert.
+    """
+    stored = stored_layout_version(doc, key)
+    if stored >= version and not force:
+        return False
+    for v in sorted(migrations or {}):
+        if stored < v <= version:
+            migrations[v](doc)
+    apply_fn(doc)
+    set_user_prop(doc, key, max(stored, version))
+    return True
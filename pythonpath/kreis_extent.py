@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_extent.py  (shared helper, no UNO imports – arbeitet nur auf übergebenen Sheet-Objekten)
+
+Letzte belegte Zeile je Spalte, für viele Spalten auf einmal und pro Lauf gecacht.
+
+Statt je Spalte Cursor -> ganzer Used Area -> Zelle für Zelle nach oben:
+- Used Area EINMAL je Lauf bestimmen
+- queryContentCells(VALUE|DATETIME|FORMULA) über alle gewünschten Spalten
+  (EIN Aufruf, liefert nur belegte Teilbereiche); Textzellen extra (STRING) und nur mit
+  sichtbarem Inhalt – reiner Leerraum zählt nicht (wie kreis_schema.count_words)
+- Fallback: EIN getDataArray über denselben Block
+
+Dieselbe Abfrage liefert die belegten Zeilenbereiche je Spalte -> count() zählt belegte Zellen
+ohne die Werte zu lesen.
+
+Zeilen sind 1-basiert, Spalten 0-basiert (wie getCellByPosition).
+"""
+
+from kreis_schema import cell_text
+
+CONTENT_FLAGS = 1 | 2 | 16  # com.sun.star.sheet.CellFlags VALUE|DATETIME|FORMULA
+STRING_FLAG = 4             # com.sun.star.sheet.CellFlags.STRING
+
+
+def _add_filled(ranges, c_first: int, r_first: int, data):
+    """Nicht-leere Zellen eines getDataArray-Blocks als Zeilenbereiche je Spalte anhängen."""
+    for r, row in enumerate(data, start=r_first):
+        for j, v in enumerate(row):
+            if cell_text(v) == "":
+                continue
+            runs = ranges.setdefault(c_first + j, [])
+            if runs and runs[-1][1] == r - 1:
+                runs[-1] = (runs[-1][0], r)
+            else:
+                runs.append((r, r))
+
+
+def _merge(runs):
+    """Zeilenbereiche sortieren, überlappende/angrenzende zusammenfassen."""
+    out = []
+    for r1, r2 in sorted(runs):
+        if out and r1 <= out[-1][1] + 1:
+            out[-1] = (out[-1][0], max(out[-1][1], r2))
+        else:
+            out.append((r1, r2))
+    return out
+
+
+class ColumnExtents:
+    """Cache: Spalte -> letzte Zeile mit Inhalt (0 = leer). Gilt für einen Makrolauf."""
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self._last = {}
+        self._ranges = {}  # spalte -> [(erste_zeile, letzte_zeile)] belegter Bereiche
+        self._used_end = None
+        self._used_end_col = None
+
+    # ---------- intern ----------
+
+    def _used_area(self):
+        try:
+            cur = self.sheet.createCursor()
+            cur.gotoStartOfUsedArea(False)
+            cur.gotoEndOfUsedArea(True)
+            a = cur.RangeAddress
+            self._used_end, self._used_end_col = a.EndRow + 1, a.EndColumn
+        except Exception:
+            self._used_end, self._used_end_col = 0, -1
+
+    def used_end_row(self) -> int:
+        """Letzte Zeile der Used Area (1-basiert), einmal je Lauf."""
+        if self._used_end is None:
+            self._used_area()
+        return self._used_end
+
+    def used_end_col(self) -> int:
+        """Letzte Spalte der Used Area (0-basiert, -1 = leeres Blatt), einmal je Lauf."""
+        if self._used_end_col is None:
+            self._used_area()
+        return self._used_end_col
+
+    def _query(self, c_first: int, c_last: int, end_row: int):
+        """{spalte: [(erste, letzte)]} über queryContentCells (Text: Werte der Textbereiche lesen)."""
+        rng = self.sheet.getCellRangeByPosition(c_first, 0, c_last, end_row - 1)
+        ranges = {}
+        for a in rng.queryContentCells(CONTENT_FLAGS).getRangeAddresses():
+            for c in range(a.StartColumn, a.EndColumn + 1):
+                ranges.setdefault(c, []).append((a.StartRow + 1, a.EndRow + 1))
+        for a in rng.queryContentCells(STRING_FLAG).getRangeAddresses():
+            data = self.sheet.getCellRangeByPosition(a.StartColumn, a.StartRow,
+                                                     a.EndColumn, a.EndRow).getDataArray()
+            _add_filled(ranges, a.StartColumn, a.StartRow + 1, data)
+        return {c: _merge(runs) for c, runs in ranges.items()}
+
+    def _scan(self, c_first: int, c_last: int, end_row: int):
+        """{spalte: [(erste, letzte)]} über EIN getDataArray (Fallback)."""
+        data = self.sheet.getCellRangeByPosition(c_first, 0, c_last, end_row - 1).getDataArray()
+        ranges = {}
+        _add_filled(ranges, c_first, 1, data)
+        return ranges
+
+    # ---------- API ----------
+
+    def prefetch(self, cols0):
+        """Letzte Zeilen für alle cols0 (noch nicht im Cache) mit EINER Abfrage holen."""
+        missing = sorted(set(cols0) - set(self._last))
+        if not missing:
+            return
+        end_row = self.used_end_row()
+        ranges = {}
+        if end_row > 0:
+            try:
+                ranges = self._query(missing[0], missing[-1], end_row)
+            except Exception:
+                ranges = self._scan(missing[0], missing[-1], end_row)
+        for c in missing:
+            runs = ranges.get(c, [])
+            self._ranges[c] = runs
+            self._last[c] = max((r2 for _r1, r2 in runs), default=0)
+
+    def last_row(self, col0: int, start_row: int = 1) -> int:
+        """Letzte belegte Zeile ab start_row, sonst start_row - 1 (wie get_last_row_with_content)."""
+        if col0 not in self._last:
+            self.prefetch([col0])
+        last = self._last[col0]
+        return last if last >= start_row else start_row - 1
+
+    def first_empty_row(self, col0: int, start_row: int = 1) -> int:
+        return self.last_row(col0, start_row) + 1
+
+    def count(self, col0: int, start_row: int = 1) -> int:
+        """Anzahl belegter Zellen ab start_row (aus den Bereichen, ohne Werte zu lesen)."""
+        if col0 not in self._ranges:
+            self.prefetch([col0])
+        return sum(max(0, r2 - max(r1, start_row) + 1) for r1, r2 in self._ranges[col0])
+
+    def note_write(self, col0: int, row: int):
+        """Nach dem Schreiben in (col0, row): Cache nachziehen statt neu abfragen."""
+        if col0 in self._last and row > self._last[col0]:
+            self._last[col0] = row
+        runs = self._ranges.get(col0)
+        if runs is not None and not any(r1 <= row <= r2 for r1, r2 in runs):
+            runs.append((row, row))
+        if self._used_end is not None and row > self._used_end:
+            self._used_end = row
+
+    def invalidate(self, col0: int = None):
+        """Nach Löschen/Kompaktieren: eine Spalte (oder alles) neu abfragen."""
+        if col0 is None:
+            self._last.clear()
+            self._ranges.clear()
+            self._used_end = None
+            self._used_end_col = None
+        else:
+            self._last.pop(col0, None)
+            self._ranges.pop(col0, None)
+
+    def row_values(self, row: int, c_first: int, c_last: int = None):
+        """Texte einer Zeile von c_first bis c_last (Standard: Ende Used Area), EIN getDataArray."""
+        if c_last is None:
+            c_last = self.used_end_col()
+        if c_last < c_first:
+            return []
+        data = self.sheet.getCellRangeByPosition(c_first, row - 1, c_last, row - 1).getDataArray()
+        return [cell_text(v) for v in data[0]] if data else []
+
+    def column_values(self, col0: int, start_row: int = 1):
+        """Texte der Spalte von start_row bis zur letzten belegten Zeile (EIN getDataArray)."""
+        last = self.last_row(col0, start_row)
+        if last < start_row:
+            return []
+        data = self.sheet.getCellRangeByPosition(col0, start_row - 1, col0, last - 1).getDataArray()
+        return [cell_text(row[0]) if row else "" for row in data]
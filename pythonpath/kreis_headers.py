@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_headers.py  (shared helper, no UNO imports – arbeitet nur auf übergebenen Sheet-Objekten)
+
+Zähler-/Kopfzellen der Wortlisten ("Anzahl Wörter:\\n<n>", "Wörter in AG\\n<n> Buchstaben"):
+
+- HeaderWriter merkt sich je Dokument und Zelle den zuletzt geschriebenen Text
+  (gilt, solange das Makro-Modul geladen ist; Dokument über doc_key, damit zwei offene
+  Dateien mit gleichem Blattnamen sich nicht gegenseitig Einträge liefern)
+- update_row liest die Zielzeile mit EINEM getDataArray und schreibt nur Zellen neu,
+  deren Text sich geändert hat (oder die nicht von uns stammen, z.B. von Hand überschrieben)
+- Rich Text (Zahl fett) wird nur beim tatsächlichen Schreiben aufgebaut
+
+Zeilen sind 1-basiert, Spalten 0-basiert (wie kreis_extent).
+"""
+
+BOLD = 150.0  # com.sun.star.awt.FontWeight.BOLD
+
+
+def header_text(prefix: str, n, suffix: str = "") -> str:
+    return f"{prefix}{n}{suffix}"
+
+
+def write_bold_number(cell, prefix: str, n, suffix: str = "") -> None:
+    """
+    Schreibt <prefix><n><suffix> und macht nur <n> fett.
+    """
+    text = cell.Text
+    text.setString("")
+
+    cursor = text.createTextCursor()
+    text.insertString(cursor, prefix, False)
+
+    start = cursor.getStart()
+    text.insertString(cursor, str(n), False)
+    end = cursor.getEnd()
+
+    num_cursor = text.createTextCursorByRange(start)
+    num_cursor.gotoRange(end, True)
+    num_cursor.CharWeight = BOLD
+
+    if suffix:
+        cursor = text.createTextCursor()
+        cursor.gotoEnd(False)
+        text.insertString(cursor, suffix, False)
+
+
+def doc_key(doc) -> str:
+    """Kennung des Dokuments für die Laufzeit (RuntimeUID, sonst URL)."""
+    if doc is None:
+        return ""
+    for attr in ("RuntimeUID", "URL"):
+        try:
+            v = getattr(doc, attr)
+            if v:
+                return str(v)
+        except Exception:
+            pass
+    return str(id(doc))
+
+
+class HeaderWriter:
+    """
+    items für update_row: {spalte0: (prefix, n, suffix) | None}
+      None   -> Zelle leeren
+      bold   -> Zahl fett (Rich Text), sonst einfacher setString
+      on_write(cell) -> z.B. Zellvorlage/Ausrichtung, nur für neu geschriebene Zellen
+      doc    -> Dokument des Blatts (Teil des Cache-Schlüssels)
+    """
+
+    def __init__(self):
+        self._last = {}
+
+    def forget(self, doc=None, sheet_name: str = None):
+        if doc is None and sheet_name is None:
+            self._last.clear()
+            return
+        dk = None if doc is None else doc_key(doc)
+        for k in [k for k in self._last
+                  if (dk is None or k[0] == dk) and (sheet_name is None or k[1] == sheet_name)]:
+            del self._last[k]
+
+    def update_row(self, sheet, row: int, items, bold: bool = True, on_write=None, doc=None) -> int:
+        """Returns: Anzahl neu geschriebener Zellen."""
+        if not items:
+            return 0
+        try:
+            name = sheet.Name
+        except Exception:
+            name = ""
+        dk = doc_key(doc)
+        c_first, c_last = min(items), max(items)
+        try:
+            data = sheet.getCellRangeByPosition(c_first, row - 1, c_last, row - 1).getDataArray()
+            current = [str(v) for v in data[0]] if data else []
+        except Exception:
+            current = []
+
+        written = 0
+        for c0, spec in sorted(items.items()):
+            wanted = "" if spec is None else header_text(*spec)
+            i = c0 - c_first
+            cur = current[i] if i < len(current) else None
+            key = (dk, name, c0, row)
+            # Rich Text: gleicher Text reicht nicht (fette Zahl?) -> nur wenn wir ihn geschrieben haben
+            if cur == wanted and (not bold or wanted == "" or self._last.get(key) == wanted):
+                continue
+
+            cell = sheet.getCellByPosition(c0, row - 1)
+            if spec is None:
+                cell.setString("")
+            elif bold:
+                write_bold_number(cell, *spec)
+            else:
+                cell.setString(wanted)
+            if on_write is not None and spec is not None:
+                on_write(cell)
+            self._last[key] = wanted
+            written += 1
+        return written
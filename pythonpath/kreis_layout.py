@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_layout.py  (shared helper, no UNO imports – arbeitet nur auf übergebenen Sheet-Objekten)
+
+Zeilenhöhen und Spaltenbreiten bereichsweise setzen:
+
+- Wunschmaße als {zeile_1basiert: höhe} bzw. {spalte_0basiert: breite} (1/100 mm)
+- zusammenhängende Zeilen/Spalten mit gleichem Maß -> EIN Bereich
+  (getCellRangeByPosition(...).Rows / .Columns, Height/Width EINMAL setzen)
+- kein vorheriges Lesen je Zeile/Spalte: ein Schreibaufruf je Bereich ist billiger als
+  hunderte Einzel-Lesezugriffe (und .Rows.Height liefert nur die erste Zeile des Bereichs);
+  wie oft formatiert wird, regelt ensure_layout (kreis_docprops)
+
+Zeilen sind 1-basiert, Spalten 0-basiert (wie kreis_extent).
+"""
+
+def size_runs(sizes):
+    """
+    {index: maß} -> [(erster, letzter, maß)] für zusammenhängende Indizes mit gleichem Maß.
+    """
+    runs = []
+    for i in sorted(sizes):
+        v = int(sizes[i])
+        if runs and runs[-1][1] == i - 1 and runs[-1][2] == v:
+            runs[-1] = (runs[-1][0], i, v)
+        else:
+            runs.append((i, i, v))
+    return runs
+
+
+def apply_row_heights(sheet, heights) -> int:
+    """
+    heights: {zeile_1basiert: höhe_1/100mm}
+    Returns: Anzahl geschriebener Bereiche
+    """
+    written = 0
+    for r1, r2, h in size_runs(heights):
+        try:
+            rng_rows = sheet.getCellRangeByPosition(0, r1 - 1, 0, r2 - 1).Rows
+            try:
+                rng_rows.OptimalHeight = False
+            except Exception:
+                pass
+            rng_rows.Height = h
+            written += 1
+        except Exception:
+            pass
+    return written
+
+
+def apply_col_widths(sheet, widths) -> int:
+    """
+    widths: {spalte_0basiert: breite_1/100mm}
+    Returns: Anzahl geschriebener Bereiche
+    """
+    written = 0
+    for c1, c2, w in size_runs(widths):
+        try:
+            rng_cols = sheet.getCellRangeByPosition(c1, 0, c2, 0).Columns
+            try:
+                rng_cols.OptimalWidth = False
+            except Exception:
+                pass
+            rng_cols.Width = w
+            written += 1
+        except Exception:
+            pass
+    return written
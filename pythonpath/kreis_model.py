@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_model.py  (shared helper, no UNO)
+
+Gemeinsame Regeln für das Quadranten-Modell.
+
+- Kreis = [UL, UR, LL, LR]: oben 2 Buchstaben des oberen Worts, unten 2 des unteren
+- Modell = Liste von (idx_tag, [UL, UR, LL, LR]); idx_tag "r{zeile}_c{spalte}" bzw. "b{gruppe}_c{spalte}"
+"""
+
+MIN_CIRCLES = 3
+MAX_CIRCLES = 6
+
+
+def num_circles_for_len(L: int) -> int:
+    """5-6->3, 7-8->4, 9-10->5, 11-12->6 (2 Buchstaben pro Kreis, min 3, max 6)."""
+    n = (int(L) + 1) // 2
+    if n < MIN_CIRCLES:
+        n = MIN_CIRCLES
+    if n > MAX_CIRCLES:
+        n = MAX_CIRCLES
+    return n
+
+
+def row_capacity(L: int) -> int:
+    """Buchstaben pro Halbzeile (oben/unten) für Wortlänge L."""
+    return 2 * num_circles_for_len(L)
+
+
+def split_idx_tag(idx_tag: str):
+    """'r1_c3' / 'b1_c3' -> ('r1', 3); unbekanntes Format -> (idx_tag, 0)."""
+    row, sep, col = (idx_tag or "").rpartition("_c")
+    if not sep:
+        return idx_tag, 0
+    try:
+        return row, int(col)
+    except Exception:
+        return idx_tag, 0
+
+
+def rows_from_model(model):
+    """
+    Modell -> Kreiszeilen in Spaltenreihenfolge.
+    Returns: Liste von Listen [UL, UR, LL, LR] (Reihenfolge der Zeilen wie im Modell)
+    """
+    rows = {}
+    order = []
+    for idx_tag, vals in model:
+        row, col = split_idx_tag(idx_tag)
+        if row not in rows:
+            rows[row] = []
+            order.append(row)
+        rows[row].append((col, vals))
+    return [[vals for _col, vals in sorted(rows[r], key=lambda x: x[0])] for r in order]
+
+
+def row_words(quads):
+    """Kreiszeile -> (oberes Wort, unteres Wort) inkl. Leerzeichen für leere Quadranten."""
+    top = "".join(q[0] + q[1] for q in quads)
+    bot = "".join(q[2] + q[3] for q in quads)
+    return top, bot
+
+
+def model_from_words(L: int, row_pairs):
+    """
+    (oberes Wort, unteres Wort) je Kreiszeile -> Modell [(f"r{zeile}_c{spalte}", [UL, UR, LL, LR])].
+    Wörter werden auf 2 * num_circles_for_len(L) gekürzt, fehlende Buchstaben = " ".
+    """
+    n = num_circles_for_len(L)
+    cap = 2 * n
+    model = []
+    for r, (top, bot) in enumerate(row_pairs):
+        top = (top or "")[:cap].ljust(cap)
+        bot = (bot or "")[:cap].ljust(cap)
+        for c in range(n):
+            model.append((f"r{r}_c{c}", [top[2 * c], top[2 * c + 1], bot[2 * c], bot[2 * c + 1]]))
+    return model
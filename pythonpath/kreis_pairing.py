@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_pairing.py  (shared helper, no UNO)
+
+Passende Partnerwörter für eine Kreisreihe (oberes + unteres Wort).
+
+Problem: gleiche Buchstaben im selben Kreis machen ihn (teil-)symmetrisch
+  - voll symmetrisch  (UL == UR == LL == LR) -> keine Drehung ändert etwas
+  - halb symmetrisch  (UL == LR und UR == LL) -> 180° ändert nichts
+  - gleiche Buchstaben oben/unten             -> weniger unterscheidbare Stellungen
+
+Vorgehen:
+- build_pair_table: jede Position eines Worts als Zahl (0 = leer/aufgefüllt),
+  ganze Liste als Matrix (NumPy uint8, falls verfügbar – sonst Tupel-Listen)
+- pair_scores: EIN Durchgang über die ganze Liste gegen ein gegebenes Wort
+  (kleiner = besser, 0 = kein gemeinsamer Buchstabe in einem Kreis)
+- best_partner_index / best_pair_order: Auswahl auf Basis dieser Scores
+- symmetric_pair_mask: Vorfilter für ALLE Kombinationen oben x unten auf einmal
+  (welche Paare ergeben einen voll symmetrischen/leeren Kreis, der sich nicht mischen lässt)
+"""
+
+import random
+from itertools import permutations
+
+from kreis_model import num_circles_for_len
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# Gewichte (Feintuning hier)
+W_FULL = 8   # voll symmetrischer Kreis
+W_HALF = 3   # halb symmetrischer Kreis
+W_SAME = 1   # je gleiches Buchstabenpaar (oben x unten) im selben Kreis
+
+
+# ============================================================
+# 1) KODIEREN
+# ============================================================
+
+def _code(ch: str) -> int:
+    """A-Z -> 1..26, andere Buchstaben (Umlaute) -> 27..255, leer -> 0."""
+    if not ch or ch == " ":
+        return 0
+    o = ord(ch)
+    if 65 <= o <= 90:
+        return o - 64
+    return 27 + (o % 229)
+
+
+def encode_word(word: str, cap: int):
+    """Wort -> Tupel fester Länge cap (aufgefüllt mit 0)."""
+    codes = [_code(ch) for ch in (word or "")[:cap]]
+    return tuple(codes + [0] * (cap - len(codes)))
+
+
+def build_pair_table(words, L: int):
+    """
+    words: Kandidaten (normalisiert) für Wortlänge L
+    Returns: {"words", "cap", "mat"}  mat = (n, cap) uint8-Matrix bzw. Liste von Tupeln
+    """
+    cap = 2 * num_circles_for_len(L)
+    words = list(words)
+    rows = [encode_word(w, cap) for w in words]
+    if np is not None:
+        mat = np.array(rows, dtype=np.uint8).reshape(len(rows), cap)
+    else:
+        mat = rows
+    return {"words": words, "cap": cap, "mat": mat}
+
+
+# ============================================================
+# 2) SCORES
+# ============================================================
+
+def pair_score(word_a: str, word_b: str, cap: int) -> int:
+    """Score für genau ein Wortpaar (Reihenfolge oben/unten egal)."""
+    a = encode_word(word_a, cap)
+    b = encode_word(word_b, cap)
+    return _score_codes(a, b)
+
+
+def _score_codes(t, m) -> int:
+    score = 0
+    for c in range(0, len(t), 2):
+        ul, ur, ll, lr = t[c], t[c + 1], m[c], m[c + 1]
+        half = (ul == lr) and (ur == ll)
+        if half and ul == ur:
+            score += W_FULL
+        elif half:
+            score += W_HALF
+        for x in (ul, ur):
+            if x:
+                score += W_SAME * ((x == ll) + (x == lr))
+    return score
+
+
+def pair_scores(table, word: str):
+    """
+    Scores ALLER Wörter der Tabelle gegen word (als Partner oben/unten).
+    Returns: NumPy-Array (int) bzw. Liste, Reihenfolge wie table["words"].
+    """
+    cap = table["cap"]
+    t = encode_word(word, cap)
+    mat = table["mat"]
+
+    if np is None:
+        return [_score_codes(t, m) for m in mat]
+
+    if len(mat) == 0:
+        return np.zeros(0, dtype=np.int32)
+
+    tv = np.array(t, dtype=np.uint8)
+    ul, ur = tv[0::2], tv[1::2]           # (n_circles,)
+    ll, lr = mat[:, 0::2], mat[:, 1::2]   # (n, n_circles)
+
+    half = (lr == ul) & (ll == ur)
+    full = half & (ul == ur)
+    nz_ul = ul != 0
+    nz_ur = ur != 0
+    same = ((ll == ul) & nz_ul).astype(np.int32) + ((lr == ul) & nz_ul) \
+         + ((ll == ur) & nz_ur) + ((lr == ur) & nz_ur)
+
+    return (W_FULL * full.sum(axis=1)
+            + W_HALF * (half & ~full).sum(axis=1)
+            + W_SAME * same.sum(axis=1)).astype(np.int32)
+
+
+# ============================================================
+# 3) AUSWAHL
+# ============================================================
+
+def best_partner_index(table, word: str, allowed_idx, rng=None):
+    """
+    allowed_idx: erlaubte Indizes in table["words"] (z.B. nicht benutzt, 30-Tage-Regel)
+    Returns: Index mit kleinstem Score (bei Gleichstand zufällig) oder None
+    """
+    allowed_idx = list(allowed_idx)
+    if not allowed_idx:
+        return None
+    rng = rng or random
+    scores = pair_scores(table, word)
+    best = min(int(scores[i]) for i in allowed_idx)
+    return rng.choice([i for i in allowed_idx if int(scores[i]) == best])
+
+
+def best_pair_order(words, cap: int):
+    """
+    Ordnet bis zu 6 Wörter so, dass (0,1), (2,3), (4,5) als oben/unten möglichst gut passen.
+    Ungerade Anzahl: das letzte Wort bleibt ohne Partner (wird später ergänzt).
+    Returns: neue Liste (Brute Force über alle Paarungen, max. 720 Reihenfolgen)
+    """
+    words = list(words)
+    if len(words) < 3 or len(words) > 6:
+        return words
+
+    codes = [encode_word(w, cap) for w in words]
+    ps = [[_score_codes(a, b) for b in codes] for a in codes]
+
+    best = None
+    best_order = words
+    for perm in permutations(range(len(words))):
+        s = 0
+        for i in range(0, len(perm) - 1, 2):
+            s += ps[perm[i]][perm[i + 1]]
+        if best is None or s < best:
+            best = s
+            best_order = [words[i] for i in perm]
+            if best == 0:
+                break
+    return best_order
+
+
+# ============================================================
+# 4) SYMMETRIE-VORFILTER (alle Paare auf einmal)
+# ============================================================
+# Ein Kreis ist voll symmetrisch, wenn UL == UR == LL == LR.
+# -> beide Wörter haben im selben Kreis einen Doppelbuchstaben ("EE") mit gleichem Buchstaben
+#    (leere Kreise: Code 0 auf beiden Seiten – gleiche Regel)
+
+def pair_has_symmetric_circle(word_a: str, word_b: str, cap: int) -> bool:
+    """True, wenn oben word_a / unten word_b mindestens einen voll symmetrischen Kreis ergibt."""
+    a = encode_word(word_a, cap)
+    b = encode_word(word_b, cap)
+    for c in range(0, cap, 2):
+        if a[c] == a[c + 1] == b[c] == b[c + 1]:
+            return True
+    return False
+
+
+def symmetric_pair_mask(table):
+    """
+    Returns: (n, n)-Maske, mask[i][j] = True -> Paar (words[i], words[j]) ergibt einen
+             voll symmetrischen Kreis. NumPy: bool-Array (ein Vergleich je Kreisspalte),
+             sonst Liste von Listen (nur Wörter mit Doppelbuchstaben werden verglichen).
+    """
+    mat = table["mat"]
+    n = len(table["words"])
+    cap = table["cap"]
+
+    if np is not None:
+        mask = np.zeros((n, n), dtype=bool)
+        if n == 0:
+            return mask
+        ul, ur = mat[:, 0::2], mat[:, 1::2]
+        dbl = ul == ur
+        for c in range(cap // 2):
+            d = dbl[:, c]
+            if not d.any():
+                continue
+            code = np.where(d, ul[:, c].astype(np.int16), -1)  # -1 = kein Doppelbuchstabe
+            mask |= (code[:, None] == code[None, :]) & d[:, None]
+        return mask
+
+    mask = [[False] * n for _ in range(n)]
+    groups = {}
+    for i, m in enumerate(mat):
+        for c in range(0, cap, 2):
+            if m[c] == m[c + 1]:
+                groups.setdefault((c, m[c]), []).append(i)
+    for idx in groups.values():
+        for i in idx:
+            row = mask[i]
+            for j in idx:
+                row[j] = True
+    return mask
+
+
+def drop_symmetric_partners(table, mask, word: str, allowed_idx, word_pos=None):
+    """
+    Entfernt aus allowed_idx alle Partner, die mit word einen voll symmetrischen Kreis bilden.
+    word_pos: optional {wort: index} (sonst wird word in table["words"] gesucht).
+    Bleibt nichts übrig, kommt allowed_idx unverändert zurück (lieber symmetrisch als gar nichts).
+    """
+    allowed_idx = list(allowed_idx)
+    if word_pos is not None:
+        i = word_pos.get(word)
+    else:
+        i = table["words"].index(word) if word in table["words"] else None
+
+    if i is not None:
+        row = mask[i]
+        safe = [j for j in allowed_idx if not row[j]]
+    else:
+        cap = table["cap"]
+        safe = [j for j in allowed_idx
+                if not pair_has_symmetric_circle(word, table["words"][j], cap)]
+    return safe or allowed_idx
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_puzzle.py  (shared helper, no UNO)
+
+Ein fertiges Kreis-Worträtsel als kleiner Datensatz (statt Shapes + Y4:Y12):
+
+    {"v": 1, "L": 8, "n": 4,
+     "words": [oben1, unten1, oben2, unten2, oben3, unten3],   # "" = leer
+     "steps": [0..3 je Kreis],                                  # Rotation im Uhrzeigersinn
+     "seed": 123,                                               # Zufallsgenerator (Ziehung + Mischung)
+     "created": "2024-05-01 12:30", "changed": "...", "score": 0.42}
+
+- Lösungsschlüssel = words (Ausgangsstellung) + steps (angewandte Rotation);
+  beide Modelle werden daraus berechnet (solution_model / scrambled_model), keine Buchstaben doppelt
+- to_json / from_json:   kompaktes JSON (Dokumenteigenschaft, Austausch)
+- to_bytes / from_bytes: Binärformat (Datei), Rotationen mit 2 Bit je Kreis
+- load_any: erkennt das Format am Dateianfang
+
+Fehlerhafte Daten -> ValueError (wie kreis_schema).
+"""
+
+import json
+import math
+import struct
+from datetime import datetime
+
+from kreis_model import num_circles_for_len, model_from_words
+from kreis_rotation import rotate_quad
+
+FORMAT_VERSION = 1
+NUM_ROWS = 3
+NUM_WORDS = 2 * NUM_ROWS   # oben/unten je Kreiszeile
+
+MAGIC = b"KRZ"
+TS_FORMAT = "%Y-%m-%d %H:%M"
+
+# Magic, Version, L, Kreise je Zeile, Seed, created, changed (Unix-Sekunden, 0 = leer), Score (NaN = leer)
+_HEAD = struct.Struct("<3sBBBQqqf")
+
+
+def _now_str():
+    return datetime.now().strftime(TS_FORMAT)
+
+
+def new_puzzle(L: int, words, steps, seed=None, created=None, score=None):
+    """words: bis zu 6 Wörter (oben/unten je Kreiszeile), steps: je Kreis in Modellreihenfolge."""
+    words = [(w or "") for w in list(words)[:NUM_WORDS]]
+    words += [""] * (NUM_WORDS - len(words))
+    n = num_circles_for_len(L)
+    steps = [int(s) % 4 for s in steps]
+    if len(steps) != NUM_ROWS * n:
+        raise ValueError(f"{len(steps)} Rotationen für {NUM_ROWS} x {n} Kreise.")
+    return {
+        "v": FORMAT_VERSION, "L": int(L), "n": n,
+        "words": words, "steps": steps,
+        "seed": int(seed or 0),
+        "created": created or _now_str(), "changed": "",
+        "score": score,
+    }
+
+
+def with_steps(puzzle, steps, seed=None):
+    """Kopie mit neuer Rotation (neu gemischt), Wörter unverändert; seed = Seed der neuen Mischung."""
+    p = new_puzzle(puzzle["L"], puzzle["words"], steps,
+                   seed=puzzle["seed"] if seed is None else seed,
+                   created=puzzle["created"], score=puzzle.get("score"))
+    p["changed"] = _now_str()
+    return p
+
+
+def row_pairs(puzzle):
+    w = puzzle["words"]
+    return [(w[2 * r], w[2 * r + 1]) for r in range(NUM_ROWS)]
+
+
+def solution_model(puzzle):
+    """Ausgangsstellung: [(idx_tag, [UL, UR, LL, LR])]."""
+    return model_from_words(puzzle["L"], row_pairs(puzzle))
+
+
+def scrambled_model(puzzle):
+    """Gemischte Stellung, wie sie auf dem Blatt steht."""
+    return [(tag, rotate_quad(vals, s))
+            for (tag, vals), s in zip(solution_model(puzzle), puzzle["steps"])]
+
+
+# ============================================================
+# JSON
+# ============================================================
+
+def to_json(puzzle) -> str:
+    return json.dumps(puzzle, ensure_ascii=False, separators=(",", ":"))
+
+
+def from_json(text):
+    d = json.loads(text)  # ValueError bei kaputtem JSON
+    if not isinstance(d, dict) or d.get("v") != FORMAT_VERSION:
+        raise ValueError("Kein Rätsel-Datensatz (Formatversion fehlt oder unbekannt).")
+    try:
+        p = new_puzzle(d["L"], d["words"], d["steps"], seed=d.get("seed"),
+                       created=d.get("created"), score=d.get("score"))
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Rätsel-Datensatz unvollständig: {e}")
+    p["changed"] = d.get("changed") or ""
+    return p
+
+
+# ============================================================
+# BINÄR
+# ============================================================
+
+def _ts_to_int(ts):
+    if not ts:
+        return 0
+    try:
+        return int(datetime.strptime(ts, TS_FORMAT).timestamp())
+    except ValueError:
+        return 0
+
+
+def _int_to_ts(v):
+    return datetime.fromtimestamp(v).strftime(TS_FORMAT) if v else ""
+
+
+def to_bytes(puzzle) -> bytes:
+    score = puzzle.get("score")
+    out = bytearray(_HEAD.pack(
+        MAGIC, FORMAT_VERSION, puzzle["L"], puzzle["n"],
+        puzzle["seed"] & 0xFFFFFFFFFFFFFFFF,
+        _ts_to_int(puzzle["created"]), _ts_to_int(puzzle["changed"]),
+        float("nan") if score is None else float(score),
+    ))
+    for w in puzzle["words"]:
+        raw = w.encode("utf-8")
+        out.append(len(raw))
+        out += raw
+    steps = puzzle["steps"]
+    for i in range(0, len(steps), 4):
+        b = 0
+        for j, s in enumerate(steps[i:i + 4]):
+            b |= (s & 3) << (2 * j)
+        out.append(b)
+    return bytes(out)
+
+
+def from_bytes(data: bytes):
+    if len(data) < _HEAD.size or data[:3] != MAGIC:
+        raise ValueError("Keine Rätsel-Datei (Kennung fehlt).")
+    magic, version, L, n, seed, created, changed, score = _HEAD.unpack_from(data)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unbekannte Formatversion: {version}")
+    pos = _HEAD.size
+    words = []
+    try:
+        for _ in range(NUM_WORDS):
+            size = data[pos]
+            words.append(data[pos + 1:pos + 1 + size].decode("utf-8"))
+            pos += 1 + size
+        count = NUM_ROWS * n
+        packed = data[pos:pos + (count + 3) // 4]
+        steps = [(packed[i // 4] >> (2 * (i % 4))) & 3 for i in range(count)]
+    except (IndexError, UnicodeDecodeError):
+        raise ValueError("Rätsel-Datei ist unvollständig.")
+    p = new_puzzle(L, words, steps, seed=seed, created=_int_to_ts(created),
+                   score=None if math.isnan(score) else round(score, 4))
+    p["changed"] = _int_to_ts(changed)
+    return p
+
+
+def load_any(data: bytes):
+    """Binär (Kennung KRZ) oder JSON (UTF-8)."""
+    if data[:3] == MAGIC:
+        return from_bytes(data)
+    return from_json(data.decode("utf-8-sig"))
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_render.py  (shared helper, no UNO) + CLI
+
+Druckausgabe des Rätsels direkt aus dem Quadranten-Modell, ohne Calc-Shapes:
+
+- puzzle_layout(rows):  Kreiszeilen [[UL, UR, LL, LR], ...] -> Kreise mit Position/Farbe
+  (gleiche Geometrie wie KREIS_QUADRANTEN_GUI_V1: CIRCLE_DIAMETER, OFFSET_X_BASE, ROW_COLORS)
+- render_svg(puzzle):   EIN Rätsel als SVG-Text
+- render_pdf(puzzles):  beliebig viele Rätsel als EIN PDF (eine Seite je Rätsel),
+  von Hand geschrieben (Helvetica-Bold als Standardschrift, keine Zusatzpakete)
+- export_batch:         Stapelexport in einen Ordner
+
+Ein Rätsel ist entweder eine Liste von Kreiszeilen, {"rows": [...], "title": ...},
+{"model": [(idx_tag, quad), ...]} (wie kreis_model.rows_from_model) oder ein gespeicherter
+kreis_puzzle-Datensatz (L, words, steps) – gedruckt gemischt, mit solution=True die Lösung.
+Maße in 1/100 mm wie in Calc.
+
+CLI (JSON-Datei mit einer Liste von Rätseln oder gespeicherte .krz-/JSON-Rätsel):
+    python kreis_render.py puzzles.json [--pdf out.pdf] [--svg-dir ordner]
+    python kreis_render.py raetsel.krz [...] --solution
+"""
+
+import argparse
+import json
+import os
+import sys
+import zlib
+from xml.sax.saxutils import escape
+
+from kreis_model import rows_from_model
+from kreis_puzzle import MAGIC, scrambled_model, solution_model, load_any
+
+# Geometrie wie KREIS_QUADRANTEN_GUI_V1 (1/100 mm)
+CIRCLE_DIAMETER = 3900
+OFFSET_X_BASE = 4000
+ROW_GAP = 1100          # senkrechter Abstand zwischen Kreiszeilen
+MARGIN = 1500           # Seitenrand
+TITLE_GAP = 1200        # Platz für die Titelzeile
+
+ROW_COLORS = [
+    0xCCE5FF,  # oben: blau
+    0xFBE5B6,  # mitte: beige
+    0xCCFFCC,  # unten: grün
+]
+LINE_COLOR = 0x000000
+LINE_WIDTH = 20         # 0,2 mm
+
+CHAR_HEIGHT = 16        # pt, fett (CharWeight 150 in Calc)
+TITLE_HEIGHT = 12       # pt
+
+U100MM_PER_PT = 2540 / 72.0
+BEZIER_K = 0.5523       # Kreis aus 4 kubischen Bézierkurven
+
+# Helvetica-Bold (AFM), Breite je 1000 Einheiten – nur für die Zentrierung im PDF
+_BOLD_WIDTHS = {
+    "A": 722, "B": 722, "C": 722, "D": 722, "E": 667, "F": 611, "G": 778, "H": 722,
+    "I": 278, "J": 556, "K": 722, "L": 611, "M": 833, "N": 722, "O": 778, "P": 667,
+    "Q": 778, "R": 722, "S": 667, "T": 611, "U": 722, "V": 667, "W": 944, "X": 667,
+    "Y": 667, "Z": 611, "Ä": 722, "Ö": 778, "Ü": 722, "ß": 611, " ": 278,
+}
+_DEFAULT_WIDTH = 600
+_CAP_HEIGHT = 0.718     # Helvetica, Anteil der Schriftgröße
+
+
+# ============================================================
+# 1) MODELL -> GEOMETRIE
+# ============================================================
+
+def puzzle_rows(puzzle, solution=False):
+    """
+    Rätsel (siehe Modulkopf) -> (Kreiszeilen, Titel). Unbekanntes Format -> ValueError.
+    solution: nur für kreis_puzzle-Datensätze – Lösungsstellung statt gemischt.
+    """
+    if isinstance(puzzle, dict):
+        title = puzzle.get("title") or ""
+        if "words" in puzzle and "steps" in puzzle:
+            try:
+                model = solution_model(puzzle) if solution else scrambled_model(puzzle)
+            except (KeyError, TypeError, IndexError) as e:
+                raise ValueError(f"Rätsel-Datensatz unvollständig: {e}")
+            if solution:
+                title = f"{title} – Lösung" if title else "Lösung"
+            return rows_from_model(model), title
+        if "rows" in puzzle:
+            return [list(r) for r in puzzle["rows"]], title
+        if "model" in puzzle:
+            return rows_from_model(puzzle["model"] or []), title
+        raise ValueError(f"Unbekanntes Rätsel-Format (Schlüssel: {', '.join(sorted(puzzle)) or '-'}).")
+    return [list(r) for r in puzzle], ""
+
+
+def with_answer_keys(puzzles):
+    """Je kreis_puzzle-Datensatz zusätzlich eine Lösungsseite direkt dahinter."""
+    out = []
+    for p in puzzles:
+        out.append(p)
+        if isinstance(p, dict) and "words" in p and "steps" in p:
+            rows, title = puzzle_rows(p, solution=True)
+            out.append({"title": title, "rows": rows})
+    return out
+
+
+def _visual(s):
+    # wie _to_upper_visual in der GUI: "ß" bleibt ein Zeichen
+    return (s or "").replace("ß", "ẞ").upper()
+
+
+def puzzle_layout(rows, title="", diameter=CIRCLE_DIAMETER, step_x=OFFSET_X_BASE,
+                  row_gap=ROW_GAP, margin=MARGIN, row_colors=None):
+    """
+    Returns: {"width", "height", "title", "title_y",
+              "circles": [{"x", "y", "size", "fill", "letters": [UL, UR, LL, LR]}]}
+    x/y = linke obere Ecke des Kreises, Ursprung oben links (wie Calc).
+    """
+    row_colors = row_colors or ROW_COLORS
+    top = margin + (TITLE_GAP if title else 0)
+    circles = []
+    max_cols = 0
+    for r, quads in enumerate(rows):
+        y = top + r * (diameter + row_gap)
+        fill = row_colors[r] if r < len(row_colors) else row_colors[-1]
+        for c, quad in enumerate(quads):
+            letters = [_visual(str(v)).strip() for v in list(quad)[:4]]
+            letters += [""] * (4 - len(letters))
+            circles.append({"x": margin + c * step_x, "y": y, "size": diameter,
+                            "fill": fill, "letters": letters})
+        max_cols = max(max_cols, len(quads))
+
+    width = 2 * margin + (max_cols - 1) * step_x + diameter if max_cols else 2 * margin
+    height = top + len(rows) * (diameter + row_gap) - (row_gap if rows else 0) + margin
+    return {"width": width, "height": height, "title": title,
+            "title_y": margin + TITLE_HEIGHT * U100MM_PER_PT, "circles": circles}
+
+
+def _quadrant_centers(x, y, size):
+    q1x, q3x = x + size / 4.0, x + 3 * size / 4.0
+    q1y, q3y = y + size / 4.0, y + 3 * size / 4.0
+    return [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]  # UL, UR, LL, LR
+
+
+# ============================================================
+# 2) SVG
+# ============================================================
+
+def _hex(color):
+    return f"#{int(color) & 0xFFFFFF:06X}"
+
+
+def render_svg(puzzle, solution=False, **opts) -> str:
+    """EIN Rätsel -> SVG (viewBox in 1/100 mm, width/height in mm)."""
+    rows, title = puzzle_rows(puzzle, solution)
+    lay = puzzle_layout(rows, title, **opts)
+    w, h = lay["width"], lay["height"]
+    fs = CHAR_HEIGHT * U100MM_PER_PT
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{w / 100:g}mm" height="{h / 100:g}mm" '
+        f'viewBox="0 0 {w} {h}">',
+        f'<rect width="{w}" height="{h}" fill="#FFFFFF"/>',
+    ]
+    if title:
+        out.append(f'<text x="{MARGIN}" y="{lay["title_y"]:.0f}" font-family="Helvetica, Arial, sans-serif" '
+                   f'font-size="{TITLE_HEIGHT * U100MM_PER_PT:.0f}">{escape(title)}</text>')
+
+    stroke = f'stroke="{_hex(LINE_COLOR)}" stroke-width="{LINE_WIDTH}"'
+    out.append(f'<g font-family="Helvetica, Arial, sans-serif" font-weight="bold" font-size="{fs:.0f}" '
+               f'text-anchor="middle" dominant-baseline="central">')
+    for c in lay["circles"]:
+        x, y, s = c["x"], c["y"], c["size"]
+        cx, cy = x + s / 2.0, y + s / 2.0
+        out.append(f'<circle cx="{cx:g}" cy="{cy:g}" r="{s / 2.0:g}" fill="{_hex(c["fill"])}" {stroke}/>')
+        out.append(f'<line x1="{cx:g}" y1="{y}" x2="{cx:g}" y2="{y + s}" {stroke}/>')
+        out.append(f'<line x1="{x}" y1="{cy:g}" x2="{x + s}" y2="{cy:g}" {stroke}/>')
+        for (tx, ty), txt in zip(_quadrant_centers(x, y, s), c["letters"]):
+            if txt:
+                out.append(f'<text x="{tx:g}" y="{ty:g}">{escape(txt)}</text>')
+    out.append("</g>")
+    out.append("</svg>")
+    return "\n".join(out) + "\n"
+
+
+# ============================================================
+# 3) PDF (eine Seite je Rätsel)
+# ============================================================
+
+def _pdf_text(s):
+    """Text -> PDF-String (WinAnsiEncoding); ẞ gibt es dort nicht -> ß."""
+    s = s.replace("ẞ", "ß")
+    raw = s.encode("cp1252", "replace")
+    return raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _text_width(s, size_pt):
+    s = s.replace("ẞ", "ß")
+    return sum(_BOLD_WIDTHS.get(ch, _DEFAULT_WIDTH) for ch in s) * size_pt / 1000.0
+
+
+def _rgb(color):
+    c = int(color) & 0xFFFFFF
+    return f"{(c >> 16) / 255:.3f} {((c >> 8) & 0xFF) / 255:.3f} {(c & 0xFF) / 255:.3f}"
+
+
+def _page_stream(lay) -> bytes:
+    h_pt = lay["height"] / U100MM_PER_PT
+
+    def px(v):
+        return v / U100MM_PER_PT
+
+    def py(v):  # Calc: y nach unten, PDF: y nach oben
+        return h_pt - v / U100MM_PER_PT
+
+    ops = [f"{LINE_WIDTH / U100MM_PER_PT:.3f} w", f"{_rgb(LINE_COLOR)} RG"]
+    for c in lay["circles"]:
+        s = c["size"]
+        r = px(s / 2.0)
+        cx, cy = px(c["x"] + s / 2.0), py(c["y"] + s / 2.0)
+        k = r * BEZIER_K
+        ops.append(f"{_rgb(c['fill'])} rg")
+        ops.append(
+            f"{cx + r:.2f} {cy:.2f} m "
+            f"{cx + r:.2f} {cy + k:.2f} {cx + k:.2f} {cy + r:.2f} {cx:.2f} {cy + r:.2f} c "
+            f"{cx - k:.2f} {cy + r:.2f} {cx - r:.2f} {cy + k:.2f} {cx - r:.2f} {cy:.2f} c "
+            f"{cx - r:.2f} {cy - k:.2f} {cx - k:.2f} {cy - r:.2f} {cx:.2f} {cy - r:.2f} c "
+            f"{cx + k:.2f} {cy - r:.2f} {cx + r:.2f} {cy - k:.2f} {cx + r:.2f} {cy:.2f} c b"
+        )
+        ops.append(f"{cx:.2f} {cy + r:.2f} m {cx:.2f} {cy - r:.2f} l "
+                   f"{cx - r:.2f} {cy:.2f} m {cx + r:.2f} {cy:.2f} l S")
+
+    text_ops = []
+    for c in lay["circles"]:
+        for (tx, ty), txt in zip(_quadrant_centers(c["x"], c["y"], c["size"]), c["letters"]):
+            if not txt:
+                continue
+            x = px(tx) - _text_width(txt, CHAR_HEIGHT) / 2.0
+            y = py(ty) - CHAR_HEIGHT * _CAP_HEIGHT / 2.0
+            text_ops.append(f"1 0 0 1 {x:.2f} {y:.2f} Tm (".encode("ascii") + _pdf_text(txt) + b") Tj")
+    body = "\n".join(ops).encode("ascii") + b"\n"
+    body += f"BT 0 g /F1 {CHAR_HEIGHT} Tf\n".encode("ascii") + b"\n".join(text_ops) + b"\nET\n"
+    if lay["title"]:
+        body += (f"BT 0 g /F2 {TITLE_HEIGHT} Tf 1 0 0 1 {px(MARGIN):.2f} {py(lay['title_y']):.2f} Tm (".encode("ascii")
+                 + _pdf_text(lay["title"]) + b") Tj ET\n")
+    return body
+
+
+def render_pdf(puzzles, compress=True, solution=False, **opts) -> bytes:
+    """Viele Rätsel -> EIN PDF, Seitengröße je Rätsel passend zum Inhalt."""
+    # Objekte: 1 Katalog, 2 Seitenbaum, 3/4 Schriften, dann je Seite: Seite + Inhalt
+    objs = [None, None,
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for puzzle in puzzles:
+        rows, title = puzzle_rows(puzzle, solution)
+        lay = puzzle_layout(rows, title, **opts)
+        stream = _page_stream(lay)
+        if compress:
+            stream = zlib.compress(stream)
+            head = f"<< /Length {len(stream)} /Filter /FlateDecode >>"
+        else:
+            head = f"<< /Length {len(stream)} >>"
+        page_no, content_no = len(objs) + 1, len(objs) + 2
+        w_pt, h_pt = lay["width"] / U100MM_PER_PT, lay["height"] / U100MM_PER_PT
+        objs.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {w_pt:.2f} {h_pt:.2f}] "
+                    f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> "
+                    f"/Contents {content_no} 0 R >>".encode("ascii"))
+        objs.append(head.encode("ascii") + b"\nstream\n" + stream + b"\nendstream")
+        kids.append(page_no)
+    objs[0] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objs[1] = (f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] "
+               f"/Count {len(kids)} >>").encode("ascii")
+
+    out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for i, obj in enumerate(objs, start=1):
+        offsets.append(len(out))
+        out += f"{i} 0 obj\n".encode("ascii") + obj + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(objs) + 1}\n0000000000 65535 f \n".encode("ascii")
+    out += b"".join(f"{o:010d} 00000 n \n".encode("ascii") for o in offsets)
+    out += f"trailer\n<< /Size {len(objs) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("ascii")
+    return bytes(out)
+
+
+# ============================================================
+# 4) DATEIEN / STAPEL
+# ============================================================
+
+def write_svg(path, puzzle, **opts) -> str:
+    data = render_svg(puzzle, **opts)  # erst rendern: Fehler hinterlassen keine leere Datei
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(data)
+    return path
+
+
+def write_pdf(path, puzzles, **opts) -> str:
+    data = render_pdf(puzzles, **opts)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+def export_batch(puzzles, out_dir, fmt="pdf", pdf_name="kreis_raetsel.pdf", **opts):
+    """
+    fmt: "pdf" (ein PDF, eine Seite je Rätsel), "svg" (eine Datei je Rätsel) oder "both".
+    Returns: Liste der geschriebenen Pfade.
+    """
+    puzzles = list(puzzles)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    if fmt in ("svg", "both"):
+        width = len(str(len(puzzles)))
+        for i, p in enumerate(puzzles, start=1):
+            paths.append(write_svg(os.path.join(out_dir, f"raetsel_{i:0{width}d}.svg"), p, **opts))
+    if fmt in ("pdf", "both"):
+        paths.append(write_pdf(os.path.join(out_dir, pdf_name), puzzles, **opts))
+    return paths
+
+
+# ============================================================
+# 5) CLI
+# ============================================================
+
+def load_puzzles(path):
+    """Datei -> Liste von Rätseln: .krz (kreis_puzzle binär), JSON-Liste oder EIN JSON-Rätsel."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:3] == MAGIC:
+        return [load_any(data)]
+    puzzles = json.loads(data.decode("utf-8-sig"))
+    return [puzzles] if isinstance(puzzles, dict) else list(puzzles)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Kreis-Rätsel als SVG/PDF (ohne LibreOffice)")
+    ap.add_argument("paths", nargs="+",
+                    help='Liste von Rätseln ({"title", "rows"} / {"title", "model"}) '
+                         'oder gespeicherte Rätsel (.krz / JSON aus kreis_puzzle)')
+    ap.add_argument("--pdf", default=None, help="ein PDF mit einer Seite je Rätsel")
+    ap.add_argument("--svg-dir", default=None, help="Ordner für eine SVG-Datei je Rätsel")
+    ap.add_argument("--solution", action="store_true",
+                    help="gespeicherte Rätsel: Lösungsseite hinter jedes Rätsel")
+    args = ap.parse_args(argv)
+
+    try:
+        puzzles = [p for path in args.paths for p in load_puzzles(path)]
+        if args.solution:
+            puzzles = with_answer_keys(puzzles)
+    except (OSError, ValueError) as e:
+        ap.error(str(e))
+    if not args.pdf and not args.svg_dir:
+        args.pdf = os.path.splitext(args.paths[0])[0] + ".pdf"
+
+    try:
+        if args.svg_dir:
+            for path in export_batch(puzzles, args.svg_dir, fmt="svg"):
+                print(path)
+        if args.pdf:
+            print(write_pdf(args.pdf, puzzles))
+    except ValueError as e:
+        ap.error(str(e))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
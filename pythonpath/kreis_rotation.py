@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_rotation.py  (shared helper, no UNO)
+
+Rotation der 4 Quadranten eines Kreises über vorberechnete Tabellen.
+
+Quadranten-Reihenfolge überall: [UL, UR, LL, LR]  (= TextShape _1.._4)
+
+- ROTATION_TABLES[k]: Index-Permutation für k x 90° im Uhrzeigersinn (k = 0..3)
+  neu[i] = alt[ROTATION_TABLES[k][i]]  -> keine Schleifen, keine Zwischenlisten
+- Negative Schritte = gegen den Uhrzeigersinn (-1 == 3, -2 == 2, -3 == 1)
+- Symmetrie-Klasse eines Kreises in EINEM Lookup:
+    SYM_FULL  -> alle 4 gleich (oder leer): keine Rotation ändert etwas
+    SYM_HALF  -> UL==LR und UR==LL: nur 90°/270° ändern, 180° nicht
+    SYM_NONE  -> jede Rotation 1..3 ändert den Kreis
+
+Ablage: Scripts/python/pythonpath/ (LibreOffice nimmt den Ordner in sys.path auf).
+"""
+
+# ============================================================
+# 1) TABELLEN
+# ============================================================
+
+# 90° im Uhrzeigersinn: UL->UR, UR->LR, LR->LL, LL->UL
+# => neues [UL, UR, LL, LR] = altes [LL, UL, LR, UR]
+_CW90 = (2, 0, 3, 1)
+
+
+def _compose(perm_a, perm_b):
+    """Erst perm_a, dann perm_b anwenden (als Index-Permutation)."""
+    return tuple(perm_a[i] for i in perm_b)
+
+
+def _build_tables():
+    tables = [(0, 1, 2, 3)]
+    for _ in range(3):
+        tables.append(_compose(tables[-1], _CW90))
+    return tuple(tables)
+
+
+ROTATION_TABLES = _build_tables()
+
+SYM_FULL = 0
+SYM_HALF = 1
+SYM_NONE = 2
+
+# Schritte (1..3 im Uhrzeigersinn), die den Kreis je Symmetrie-Klasse verändern
+CHANGING_STEPS = {
+    SYM_FULL: (),
+    SYM_HALF: (1, 3),
+    SYM_NONE: (1, 2, 3),
+}
+
+# Anzahl unterschiedlicher Stellungen je Klasse (inkl. Ausgangsstellung)
+DISTINCT_POSITIONS = {
+    SYM_FULL: 1,
+    SYM_HALF: 2,
+    SYM_NONE: 4,
+}
+
+
+# ============================================================
+# 2) EINZELNER KREIS
+# ============================================================
+
+def rotate_quad(vals, steps_cw: int):
+    """
+    vals: [UL, UR, LL, LR]
+    steps_cw: 90°-Schritte im Uhrzeigersinn, negativ = gegen den Uhrzeigersinn
+    Returns: neue Liste (vals bleibt unverändert)
+    """
+    t = ROTATION_TABLES[steps_cw % 4]
+    return [vals[t[0]], vals[t[1]], vals[t[2]], vals[t[3]]]
+
+
+def symmetry_class(vals) -> int:
+    """SYM_FULL / SYM_HALF / SYM_NONE für einen Kreis [UL, UR, LL, LR]."""
+    ul, ur, ll, lr = vals
+    if ul != lr or ur != ll:
+        return SYM_NONE
+    if ul == ur:
+        return SYM_FULL
+    return SYM_HALF
+
+
+def changing_steps(vals):
+    """Alle Schritte 1..3 (im Uhrzeigersinn), die den Kreis sichtbar verändern."""
+    return CHANGING_STEPS[symmetry_class(vals)]
+
+
+def is_symmetric(vals) -> bool:
+    """True, wenn KEINE Rotation den Kreis verändert (leer / 4 gleiche Buchstaben)."""
+    return symmetry_class(vals) == SYM_FULL
+
+
+# ============================================================
+# 3) BATCH (alle Kreise eines Rätsels)
+# ============================================================
+
+def rotate_many(quads, steps):
+    """quads: Liste von [UL, UR, LL, LR]; steps: gleich lange Liste von Schritten."""
+    return [rotate_quad(q, s) for q, s in zip(quads, steps)]
+
+
+def classify_many(quads):
+    """Symmetrie-Klasse je Kreis (Liste, gleiche Reihenfolge wie quads)."""
+    return [symmetry_class(q) for q in quads]
+
+
+def changing_steps_many(quads):
+    """Veränderende Schritte je Kreis (Liste von Tupeln)."""
+    return [CHANGING_STEPS[symmetry_class(q)] for q in quads]
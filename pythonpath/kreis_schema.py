@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_schema.py  (shared helper, no UNO imports)
+
+EIN Ort für das Wortlisten-Layout beider Blätter (Prüfer, Import, Generator, Wortspiel):
+
+KREIS_WORTRAETSEL  (KREIS_WORTRAETSEL_V1, KREIS_WORTRAETSEL_IMPORT_V2, kreis_analytics)
+    Wort in AG + 7*(L-5): 5->AG, 6->AN, 7->AU, 8->BB, 9->BI, 10->BP, 11->BW, 12->CD
+    +1 Import-Zeitstempel, +2 "benutzt"-Zeitstempel (30-Tage-Regel)
+
+KREIS_WORTSPIEL  (KREIS_WORTSPIEL_PRUEFER, KREIS_WORTSPIEL_V1..V3)
+    8 -> AG (fix), sonst AG + 7 + 7*(L-5): 5->AN, 6->AU, 7->BB, 9->BP, 10->BW, 11->CD, 12->CK
+    BI (Rasterplatz von 8) ist nur ein Alias der 8er-Liste in AG (kein zweiter Datenbestand,
+    alte Dokumente: migrate_alias_block)
+    +1 Import-Zeitstempel, +3 verwendetes Wort, +4 "benutzt"-Zeitstempel
+
+Bulk-APIs (je Block EIN getDataArray / setDataArray statt Zellschleifen):
+    read_block / read_blocks / iter_entries / free_rows / write_rows / compact_block
+    cell_text: Zellwert als Text (wie beim Lesen der Blöcke)
+Aliase:
+    resolve_col0 / alias_col0s / migrate_alias_block
+"""
+
+SHEET_WORTRAETSEL = "KREIS_WORTRAETSEL"
+SHEET_WORTSPIEL = "KREIS_WORTSPIEL"
+
+# Feldnamen (Spaltenversatz zum Wort je Schema)
+F_WORD = "word"
+F_IMPORTED = "imported"
+F_USED_WORD = "used_word"
+F_USED = "used"
+
+AG0 = 32  # Spalte AG (0-basiert)
+BLOCK_STEP = 7
+
+
+def _wortraetsel_cols():
+    return {L: AG0 + (L - 5) * BLOCK_STEP for L in range(5, 13)}
+
+
+def _wortspiel_cols():
+    cols = {L: AG0 + BLOCK_STEP + (L - 5) * BLOCK_STEP for L in range(5, 13) if L != 8}
+    cols[8] = AG0
+    return cols
+
+
+SCHEMAS = {
+    SHEET_WORTRAETSEL: {
+        "sheet": SHEET_WORTRAETSEL,
+        "count_row": 2,
+        "header_row": 3,
+        "start_row": 4,
+        "max_rows": 500,
+        "len_min": 5,
+        "len_max": 12,
+        "cols": _wortraetsel_cols(),
+        "aliases": {},
+        "fields": {F_WORD: 0, F_IMPORTED: 1, F_USED: 2},
+    },
+    SHEET_WORTSPIEL: {
+        "sheet": SHEET_WORTSPIEL,
+        "count_row": 2,
+        "header_row": 3,
+        "start_row": 4,
+        "max_rows": 600,
+        "len_min": 5,
+        "len_max": 12,
+        "cols": _wortspiel_cols(),
+        "aliases": {AG0 + BLOCK_STEP + 3 * BLOCK_STEP: 8},  # BI -> 8er-Liste (AG)
+        "fields": {F_WORD: 0, F_IMPORTED: 1, F_USED_WORD: 3, F_USED: 4},
+    },
+}
+
+
+# ============================================================
+# 1) SPALTEN
+# ============================================================
+
+def get_schema(sheet_name: str):
+    return SCHEMAS[sheet_name]
+
+
+def col_letters(col0: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    n = col0 + 1
+    s = ""
+    while n > 0:
+        n, r = divmod(n - 1, 26)
+        s = chr(65 + r) + s
+    return s
+
+
+def col_index(letters: str) -> int:
+    """A -> 0, AA -> 26 (0-basiert)"""
+    n = 0
+    for ch in (letters or "").strip().upper():
+        n = n * 26 + (ord(ch) - 64)
+    return n - 1
+
+
+def lengths(schema):
+    return list(range(schema["len_min"], schema["len_max"] + 1))
+
+
+def word_col0(schema, L: int) -> int:
+    try:
+        return schema["cols"][L]
+    except KeyError:
+        raise ValueError(f"Keine Wortliste für Länge {L} in {schema['sheet']}")
+
+
+def resolve_col0(schema, col0: int) -> int:
+    """Alias-Spalte -> Wortspalte der echten Liste (sonst unverändert)."""
+    L = schema["aliases"].get(col0)
+    return col0 if L is None else word_col0(schema, L)
+
+
+def alias_col0s(schema, L: int):
+    """Alias-Spalten, die auf die Liste der Länge L zeigen."""
+    return sorted(c for c, aL in schema["aliases"].items() if aL == L)
+
+
+def field_col0(schema, L: int, field: str) -> int:
+    return word_col0(schema, L) + schema["fields"][field]
+
+
+def field_offset(schema, field: str) -> int:
+    return schema["fields"][field]
+
+
+def block_width(schema) -> int:
+    """Spalten von Wort bis zum letzten Meta-Feld."""
+    return max(schema["fields"].values()) + 1
+
+
+def row_span(schema, max_rows=None):
+    """(erste_zeile0, letzte_zeile0) der Liste"""
+    start0 = schema["start_row"] - 1
+    return start0, start0 + (max_rows or schema["max_rows"]) - 1
+
+
+# ============================================================
+# 2) LESEN (bulk)
+# ============================================================
+
+def read_block(sheet, schema, L: int = None, col0: int = None, max_rows=None):
+    """
+    EIN getDataArray über Wort..letztes Feld eines Blocks.
+    Returns: Tupel von Zeilen (Werte wie von getDataArray, Index = Feldversatz)
+    """
+    c0 = word_col0(schema, L) if col0 is None else col0
+    r0, r1 = row_span(schema, max_rows)
+    try:
+        return sheet.getCellRangeByPosition(c0, r0, c0 + block_width(schema) - 1, r1).getDataArray()
+    except Exception:
+        return ()
+
+
+def read_blocks(sheet, schema, lens=None, max_rows=None):
+    """
+    Alle Blöcke mit EINEM getDataArray über die ganze Spannweite.
+    Returns: {L: Zeilen wie read_block}
+    """
+    lens = list(lens or lengths(schema))
+    cols = {L: word_col0(schema, L) for L in lens}
+    w = block_width(schema)
+    c_first = min(cols.values())
+    c_last = max(cols.values()) + w - 1
+    r0, r1 = row_span(schema, max_rows)
+    try:
+        data = sheet.getCellRangeByPosition(c_first, r0, c_last, r1).getDataArray()
+    except Exception:
+        data = ()
+    return {L: tuple(tuple(row[c - c_first:c - c_first + w]) for row in data) for L, c in cols.items()}
+
+
+def cell_text(v) -> str:
+    """Zellwert aus getDataArray als Text: ganze Zahlen ohne ".0", Leerraum entfernt."""
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    return str(v).strip()
+
+
+def iter_entries(schema, data):
+    """
+    Nicht-leere Listenzeilen aus read_block-Daten.
+    Yields: (row_1based, {feld: text})
+    """
+    start = schema["start_row"]
+    fields = schema["fields"]
+    for i, row in enumerate(data):
+        w = cell_text(row[0]) if row else ""
+        if not w:
+            continue
+        yield start + i, {f: cell_text(row[off]) if off < len(row) else "" for f, off in fields.items()}
+
+
+def free_rows(schema, data):
+    """Zeilen (1-basiert) ohne Wort, in aufsteigender Reihenfolge."""
+    start = schema["start_row"]
+    return [start + i for i, row in enumerate(data) if not (cell_text(row[0]) if row else "")]
+
+
+def count_words(data) -> int:
+    return sum(1 for row in data if row and cell_text(row[0]))
+
+
+# ============================================================
+# 3) SCHREIBEN (bulk)
+# ============================================================
+
+def _runs(rows):
+    run = []
+    for item in rows:
+        if run and item[0] != run[-1][0] + 1:
+            yield run
+            run = []
+        run.append(item)
+    if run:
+        yield run
+
+
+def write_rows(sheet, schema, L: int, rows, col0: int = None):
+    """
+    rows: [(row_1based, {feld: text})]; nur die angegebenen Felder werden geändert.
+    Je zusammenhängendem Zeilenlauf: ein getDataArray (falls Lücken zwischen Feldern)
+    + ein setDataArray über die benötigten Spalten.
+    """
+    if not rows:
+        return
+    c0 = word_col0(schema, L) if col0 is None else col0
+    fields = schema["fields"]
+    used = sorted({fields[f] for _r, vals in rows for f in vals})
+    lo, hi = used[0], used[-1]
+    need_read = len(used) != hi - lo + 1
+
+    for run in _runs(sorted(rows, key=lambda x: x[0])):
+        r_first = run[0][0] - 1
+        r_last = run[-1][0] - 1
+        rng = sheet.getCellRangeByPosition(c0 + lo, r_first, c0 + hi, r_last)
+        if need_read:
+            base = [list(r) for r in rng.getDataArray()]
+        else:
+            base = [[""] * (hi - lo + 1) for _ in run]
+        for i, (_r, vals) in enumerate(run):
+            for f, v in vals.items():
+                base[i][fields[f] - lo] = v
+        rng.setDataArray(tuple(tuple(r) for r in base))
+
+
+def compact_block(sheet, schema, L: int = None, col0: int = None, max_rows=None) -> int:
+    """
+    Schiebt alle Listenzeilen (Wort + ALLE Meta-Felder) lückenlos nach oben.
+    EIN getDataArray + EIN setDataArray. Returns: Anzahl Wörter.
+    """
+    c0 = word_col0(schema, L) if col0 is None else col0
+    data = read_block(sheet, schema, col0=c0, max_rows=max_rows)
+    if not data:
+        return 0
+    w = len(data[0])
+    keep = [tuple(row) for row in data if cell_text(row[0])]
+    out = keep + [("",) * w] * (len(data) - len(keep))
+    if out != [tuple(r) for r in data]:
+        r0, r1 = row_span(schema, max_rows)
+        sheet.getCellRangeByPosition(c0, r0, c0 + w - 1, r1).setDataArray(tuple(out))
+    return len(keep)
+
+
+# ============================================================
+# 4) ALIAS-MIGRATION (alte Dokumente mit zweitem Block)
+# ============================================================
+
+def migrate_alias_block(sheet, schema, alias_col0: int, max_rows=None):
+    """
+    Übernimmt Einträge eines alten Doppel-Blocks (z.B. BI) in die echte Liste und leert ihn.
+    - Wörter, die in der Liste schon stehen, werden nur verworfen (Liste gewinnt)
+    - neue Wörter kommen mit allen Meta-Feldern in freie Zeilen der Liste
+    - reicht der Platz nicht, bleiben die übrigen Zeilen im Alias-Block stehen
+    Returns: (übernommen, doppelt, übrig)
+    """
+    L = schema["aliases"][alias_col0]
+    fields = schema["fields"]
+    target = read_block(sheet, schema, L, max_rows=max_rows)
+    source = read_block(sheet, schema, col0=alias_col0, max_rows=max_rows)
+
+    present = {f[F_WORD].upper() for _r, f in iter_entries(schema, target)}
+    free = free_rows(schema, target)
+
+    moved = []
+    dup = 0
+    left = []
+    for _r, f in iter_entries(schema, source):
+        w = f[F_WORD].upper()
+        if w in present:
+            dup += 1
+        elif free:
+            present.add(w)
+            moved.append((free.pop(0), {k: (w if k == F_WORD else f[k]) for k in fields}))
+        else:
+            left.append(f)
+
+    write_rows(sheet, schema, L, moved)
+
+    # Alias-Block neu schreiben: nur die nicht übernommenen Zeilen bleiben (EIN setDataArray)
+    if source:
+        width = len(source[0])
+        rows = []
+        for f in left:
+            row = [""] * width
+            for k, off in fields.items():
+                row[off] = f[k]
+            rows.append(tuple(row))
+        rows += [("",) * width] * (len(source) - len(rows))
+        r0, r1 = row_span(schema, max_rows)
+        sheet.getCellRangeByPosition(alias_col0, r0, alias_col0 + width - 1, r1).setDataArray(tuple(rows))
+
+    return len(moved), dup, len(left)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_scramble.py  (shared helper, no UNO)
+
+Globaler Scramble-Planer: wählt die Rotationen ALLER Kreise gemeinsam.
+
+Regeln (in einem Durchgang, ohne "nochmal klicken"):
+- Kreise, die sich drehen lassen, werden gedreht (außer allow_solved erlaubt
+  bewusst 0° für einzelne Kreise)
+- höchstens max_solved Kreise bleiben in Lösungsstellung
+  (rotationssymmetrische/leere Kreise zählen immer dazu – die lassen sich nicht ändern)
+- NIE die komplette Lösung (sofern überhaupt ein Kreis drehbar ist)
+- optional: score_fn + target -> unter max_tries gültigen Plänen den nächsten am Ziel wählen
+
+quads: Liste von [UL, UR, LL, LR] (Lösungsstellung), Reihenfolge bleibt erhalten.
+"""
+
+import random
+
+from kreis_rotation import rotate_quad, changing_steps
+
+
+def plan_scramble(quads, max_solved=None, allow_solved=False,
+                  score_fn=None, target=None, tolerance=0.0,
+                  max_tries=64, rng=None):
+    """
+    max_solved:   Obergrenze für Kreise in Lösungsstellung (None = keine Grenze,
+                  aber trotzdem nie die komplette Lösung)
+    allow_solved: True -> drehbare Kreise dürfen bewusst 0° behalten (im Rahmen von max_solved)
+    score_fn:     optional f(steps, scrambled_quads) -> float
+    target:       Zielwert für score_fn (None = erster gültiger Plan)
+    tolerance:    |score - target| <= tolerance -> sofort fertig
+    max_tries:    Obergrenze für die Anzahl bewerteter Pläne (nur mit score_fn/target)
+
+    Returns: (steps, scrambled, info)
+      steps:     Liste 0..3 (Schritte im Uhrzeigersinn) je Kreis
+      scrambled: Liste von [UL, UR, LL, LR] je Kreis
+      info:      {"total", "solved_after", "forced_solved", "max_solved",
+                  "feasible", "full_solution", "score", "tries"}
+    """
+    rng = rng or random
+    total = len(quads)
+    options = [changing_steps(q) for q in quads]
+    movable = [i for i, opts in enumerate(options) if opts]
+    forced = total - len(movable)
+
+    # Wie viele drehbare Kreise dürfen zusätzlich 0° behalten?
+    budget = 0
+    if allow_solved and movable:
+        budget = len(movable) - 1  # mind. 1 Kreis muss sich ändern
+        if max_solved is not None:
+            budget = min(budget, max(0, max_solved - forced))
+
+    info = {
+        "total": total,
+        "solved_after": forced,
+        "forced_solved": forced,
+        "max_solved": max_solved,
+        # nur durch Symmetrie verletzbar – dann hilft auch kein erneutes Mischen
+        "feasible": max_solved is None or forced <= max_solved,
+        "full_solution": total > 0 and not movable,
+        "score": None,
+        "tries": 0,
+    }
+
+    def _one_plan():
+        keep = set(rng.sample(movable, rng.randint(0, budget))) if budget else set()
+        steps = [0 if (i in keep or not opts) else rng.choice(opts)
+                 for i, opts in enumerate(options)]
+        return steps, len(keep)
+
+    use_score = score_fn is not None and target is not None
+    tries = max(1, int(max_tries)) if use_score else 1
+
+    best = None
+    for _ in range(tries):
+        steps, kept = _one_plan()
+        scrambled = [rotate_quad(q, s) for q, s in zip(quads, steps)]
+        info["tries"] += 1
+
+        if not use_score:
+            best = (0.0, steps, scrambled, kept, None)
+            break
+
+        score = score_fn(steps, scrambled)
+        dist = abs(score - target)
+        if best is None or dist < best[0]:
+            best = (dist, steps, scrambled, kept, score)
+        if dist <= tolerance:
+            break
+
+    _dist, steps, scrambled, kept, score = best
+    info["solved_after"] = forced + kept
+    info["score"] = score
+    return steps, scrambled, info
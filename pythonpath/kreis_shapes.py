@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_shapes.py  (shared helper; UNO nur für Enum-Werte/Structs, erst beim Aufruf in LibreOffice)
+
+Kreis + Kreuz + 4 Buchstaben aus EINER vorbereiteten Vorlage statt Shape für Shape
+mit 8–10 Einzelzuweisungen (jede in try/except):
+
+- ShapeTemplate: Dienstname + feste Eigenschaften (Füllung, Linie, Schrift, Ausrichtung),
+  Namen sortiert und Werte (Enums) EINMAL aufgelöst
+- je Kopie: createInstance, add, EIN setPropertyValues (Vorlage + Name/Description/Farbe),
+  setPosition/setSize, bei Texten setString
+- CircleTemplate: die 7 Teile eines Kreises (Ellipse, 2 Linien, 4 Texte), Namen wie bisher
+  {MARK_DESC}_circle_<tag>, _vline_/_hline_ (bzw. eigene Präfixe), _text_<tag>_<1..4>
+
+Die Drawing-API kennt kein Klonen einzelner Shapes (nur Zwischenablage/Dispatcher mit Auswahl);
+die "Vorlage" ist deshalb der fertige Eigenschaftssatz, der je Shape mit EINEM Aufruf
+(XMultiPropertySet) gesetzt wird. Schlägt der Sammelaufruf fehl, wird einzeln gesetzt.
+"""
+
+from kreis_uno import enum
+
+BOLD = 150.0  # com.sun.star.awt.FontWeight.BOLD
+
+_FILL_NONE = ("com.sun.star.drawing.FillStyle", "NONE")
+_FILL_SOLID = ("com.sun.star.drawing.FillStyle", "SOLID")
+_LINE_NONE = ("com.sun.star.drawing.LineStyle", "NONE")
+_H_CENTER = ("com.sun.star.drawing.TextHorizontalAdjust", "CENTER")
+_V_CENTER = ("com.sun.star.drawing.TextVerticalAdjust", "CENTER")
+
+
+def _value(v):
+    if isinstance(v, tuple):
+        return enum(*v)  # einmal aufgelöst, dann aus dem Cache
+    return v
+
+
+def _struct(name, a, b):
+    import uno
+    return uno.createUnoStruct(name, int(a), int(b))
+
+
+def _set_all(shape, names, values):
+    """EIN setPropertyValues (Namen aufsteigend sortiert); Fallback: einzeln, Fehler ignorieren."""
+    try:
+        shape.setPropertyValues(names, values)
+        return
+    except Exception:
+        pass
+    for n, v in zip(names, values):
+        try:
+            shape.setPropertyValue(n, v)
+        except Exception:
+            pass
+
+
+def set_shape_text(shape, text):
+    try:
+        shape.setString(text)
+    except Exception:
+        try:
+            shape.Text.setString(text)
+        except Exception:
+            pass
+
+
+class ShapeTemplate:
+    def __init__(self, service: str, props):
+        self.service = service
+        self.props = dict(props)
+        self._prepared = None
+
+    def _fixed(self):
+        if self._prepared is None:
+            self._prepared = {k: _value(v) for k, v in self.props.items()}
+        return self._prepared
+
+    def create(self, doc, draw_page, x, y, w, h, **per_copy):
+        """per_copy: z.B. Name, Description, FillColor – zusammen mit der Vorlage EIN Aufruf."""
+        shape = doc.createInstance(self.service)
+        draw_page.add(shape)  # erst adden -> dann zuverlässig setzen
+        props = dict(self._fixed())
+        props.update(per_copy)
+        names = tuple(sorted(props))
+        _set_all(shape, names, tuple(props[n] for n in names))
+        shape.setPosition(_struct("com.sun.star.awt.Point", x, y))
+        shape.setSize(_struct("com.sun.star.awt.Size", w, h))
+        return shape
+
+
+class CircleTemplate:
+    """
+    mark_desc:   Marker (Description) und Namenspräfix der Shapes
+    char_height: Buchstabengröße (pt), bold: fett
+    text_box:    Kantenlänge der Textfelder (1/100 mm)
+    line_tags:   Namensteile der Kreuzlinien (z.B. ("v", "h") in KREIS_WORTSPIEL_V3)
+    solid_fill:  FillStyle SOLID explizit setzen
+    """
+
+    def __init__(self, mark_desc, char_height=16, bold=True, text_box=700,
+                 line_tags=("vline", "hline"), solid_fill=False):
+        self.mark_desc = mark_desc
+        self.text_box = int(text_box)
+        self.line_tags = line_tags
+
+        circle = {"LineColor": 0x000000}
+        if solid_fill:
+            circle["FillStyle"] = _FILL_SOLID
+        text = {
+            "FillStyle": _FILL_NONE,
+            "LineStyle": _LINE_NONE,
+            "CharHeight": float(char_height),
+            "CharColor": 0x000000,
+            "TextHorizontalAdjust": _H_CENTER,
+            "TextVerticalAdjust": _V_CENTER,
+        }
+        if bold:
+            text["CharWeight"] = BOLD
+
+        self.circle = ShapeTemplate("com.sun.star.drawing.EllipseShape", circle)
+        self.line = ShapeTemplate("com.sun.star.drawing.LineShape", {"LineColor": 0x000000})
+        self.text = ShapeTemplate("com.sun.star.drawing.TextShape", text)
+
+    def _names(self, suffix):
+        return {"Name": f"{self.mark_desc}_{suffix}", "Description": self.mark_desc}
+
+    def draw(self, doc, draw_page, x, y, size, fill_color, texts, idx_tag):
+        """Zeichnet einen Kreis. Returns: die 4 Text-Shapes [UL, UR, LL, LR]."""
+        x, y, size = int(x), int(y), int(size)
+        self.circle.create(doc, draw_page, x, y, size, size,
+                           FillColor=fill_color, **self._names(f"circle_{idx_tag}"))
+
+        cx = x + size // 2
+        cy = y + size // 2
+        v_tag, h_tag = self.line_tags
+        self.line.create(doc, draw_page, cx, y, 0, size, **self._names(f"{v_tag}_{idx_tag}"))
+        self.line.create(doc, draw_page, x, cy, size, 0, **self._names(f"{h_tag}_{idx_tag}"))
+
+        # Quadranten-Zentren
+        q1x = x + size // 4
+        q3x = x + (3 * size) // 4
+        q1y = y + size // 4
+        q3y = y + (3 * size) // 4
+        centers = [(q1x, q1y), (q3x, q1y), (q1x, q3y), (q3x, q3y)]  # UL, UR, LL, LR
+
+        w = self.text_box
+        shapes = []
+        for i, ((tcx, tcy), txt) in enumerate(zip(centers, texts), start=1):
+            t = self.text.create(doc, draw_page, tcx - w // 2, tcy - w // 2, w, w,
+                                 **self._names(f"text_{idx_tag}_{i}"))
+            set_shape_text(t, txt)
+            shapes.append(t)
+        return shapes
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_solver.py  (shared helper, no UNO)
+
+Prüft, ob ein (gemischtes) Kreis-Rätsel genau EINE Lösung hat.
+
+- Jede Kreiszeile ist unabhängig: oben ein Wort, unten ein Wort
+- Je Kreis werden nur die unterscheidbaren Stellungen probiert (1, 2 oder 4,
+  siehe kreis_rotation.symmetry_class) -> max. 4^6 je Zeile
+- Tiefensuche mit Präfix-Abbruch nach jedem Kreis (2 Buchstaben pro Halbzeile),
+  Abbruch sobald 'limit' Lösungen gefunden sind (für "eindeutig?" reicht 2)
+
+Index: jedes Objekt mit  `wort in index`  und  `index.has_prefix(präfix)`
+(Standard: kreis_wordindex.WordTrie); Wörter sind mit Leerzeichen auf
+Kreisbreite (2 * Kreise) aufgefüllt.
+"""
+
+from kreis_model import num_circles_for_len, row_words
+from kreis_rotation import rotate_quad, changing_steps
+from kreis_wordindex import WordTrie, load_or_build
+
+
+# ============================================================
+# 1) INDEX (Trie aus kreis_wordindex.py)
+# ============================================================
+
+def build_word_index(words, L: int, cache_name: str = ""):
+    """
+    Trie für Wortlänge L, aufgefüllt auf Kreisbreite (2 * num_circles_for_len).
+    cache_name: wenn gesetzt, aus dem marshal-Cache laden (neu bauen nur bei geänderter Liste)
+    """
+    pad_to = 2 * num_circles_for_len(L)
+    if cache_name:
+        return load_or_build(words, pad_to=pad_to, name=cache_name)
+    return WordTrie(words, pad_to=pad_to)
+
+
+# ============================================================
+# 2) ZEILE LÖSEN
+# ============================================================
+
+def _positions(q):
+    """Unterscheidbare Stellungen eines Kreises als (schritte, quad)."""
+    return [(0, q)] + [(s, rotate_quad(q, s)) for s in changing_steps(q)]
+
+
+def row_solutions(quads, index, limit: int = 2):
+    """
+    quads: Kreiszeile in beliebiger Stellung (z.B. gemischt)
+    Returns: Liste von Schritt-Tupeln (je Kreis 0..3, relativ zu quads),
+             bei denen oben UND unten ein Wort aus dem Index steht (max. limit Stück).
+    Halbzeilen, die komplett leer sind, werden nicht geprüft.
+    """
+    if not quads:
+        return []
+    top0, bot0 = row_words(quads)
+    top_wild = not top0.strip()
+    bot_wild = not bot0.strip()
+    if top_wild and bot_wild:
+        return []
+
+    options = [_positions(q) for q in quads]
+    n = len(quads)
+    last = n - 1
+    found = []
+
+    stack = [(0, "", "", ())]
+    while stack:
+        c, top, bot, steps = stack.pop()
+        complete = (c == last)
+        for s, q in options[c]:
+            t = top + q[0] + q[1]
+            b = bot + q[2] + q[3]
+            if complete:
+                if (top_wild or t in index) and (bot_wild or b in index):
+                    found.append(steps + (s,))
+                    if len(found) >= limit:
+                        return found
+            elif (top_wild or index.has_prefix(t)) and (bot_wild or index.has_prefix(b)):
+                stack.append((c + 1, t, b, steps + (s,)))
+    return found
+
+
+def count_row_solutions(quads, index, limit: int = 64) -> int:
+    """Anzahl Lösungen einer Kreiszeile (gedeckelt bei limit)."""
+    return len(row_solutions(quads, index, limit))
+
+
+# ============================================================
+# 3) RÄTSEL PRÜFEN
+# ============================================================
+
+def verify_unique(rows, index, limit: int = 2):
+    """
+    rows: Liste von Kreiszeilen (je Liste von [UL, UR, LL, LR])
+    Returns: {"unique", "counts", "ambiguous_rows", "unsolvable_rows"}
+      counts[i] = None für leere Zeilen, sonst Anzahl Lösungen (gedeckelt bei limit)
+      unique    = jede belegte Zeile hat genau 1 Lösung
+    """
+    counts = []
+    ambiguous = []
+    unsolvable = []
+    for i, quads in enumerate(rows):
+        top, bot = row_words(quads)
+        if not top.strip() and not bot.strip():
+            counts.append(None)
+            continue
+        n = len(row_solutions(quads, index, limit))
+        counts.append(n)
+        if n == 0:
+            unsolvable.append(i)
+        elif n > 1:
+            ambiguous.append(i)
+
+    return {
+        "unique": not ambiguous and not unsolvable,
+        "counts": counts,
+        "ambiguous_rows": ambiguous,
+        "unsolvable_rows": unsolvable,
+    }
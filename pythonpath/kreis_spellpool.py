@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_spellpool.py  (shared helper, no UNO)
+
+Rechtschreibprüfung für viele Wörter auf einmal (Import großer Listen).
+
+Zwei Arten von Arbeitern:
+- Threads:   für den LO-SpellChecker (UNO). Jeder Thread holt sich EINEN eigenen Checker
+             (make_checker), check(checker, wort) -> bool. Nur auf ausdrücklichen Wunsch
+             (mode="thread"): UNO-Aufrufe aus Python-Threads eines Makros sind nicht
+             überall sicher, und ob sie unter der globalen LO-Sperre schneller sind, ist offen.
+- Prozesse:  für ein Offline-Wörterbuch (Textdatei, ein Wort pro Zeile, oder Hunspell .dic
+             ohne Affix-Expansion). Jeder Prozess lädt das Wörterbuch einmal.
+
+Ergebnis ist immer eine Liste von bool in der Reihenfolge der Eingabe – das Schreiben
+ins Blatt bleibt einfädig beim Aufrufer.
+
+Fällt ein Pool aus (z.B. kein Multiprocessing im eingebetteten LO-Python), wird
+nacheinander im aktuellen Thread geprüft.
+
+Viele Batches (Datei-Import): SpellSession legt Checker bzw. Prozess-Pool EINMAL an;
+das Offline-Wörterbuch wird je Datei nur einmal geladen (load_dictionary, Cache nach Pfad).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+SPELL_WORKERS = 4
+CHUNK_THREAD = 64      # Wörter pro Auftrag (Threads)
+CHUNK_PROCESS = 2048   # Wörter pro Auftrag (Prozesse, Übertragung ist teurer)
+
+MODE_OFF = "off"          # nacheinander
+MODE_THREAD = "thread"    # UNO-SpellChecker
+MODE_PROCESS = "process"  # Offline-Wörterbuch
+
+
+def _chunks(seq, n):
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+# ============================================================
+# 1) THREADS (UNO, ein Checker je Thread)
+# ============================================================
+
+def check_sequential(words, check, checker):
+    return [bool(check(checker, w)) for w in words]
+
+
+def check_threaded(words, check, make_checker, workers=SPELL_WORKERS, chunk_size=CHUNK_THREAD):
+    """
+    words:        Liste von Wörtern
+    check:        check(checker, wort) -> bool
+    make_checker: () -> checker (wird je Thread genau einmal aufgerufen)
+    Returns: [bool] in Eingabe-Reihenfolge
+    """
+    words = list(words)
+    if not words:
+        return []
+    if workers <= 1 or len(words) <= chunk_size:
+        return check_sequential(words, check, make_checker())
+
+    local = threading.local()
+
+    def _run(chunk):
+        checker = getattr(local, "checker", None)
+        if checker is None:
+            checker = local.checker = make_checker()
+        return check_sequential(chunk, check, checker)
+
+    out = []
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for part in ex.map(_run, _chunks(words, chunk_size)):  # map = Eingabe-Reihenfolge
+            out.extend(part)
+    return out
+
+
+# ============================================================
+# 2) PROZESSE (Offline-Wörterbuch)
+# ============================================================
+
+class WordListDictionary:
+    """
+    Offline-Wörterbuch aus einer UTF-8-Datei.
+    - ein Wort pro Zeile; bei Hunspell-.dic wird "wort/FLAGS" auf "wort" gekürzt
+      (Beugungsformen fehlen dann – besser eine ausgerollte Liste, z.B. per 'unmunch')
+    - Vergleich ohne Groß/Klein
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.words = set()
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                w = line.strip().split("/", 1)[0].strip()
+                if w and not w.isdigit():
+                    self.words.add(w.casefold())
+
+    def is_valid(self, word: str) -> bool:
+        return (word or "").strip().casefold() in self.words
+
+
+_DICTS = {}  # absoluter Pfad -> ((Größe, mtime), WordListDictionary)
+
+
+def load_dictionary(path) -> WordListDictionary:
+    """Offline-Wörterbuch einmal je Datei laden; neu nur, wenn sich die Datei geändert hat."""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_size, st.st_mtime_ns)
+    hit = _DICTS.get(key)
+    if hit is None or hit[0] != stamp:
+        hit = _DICTS[key] = (stamp, WordListDictionary(key))
+    return hit[1]
+
+
+_proc_dict = None
+
+
+def _proc_init(path):
+    global _proc_dict
+    _proc_dict = WordListDictionary(path)
+
+
+def _proc_check(chunk):
+    return [_proc_dict.is_valid(w) for w in chunk]
+
+
+def check_processes(words, dict_path, workers=None, chunk_size=CHUNK_PROCESS):
+    """
+    Prüft words gegen das Offline-Wörterbuch dict_path in einem Prozess-Pool.
+    Returns: [bool] in Eingabe-Reihenfolge
+    """
+    words = list(words)
+    if not words:
+        return []
+    workers = workers or min(SPELL_WORKERS, os.cpu_count() or 1)
+    if workers <= 1 or len(words) <= chunk_size:
+        d = load_dictionary(dict_path)
+        return [d.is_valid(w) for w in words]
+
+    out = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_proc_init, initargs=(dict_path,)) as ex:
+        for part in ex.map(_proc_check, _chunks(words, chunk_size)):
+            out.extend(part)
+    return out
+
+
+# ============================================================
+# 3) EINSTIEG
+# ============================================================
+
+class SpellSession:
+    """
+    Eine Sitzung je Import: Checker (nacheinander), Prozess-Pool und Wörterbuch werden
+    beim ersten Bedarf angelegt und für alle Batches wiederverwendet.
+
+        with SpellSession(mode, check, make_checker, dict_path=...) as spell:
+            for batch in ...:
+                ok = spell.check(batch)
+
+    checker: vorhandener Checker für "off" (sonst make_checker())
+    """
+
+    def __init__(self, mode=MODE_OFF, check=None, make_checker=None, workers=SPELL_WORKERS,
+                 dict_path="", checker=None):
+        self.mode = mode
+        self.workers = workers
+        self.dict_path = dict_path
+        self._check = check
+        self._make_checker = make_checker
+        self._checker = checker
+        self._pool = None
+        self._pool_failed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def close(self):
+        if self._pool is not None:
+            try:
+                self._pool.shutdown()
+            except Exception:
+                pass
+            self._pool = None
+
+    def check(self, words):
+        """Returns: [bool] in Eingabe-Reihenfolge."""
+        words = list(words)
+        if not words:
+            return []
+        if self.mode == MODE_PROCESS and self.dict_path:
+            return self._check_offline(words)
+        if self.mode == MODE_THREAD:
+            try:
+                return check_threaded(words, self._check, self._make_checker, self.workers)
+            except Exception:
+                pass
+        if self._checker is None:
+            self._checker = self._make_checker()
+        return check_sequential(words, self._check, self._checker)
+
+    def _check_offline(self, words):
+        workers = min(self.workers, os.cpu_count() or 1)
+        if workers > 1 and len(words) > CHUNK_PROCESS and not self._pool_failed:
+            try:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(max_workers=workers, initializer=_proc_init,
+                                                     initargs=(self.dict_path,))
+                out = []
+                for part in self._pool.map(_proc_check, _chunks(words, CHUNK_PROCESS)):
+                    out.extend(part)
+                return out
+            except Exception:
+                self._pool_failed = True  # kein Multiprocessing verfügbar -> im Makro-Prozess
+                self.close()
+        d = load_dictionary(self.dict_path)
+        return [d.is_valid(w) for w in words]
+
+
+def check_words(words, check=None, make_checker=None, mode=MODE_OFF, workers=SPELL_WORKERS,
+                dict_path=""):
+    """
+    Einheitlicher Einstieg für EINEN Batch (viele Batches: SpellSession).
+    mode: "thread" (check + make_checker), "process" (dict_path) oder "off"
+    Returns: [bool] in Eingabe-Reihenfolge
+    """
+    with SpellSession(mode, check, make_checker, workers, dict_path) as spell:
+        return spell.check(words)
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_styles.py  (shared helper; UNO nur für Enum-Werte, erst beim Aufruf in LibreOffice)
+
+Benannte Zellvorlagen statt einzelner Zell-Eigenschaften:
+
+- ensure_cell_styles(doc): legt fehlende Vorlagen EINMAL im Dokument an
+  (Format > Vorlagen, Familie "CellStyles"). Bestehende Vorlagen werden nur aktualisiert,
+  wenn STYLES_VERSION neuer ist als die im Dokument gespeicherte (STYLES_FLAG)
+- apply_style(rng, name):  EINE Zuweisung rng.CellStyle = name statt CharHeight/CharWeight/
+  HoriJustify/VertJustify/IsTextWrapped je Bereich. Schlägt die Zuweisung fehl, werden die
+  Eigenschaften der Vorlage direkt gesetzt (altes Verhalten).
+
+Direkt gesetzte Formatierung älterer Dokumente bleibt erhalten (hat Vorrang vor der Vorlage).
+"""
+
+from kreis_docprops import set_user_prop, stored_layout_version
+from kreis_uno import enum
+
+STYLES_VERSION = 2  # erhöhen, wenn STYLE_DEFS sich ändern (2: Wortliste-Kopf)
+STYLES_FLAG = "KREIS_CELL_STYLES_VERSION"
+
+STYLE_CENTER = "Kreis-Zentriert"
+STYLE_HEADER = "Kreis-Kopf"
+STYLE_LIST_HEADER = "Kreis-Listenkopf"  # wie Kopf, aber nicht fett (fette Zahl als Textteil)
+STYLE_COUNTER = "Kreis-Zaehler"
+STYLE_WORDLIST = "Kreis-Wortliste"
+STYLE_WORDLIST_META = "Kreis-Wortliste-Info"
+STYLE_WORDLIST_HEADER = "Kreis-Wortliste-Kopf"
+
+BOLD = 150.0  # com.sun.star.awt.FontWeight.BOLD
+
+_HORI_CENTER = ("com.sun.star.table.CellHoriJustify", "CENTER")
+_VERT_CENTER = ("com.sun.star.table.CellVertJustify", "CENTER")
+
+# Reihenfolge wichtig: Elternvorlage vor abgeleiteten Vorlagen
+STYLE_DEFS = {
+    STYLE_CENTER: {
+        "HoriJustify": _HORI_CENTER,
+        "VertJustify": _VERT_CENTER,
+    },
+    STYLE_HEADER: {
+        "ParentStyle": STYLE_CENTER,
+        "CharHeight": 14.0,
+        "CharWeight": BOLD,
+        "IsTextWrapped": True,
+    },
+    STYLE_LIST_HEADER: {
+        "ParentStyle": STYLE_CENTER,
+        "CharHeight": 14.0,
+        "IsTextWrapped": True,
+    },
+    STYLE_COUNTER: {
+        "ParentStyle": STYLE_CENTER,
+        "CharHeight": 12.0,
+        "IsTextWrapped": True,
+    },
+    STYLE_WORDLIST: {
+        "ParentStyle": STYLE_CENTER,
+        "CharHeight": 16.0,
+    },
+    STYLE_WORDLIST_META: {
+        "ParentStyle": STYLE_WORDLIST,
+        "CharHeight": 12.0,
+    },
+    STYLE_WORDLIST_HEADER: {
+        "CharHeight": 10.5,
+        "CharWeight": BOLD,
+    },
+}
+
+
+def _value(v):
+    if isinstance(v, tuple):
+        return enum(*v)  # einmal aufgelöst, dann aus dem Cache
+    return v
+
+
+def _set_props(obj, props, with_parent=False):
+    for k, v in props.items():
+        try:
+            if k == "ParentStyle":
+                if with_parent:
+                    obj.setParentStyle(v)  # XStyle
+            else:
+                obj.setPropertyValue(k, _value(v))
+        except Exception:
+            pass
+
+
+def _resolved_props(name):
+    """Eigenschaften inkl. Elternvorlagen (für den Fallback ohne Vorlage)."""
+    props = {}
+    chain = []
+    while name in STYLE_DEFS:
+        chain.append(STYLE_DEFS[name])
+        name = STYLE_DEFS[name].get("ParentStyle")
+    for p in reversed(chain):
+        props.update(p)
+    props.pop("ParentStyle", None)
+    return props
+
+
+def ensure_cell_styles(doc, defs=None) -> int:
+    """
+    Legt fehlende Zellvorlagen an; bei neuer STYLES_VERSION (nur STYLE_DEFS) werden auch
+    bestehende einmal auf die aktuellen Eigenschaften gesetzt.
+    Returns: Anzahl neu angelegter bzw. aktualisierter Vorlagen.
+    """
+    update = defs is None and stored_layout_version(doc, STYLES_FLAG) < STYLES_VERSION
+    defs = defs or STYLE_DEFS
+    try:
+        family = doc.StyleFamilies.getByName("CellStyles")
+    except Exception:
+        return 0
+    changed = 0
+    for name, props in defs.items():
+        try:
+            if family.hasByName(name):
+                if not update:
+                    continue
+                style = family.getByName(name)
+            else:
+                style = doc.createInstance("com.sun.star.style.CellStyle")
+                family.insertByName(name, style)
+            _set_props(style, props, with_parent=True)
+            changed += 1
+        except Exception:
+            pass
+    if update:
+        set_user_prop(doc, STYLES_FLAG, STYLES_VERSION)
+    return changed
+
+
+def apply_style(rng, name: str) -> None:
+    """EINE Zuweisung; schlägt sie fehl: Eigenschaften direkt setzen."""
+    try:
+        rng.CellStyle = name
+    except Exception:
+        _set_props(rng, _resolved_props(name))
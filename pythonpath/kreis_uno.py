@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_uno.py  (shared helper; importiert uno erst beim ersten Zugriff, nur in LibreOffice)
+
+UNO-Enums und -Konstanten EINMAL auflösen und wiederverwenden, statt
+uno.Enum(...) / uno.getConstantByName(...) bei jedem Aufruf (auch in Schleifen):
+
+- enum("com.sun.star.table.CellHoriJustify", "CENTER")
+- const("com.sun.star.awt.FontWeight.BOLD")
+- Kurzformen: hori("CENTER"), vert("CENTER"), bold(), cell_flags("VALUE", "STRING", ...),
+  message_box(...)
+- kreis_styles / kreis_shapes lösen ihre Enum-Tupel ebenfalls hierüber auf
+
+Gecacht wird je Name für die Laufzeit des Python-Prozesses (Enums/Konstanten ändern sich nie).
+"""
+
+_ENUMS = {}
+_CONSTS = {}
+
+
+def _uno():
+    import uno  # nur innerhalb von LibreOffice vorhanden
+    return uno
+
+
+def enum(type_name: str, value: str):
+    key = (type_name, value)
+    v = _ENUMS.get(key)
+    if v is None:
+        v = _ENUMS[key] = _uno().Enum(type_name, value)
+    return v
+
+
+def const(full_name: str):
+    try:
+        return _CONSTS[full_name]
+    except KeyError:
+        v = _CONSTS[full_name] = _uno().getConstantByName(full_name)
+        return v
+
+
+def clear_cache():
+    _ENUMS.clear()
+    _CONSTS.clear()
+
+
+# ============================================================
+# Kurzformen (die in den Makros verwendeten Typen)
+# ============================================================
+
+def hori(value: str = "CENTER"):
+    return enum("com.sun.star.table.CellHoriJustify", value)
+
+
+def vert(value: str = "CENTER"):
+    return enum("com.sun.star.table.CellVertJustify", value)
+
+
+def bold():
+    return const("com.sun.star.awt.FontWeight.BOLD")
+
+
+def cell_flags(*names) -> int:
+    """cell_flags("VALUE", "STRING", "FORMULA") -> VALUE | STRING | FORMULA (com.sun.star.sheet.CellFlags)."""
+    flags = 0
+    for n in names:
+        flags |= const(f"com.sun.star.sheet.CellFlags.{n}")
+    return flags
+
+
+def message_box(doc, title: str, message: str, box_type: str = "WARNINGBOX") -> None:
+    """Meldungsfenster mit OK-Knopf (MessageBoxType/-Buttons aus dem Cache)."""
+    parent = doc.CurrentController.Frame.ContainerWindow
+    box = parent.getToolkit().createMessageBox(
+        parent,
+        enum("com.sun.star.awt.MessageBoxType", box_type),
+        const("com.sun.star.awt.MessageBoxButtons.BUTTONS_OK"),
+        title, message,
+    )
+    box.execute()
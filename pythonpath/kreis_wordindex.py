@@ -0,0 +1,306 @@
+# -*- coding: utf-8 -*-
+"""
+kreis_wordindex.py  (shared helper, no UNO)
+
+Trie über die (normalisierten) Wortlisten.
+
+- Mitgliedschaft:      wort in trie / trie.get(wort) -> gespeicherter Wert (z.B. Zeile)
+- Präfix:              trie.has_prefix("HA"), trie.words_with_prefix("HA")
+- Paar-Muster:         trie.match_pairs(["HA", "??", "TI", "E?"])  ('?' = beliebiger Buchstabe)
+- Solver-kompatibel:   pad_to=Kreisbreite -> Wörter werden mit Leerzeichen aufgefüllt
+                       (siehe kreis_solver: `wort in index`, `index.has_prefix(p)`)
+
+Zwei Formen, gleiche Abfragen:
+- WordTrie:   veränderbar (add), Knoten = dict {buchstabe: knoten}, Wortende = Schlüssel ""
+- FrozenTrie: kompakt/flach (Knoten in Breitensuche-Reihenfolge, Kinder zusammenhängend):
+              labels (str), first/count (array), Wortende-Flags (bytes)
+              -> marshal lädt das in Millisekunden (keine tausenden dicts)
+
+Cache: load_or_build(words, pad_to, name) – Signatur der Wortliste entscheidet, ob neu gebaut wird.
+"""
+
+import os
+import marshal
+import tempfile
+import zlib
+from array import array
+
+_END = ""
+_CACHE_VERSION = 2
+WILDCARD = "?"
+
+
+# ============================================================
+# 1) GEMEINSAME ABFRAGEN
+# ============================================================
+
+class _TrieQueries:
+    """Abfragen über die Knoten-Primitive _root/_child/_children/_is_end/_value."""
+
+    pad_to = 0
+
+    def _key(self, word: str) -> str:
+        return word.ljust(self.pad_to) if self.pad_to else word
+
+    def _walk(self, key: str):
+        node = self._root()
+        for ch in key:
+            node = self._child(node, ch)
+            if node is None:
+                return None
+        return node
+
+    def _clean(self, acc: str) -> str:
+        return acc.rstrip(" ") if self.pad_to else acc
+
+    def __contains__(self, word: str) -> bool:
+        node = self._walk(self._key(word))
+        return node is not None and self._is_end(node)
+
+    def get(self, word: str, default=None):
+        """Gespeicherter Wert (z.B. Zeilennummer) für ein Wort, sonst default."""
+        node = self._walk(self._key(word))
+        if node is None or not self._is_end(node):
+            return default
+        return self._value(node)
+
+    def has_prefix(self, prefix: str) -> bool:
+        return self._walk(prefix) is not None
+
+    def words_with_prefix(self, prefix: str = "", limit: int = 0):
+        """Alle Wörter mit diesem Präfix (ohne Auffüll-Leerzeichen), optional max. limit."""
+        node = self._walk(prefix)
+        if node is None:
+            return []
+        out = []
+        stack = [(node, prefix)]
+        while stack:
+            n, acc = stack.pop()
+            if self._is_end(n):
+                out.append(self._clean(acc))
+                if limit and len(out) >= limit:
+                    break
+            for ch, child in sorted(self._children(n), reverse=True):
+                stack.append((child, acc + ch))
+        return out
+
+    def match_pairs(self, pairs, limit: int = 0):
+        """
+        pairs: Liste von 2er-Stücken (z.B. aus _pairs_from_word) oder ein String;
+               '?' = beliebiger Buchstabe, "  " am Ende = Wortende (aufgefüllt)
+        Returns: passende Wörter (ohne Auffüll-Leerzeichen)
+        """
+        pattern = "".join(pairs) if not isinstance(pairs, str) else pairs
+        if self.pad_to:
+            pattern = pattern.ljust(self.pad_to)
+        n = len(pattern)
+        out = []
+        stack = [(self._root(), 0, "")]
+        while stack:
+            node, i, acc = stack.pop()
+            if i == n:
+                if self._is_end(node):
+                    out.append(self._clean(acc))
+                    if limit and len(out) >= limit:
+                        break
+                continue
+            ch = pattern[i]
+            if ch == WILDCARD:
+                for k, child in sorted(self._children(node), reverse=True):
+                    if k != " ":
+                        stack.append((child, i + 1, acc + k))
+            else:
+                child = self._child(node, ch)
+                if child is not None:
+                    stack.append((child, i + 1, acc + ch))
+        return out
+
+
+# ============================================================
+# 2) VERÄNDERBAR: WordTrie
+# ============================================================
+
+class WordTrie(_TrieQueries):
+    """Trie mit optionalem Auffüllen auf pad_to Zeichen (Kreisbreite)."""
+
+    def __init__(self, words=(), pad_to: int = 0):
+        self.pad_to = int(pad_to or 0)
+        self.root = {}
+        self.count = 0
+        for w in words:
+            self.add(w)
+
+    def add(self, word: str, value=True):
+        if not word or (self.pad_to and len(word) > self.pad_to):
+            return
+        node = self.root
+        for ch in self._key(word):
+            node = node.setdefault(ch, {})
+        if _END not in node:
+            self.count += 1
+        node[_END] = value
+
+    def __len__(self):
+        return self.count
+
+    def _root(self):
+        return self.root
+
+    def _child(self, node, ch):
+        return node.get(ch)
+
+    def _children(self, node):
+        return [(k, v) for k, v in node.items() if k != _END]
+
+    def _is_end(self, node):
+        return _END in node
+
+    def _value(self, node):
+        return node[_END]
+
+    def freeze(self):
+        """Flache, kompakte Kopie (FrozenTrie) – für Cache und reine Abfragen."""
+        labels = [" "]
+        first = array("I", [0])
+        count = array("H", [0])
+        ends = bytearray([0])
+        values = {}
+
+        queue = [self.root]
+        i = 0
+        while i < len(queue):
+            node = queue[i]
+            kids = sorted(k for k in node if k != _END)
+            first[i] = len(queue)
+            count[i] = len(kids)
+            if _END in node:
+                ends[i] = 1
+                if node[_END] is not True:
+                    values[i] = node[_END]
+            for k in kids:
+                labels.append(k)
+                first.append(0)
+                count.append(0)
+                ends.append(0)
+                queue.append(node[k])
+            i += 1
+
+        return FrozenTrie("".join(labels), first, count, bytes(ends), values, self.pad_to, self.count)
+
+
+# ============================================================
+# 3) KOMPAKT: FrozenTrie
+# ============================================================
+
+class FrozenTrie(_TrieQueries):
+    """Nur lesen. Knoten = int; Kinder von i: labels[first[i] : first[i] + count[i]]."""
+
+    def __init__(self, labels, first, count, ends, values, pad_to: int = 0, n_words: int = 0):
+        self.labels = labels
+        self.first = first
+        self.count = count
+        self.ends = ends
+        self.values = values
+        self.pad_to = int(pad_to or 0)
+        self.n_words = int(n_words)
+
+    def __len__(self):
+        return self.n_words
+
+    def _root(self):
+        return 0
+
+    def _child(self, node, ch):
+        s = self.first[node]
+        j = self.labels.find(ch, s, s + self.count[node])
+        return None if j < 0 else j
+
+    def _children(self, node):
+        s = self.first[node]
+        return [(self.labels[j], j) for j in range(s, s + self.count[node])]
+
+    def _is_end(self, node):
+        return self.ends[node] == 1
+
+    def _value(self, node):
+        return self.values.get(node, True)
+
+
+# ============================================================
+# 4) CACHE (marshal)
+# ============================================================
+
+def words_signature(words, pad_to: int = 0) -> int:
+    """Prüfsumme über Wortliste + Auffüllbreite (Reihenfolge egal)."""
+    data = "\n".join(sorted(words)) + f"\n#{pad_to}"
+    return zlib.crc32(data.encode("utf-8"))
+
+
+def default_cache_path(name: str) -> str:
+    return os.path.join(tempfile.gettempdir(), f"kreis_wordindex_{name}.bin")
+
+
+def save_trie(trie, path: str, signature: int = 0):
+    """Speichert einen WordTrie/FrozenTrie (immer in flacher Form)."""
+    ft = trie.freeze() if isinstance(trie, WordTrie) else trie
+    payload = (
+        _CACHE_VERSION, signature, ft.pad_to, ft.n_words,
+        ft.labels, ft.first.tobytes(), ft.count.tobytes(), ft.ends, ft.values,
+    )
+    # eigene Temp-Datei im Zielordner: parallele Schreiber kommen sich nicht in die Quere,
+    # os.replace bleibt atomar (gleiches Dateisystem)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump(payload, f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def load_trie(path: str, signature=None):
+    """Returns FrozenTrie oder None (fehlt / andere Version / andere Signatur / defekt)."""
+    try:
+        with open(path, "rb") as f:
+            payload = marshal.load(f)
+        version, sig, pad_to, n_words, labels, first_b, count_b, ends, values = payload
+    except Exception:
+        return None
+    if version != _CACHE_VERSION:
+        return None
+    if signature is not None and sig != signature:
+        return None
+    first = array("I")
+    first.frombytes(first_b)
+    count = array("H")
+    count.frombytes(count_b)
+    return FrozenTrie(labels, first, count, ends, values, pad_to, n_words)
+
+
+def load_or_build(words, pad_to: int = 0, name: str = "", path: str = None):
+    """
+    words: Wörter ODER (wort, wert)-Paare
+    Lädt den Trie aus dem Cache, wenn die Signatur passt; sonst neu bauen und speichern.
+    Returns: FrozenTrie
+    """
+    pairs = [(w, True) if isinstance(w, str) else (w[0], w[1]) for w in words]
+    sig = words_signature([f"{w}\t{v}" for w, v in pairs], pad_to)
+    path = path or default_cache_path(name or str(pad_to))
+
+    trie = load_trie(path, sig)
+    if trie is not None:
+        return trie
+
+    builder = WordTrie(pad_to=pad_to)
+    for w, v in pairs:
+        builder.add(w, v)
+    trie = builder.freeze()
+    try:
+        save_trie(trie, path, sig)
+    except Exception:
+        pass  # Cache ist optional
+    return trie
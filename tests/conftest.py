@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Die Helfer in pythonpath/ sind UNO-frei und werden direkt importiert (wie in LibreOffice)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pythonpath"))
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+import pytest
+
+from kreis_archive import JsonlArchive, SqliteArchive, word_key
+
+NOW = datetime(2024, 6, 30, 12, 0)
+ENTRIES = [
+    (["Garten", "Straße", "garten"], "2024-04-01 10:00", "gui"),
+    (["FLIEGE", "Straße"], "2024-06-10 09:30", "v3"),
+    (["Blumen", " straße "], "2024-06-20 18:15", "gui"),
+]
+
+
+def _fill(archive):
+    for words, when, source in ENTRIES:
+        archive.add(words, when=when, source=source, data={"words": words})
+    return archive
+
+
+@pytest.fixture
+def archives(tmp_path):
+    return (_fill(SqliteArchive(str(tmp_path / "a.sqlite"))),
+            _fill(JsonlArchive(str(tmp_path / "a.jsonl"))))
+
+
+def test_backends_agree_on_recent_and_history(archives):
+    sql, jsonl = archives
+    assert sql.recent(30, now=NOW) == jsonl.recent(30, now=NOW) == {
+        "FLIEGE": "2024-06-10 09:30", "STRAẞE": "2024-06-20 18:15", "BLUMEN": "2024-06-20 18:15"}
+    for word in ("straße", "Garten", "fliege", "unbekannt"):
+        assert [tuple(h) for h in sql.history(word)] == [tuple(h) for h in jsonl.history(word)]
+    assert len(sql.history("Straße")) == 3
+
+
+def test_backends_agree_on_last_used_between_and_count(archives):
+    sql, jsonl = archives
+    assert sql.count() == jsonl.count() == 3
+    assert sql.last_used("garten") == jsonl.last_used("garten") == "2024-04-01 10:00"
+    a = sql.between("2024-06-01", "2024-06-10")
+    b = jsonl.between("2024-06-01", "2024-06-10")
+    assert [(p["id"], p["created"], sorted(p["words"])) for p in a] == \
+           [(p["id"], p["created"], sorted(p["words"])) for p in b] == [(2, "2024-06-10 09:30", ["FLIEGE", "STRAẞE"])]
+
+
+def test_word_key_folds_case_and_sz():
+    assert word_key(" straße ") == word_key("STRAẞE") == "STRAẞE"
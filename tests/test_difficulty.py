@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+import kreis_difficulty
+from kreis_difficulty import make_scramble_score_fn, score_puzzle
+from kreis_model import model_from_words, rows_from_model
+from kreis_solver import build_word_index
+
+ROWS = rows_from_model(model_from_words(6, [("GARTEN", "FLIEGE"), ("BLUMEN", "STRAND")]))
+INDEX = build_word_index(["GARTEN", "FLIEGE", "BLUMEN", "STRAND"], 6)
+
+
+def test_score_fn_counts_readings_once(monkeypatch):
+    calls = []
+    orig = kreis_difficulty.count_row_solutions
+
+    def counting(quads, index, limit=64):
+        calls.append(1)
+        return orig(quads, index, limit)
+
+    monkeypatch.setattr(kreis_difficulty, "count_row_solutions", counting)
+    fn = make_scramble_score_fn(ROWS, INDEX)
+    assert len(calls) == len(ROWS)
+    for steps in ([1] * 6, [0, 1, 2, 3, 0, 1], [2] * 6):
+        assert fn(steps, None) == score_puzzle(ROWS, INDEX, steps)["score"]
+    assert len(calls) == len(ROWS) + 3 * len(ROWS)  # nur die Vergleichswerte zählen neu
+
+
+def test_precomputed_readings_match():
+    steps = [0, 1, 2, 3, 0, 1]
+    full = score_puzzle(ROWS, INDEX, steps)
+    assert full["readings"] == [1, 1]
+    assert score_puzzle(ROWS, None, steps, readings=full["readings"]) == full
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+from kreis_docprops import ensure_layout, get_user_prop, stored_layout_version
+
+
+class _Props:
+    def __init__(self):
+        self.values = {}
+
+    def hasByName(self, name):
+        return name in self.values
+
+    def addProperty(self, name, attrs, default):
+        self.values[name] = default
+
+    def getPropertyValue(self, name):
+        return self.values[name]
+
+    def setPropertyValue(self, name, value):
+        self.values[name] = value
+
+
+class _Doc:
+    def __init__(self):
+        self.props = _Props()
+
+    def getDocumentProperties(self):
+        return self
+
+    def getUserDefinedProperties(self):
+        return self.props
+
+
+def test_version_stored_even_if_migration_is_unfinished():
+    doc = _Doc()
+    doc.props.values["LAYOUT"] = "2"
+    calls = []
+
+    def migrate(d):
+        calls.append("migrate")
+        return False  # Rest bleibt liegen – merkt sich der Schritt selbst
+
+    def apply(d):
+        calls.append("apply")
+
+    assert ensure_layout(doc, "LAYOUT", 3, apply, migrations={3: migrate}) is True
+    assert stored_layout_version(doc, "LAYOUT") == 3
+    # nächster Check: weder Migration noch Formatierung
+    assert ensure_layout(doc, "LAYOUT", 3, apply, migrations={3: migrate}) is False
+    assert calls == ["migrate", "apply"]
+
+
+def test_only_skipped_migrations_run():
+    doc = _Doc()
+    doc.props.values["LAYOUT"] = "1"
+    ran = []
+    migrations = {v: (lambda d, v=v: ran.append(v)) for v in (1, 2, 3, 4)}
+
+    ensure_layout(doc, "LAYOUT", 3, lambda d: None, migrations=migrations)
+    assert ran == [2, 3]
+    assert get_user_prop(doc, "LAYOUT") == "3"
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from kreis_extent import STRING_FLAG, ColumnExtents
+
+
+class _Addr:
+    def __init__(self, c1, r1, c2, r2):
+        self.StartColumn, self.StartRow, self.EndColumn, self.EndRow = c1, r1, c2, r2
+
+
+class _Range:
+    def __init__(self, sheet, c1, r1, c2, r2):
+        self.sheet, self.addr = sheet, _Addr(c1, r1, c2, r2)
+
+    def getDataArray(self):
+        a = self.addr
+        return tuple(tuple(self.sheet.value(c, r) for c in range(a.StartColumn, a.EndColumn + 1))
+                     for r in range(a.StartRow, a.EndRow + 1))
+
+    def queryContentCells(self, flags):
+        if not self.sheet.query:
+            raise RuntimeError("keine Abfrage")
+        a = self.addr
+        want_text = bool(flags & STRING_FLAG)
+        self._found = [_Addr(c, r, c, r)
+                       for c in range(a.StartColumn, a.EndColumn + 1)
+                       for r in range(a.StartRow, a.EndRow + 1)
+                       if (c, r) in self.sheet.cells and isinstance(self.sheet.cells[c, r], str) == want_text]
+        return self
+
+    def getRangeAddresses(self):
+        return self._found
+
+
+class _Cursor:
+    def __init__(self, sheet):
+        self.RangeAddress = _Addr(0, 0, max(c for c, _r in sheet.cells), max(r for _c, r in sheet.cells))
+
+    def gotoStartOfUsedArea(self, expand):
+        pass
+
+    def gotoEndOfUsedArea(self, expand):
+        pass
+
+
+class _Sheet:
+    def __init__(self, cells, query=True):
+        self.cells, self.query = cells, query
+
+    def value(self, c, r):
+        return self.cells.get((c, r), "")
+
+    def getCellRangeByPosition(self, c1, r1, c2, r2):
+        return _Range(self, c1, r1, c2, r2)
+
+    def createCursor(self):
+        return _Cursor(self)
+
+
+CELLS = {
+    (0, 0): "Kopf", (0, 2): "GARTEN", (0, 3): 1.0, (0, 4): "   ", (0, 5): "FLIEGE", (0, 7): " ",
+    (1, 2): 45000.5, (1, 3): "\t",
+}
+
+
+@pytest.mark.parametrize("query", [True, False])
+def test_whitespace_only_cells_are_empty(query):
+    ext = ColumnExtents(_Sheet(CELLS, query=query))
+    ext.prefetch([0, 1])
+    assert ext.last_row(0) == 6
+    assert ext.count(0, start_row=3) == 3
+    assert ext.last_row(1) == 3
+    assert ext.count(1) == 1
+    assert ext.column_values(0, 3) == ["GARTEN", "1", "", "FLIEGE"]
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from kreis_puzzle import MAGIC, from_bytes, load_any, new_puzzle, to_bytes, to_json
+
+WORDS = ["GRÜßEN", "SCHÖNE", "ÄPFELN", "STRAßE", "", "MÜLLER"]
+
+
+def _puzzle():
+    return new_puzzle(6, WORDS, [1, 2, 3, 0, 1, 2, 3, 3, 2], seed=2**40 + 7,
+                      created="2024-05-01 12:30", score=0.4375)
+
+
+def test_bytes_round_trip_keeps_umlauts_and_sz():
+    p = _puzzle()
+    data = to_bytes(p)
+    assert data[:3] == MAGIC
+    q = from_bytes(data)
+    assert q["words"] == WORDS
+    assert q["steps"] == p["steps"]
+    assert (q["L"], q["n"], q["seed"], q["created"], q["score"]) == (6, 3, 2**40 + 7, "2024-05-01 12:30", 0.4375)
+
+
+def test_load_any_detects_binary_and_json():
+    p = _puzzle()
+    assert load_any(to_bytes(p))["words"] == WORDS
+    q = load_any(to_json(p).encode("utf-8"))
+    assert q["words"] == WORDS
+    assert q["steps"] == p["steps"]
+
+
+@pytest.mark.parametrize("cut", [1, 2, 5, 12])
+def test_truncated_file_raises_value_error(cut):
+    data = to_bytes(_puzzle())
+    with pytest.raises(ValueError):
+        from_bytes(data[:-cut])
+
+
+def test_not_a_puzzle_raises_value_error():
+    with pytest.raises(ValueError):
+        load_any(b'{"foo": 1}')
+    with pytest.raises(ValueError):
+        from_bytes(b"KR")
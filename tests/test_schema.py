@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+from kreis_schema import cell_text, count_words
+
+
+def test_cell_text_normalises_numbers_and_whitespace():
+    assert cell_text(1.0) == "1"
+    assert cell_text(2.5) == "2.5"
+    assert cell_text("  Straße ") == "Straße"
+    assert cell_text(None) == ""
+
+
+def test_count_words_ignores_blank_cells():
+    assert count_words([("GARTEN", 1.0), ("   ",), ("",), (12.0,)]) == 2
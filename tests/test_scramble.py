@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from kreis_model import model_from_words, rows_from_model
+from kreis_scramble import plan_scramble
+
+QUADS = [q for row in rows_from_model(model_from_words(8, [("BAUMHAUS", "FENSTERN"),
+                                                           ("KLEIDUNG", "ABSCHIED"),
+                                                           ("SONNTAGE", "DIENSTAG")]))
+         for q in row]
+SYMMETRIC = [["X", "X", "X", "X"], [" ", " ", " ", " "]]  # keine Rotation ändert etwas
+
+
+def _solved(quads, scrambled):
+    return sum(1 for q, s in zip(quads, scrambled) if q == s)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_never_full_solution(seed):
+    quads = SYMMETRIC + [["E", "F", "G", "H"]]
+    steps, scrambled, info = plan_scramble(quads, allow_solved=True, rng=random.Random(seed))
+    assert scrambled != quads
+    assert not info["full_solution"]
+    # die Symmetrischen bleiben gelöst, also muss sich der letzte Kreis drehen
+    assert steps[-1] in (1, 2, 3)
+
+
+@pytest.mark.parametrize("max_solved", [0, 1, 3, 6])
+def test_max_solved_is_honoured(max_solved):
+    rng = random.Random(max_solved)
+    for _ in range(30):
+        steps, scrambled, info = plan_scramble(QUADS, max_solved=max_solved, allow_solved=True, rng=rng)
+        solved = _solved(QUADS, scrambled)
+        assert solved <= max_solved
+        assert solved == info["solved_after"]
+        assert scrambled != QUADS
+
+
+def test_forced_solved_counts_against_max_solved():
+    quads = SYMMETRIC + [["E", "F", "G", "H"]]
+    _steps, _scrambled, info = plan_scramble(quads, max_solved=1, rng=random.Random(0))
+    assert info["forced_solved"] == 2
+    assert not info["feasible"]
+
+
+def test_score_target_picks_closest_plan():
+    target = 5.0
+    _steps, _scrambled, info = plan_scramble(
+        QUADS, allow_solved=True, rng=random.Random(1),
+        score_fn=lambda steps, scrambled: float(sum(1 for s in steps if s)),
+        target=target, max_tries=64)
+    assert info["score"] == target
+    assert info["tries"] <= 64
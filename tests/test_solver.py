@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+from kreis_model import model_from_words, row_words, rows_from_model
+from kreis_rotation import rotate_quad
+from kreis_solver import build_word_index, count_row_solutions, verify_unique
+
+L = 6
+
+
+def _rows(pairs):
+    return rows_from_model(model_from_words(L, pairs))
+
+
+def test_single_reading_is_unique():
+    rows = _rows([("GARTEN", "FLIEGE")])
+    index = build_word_index(["GARTEN", "FLIEGE", "HAUSEN"], L)
+    result = verify_unique(rows, index)
+    assert result["unique"]
+    assert result["counts"] == [1]
+
+
+def test_row_with_two_readings_is_ambiguous():
+    rows = _rows([("GARTEN", "FLIEGE"), ("BLUMEN", "STRAND")])
+    # zweite Lesart der ersten Zeile: mittlerer Kreis um 180° gedreht
+    alt = list(rows[0])
+    alt[1] = rotate_quad(alt[1], 2)
+    alt_top, alt_bot = row_words(alt)
+    index = build_word_index(["GARTEN", "FLIEGE", "BLUMEN", "STRAND", alt_top, alt_bot], L)
+
+    result = verify_unique(rows, index)
+    assert not result["unique"]
+    assert result["counts"] == [2, 1]
+    assert result["ambiguous_rows"] == [0]
+    assert result["unsolvable_rows"] == []
+    assert count_row_solutions(rows[0], index) == 2
+
+
+def test_unknown_word_is_unsolvable_and_empty_rows_are_skipped():
+    rows = _rows([("GARTEN", "QWERTZ"), ("", "")])
+    index = build_word_index(["GARTEN"], L)
+    result = verify_unique(rows, index)
+    assert result["counts"] == [0, None]
+    assert result["unsolvable_rows"] == [0]
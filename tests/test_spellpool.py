@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+import kreis_spellpool
+from kreis_spellpool import SpellSession, check_words, load_dictionary
+
+
+def _write_dict(tmp_path, words):
+    path = tmp_path / "de.dic"
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def _count_loads(monkeypatch):
+    loads = []
+    orig = kreis_spellpool.WordListDictionary
+
+    class Counting(orig):
+        def __init__(self, path):
+            loads.append(path)
+            super().__init__(path)
+
+    monkeypatch.setattr(kreis_spellpool, "WordListDictionary", Counting)
+    monkeypatch.setattr(kreis_spellpool, "_DICTS", {})
+    return loads
+
+
+def test_process_mode_loads_dictionary_once(tmp_path, monkeypatch):
+    path = _write_dict(tmp_path, ["Baumhaus", "Fenster/S", "Straße"])
+    loads = _count_loads(monkeypatch)
+
+    for _ in range(3):
+        assert check_words(["BAUMHAUS", "fenster", "XYZ", "straße"], mode="process", dict_path=path) == [
+            True, True, False, True]
+    assert len(loads) == 1
+
+
+def test_session_reuses_dictionary_across_batches(tmp_path, monkeypatch):
+    path = _write_dict(tmp_path, ["Baumhaus"])
+    loads = _count_loads(monkeypatch)
+
+    with SpellSession("process", workers=1, dict_path=path) as spell:
+        assert spell.check(["Baumhaus"]) == [True]
+        assert spell.check(["Haus"]) == [False]
+    assert len(loads) == 1
+
+
+def test_dictionary_reloads_when_file_changes(tmp_path, monkeypatch):
+    path = _write_dict(tmp_path, ["Baumhaus"])
+    _count_loads(monkeypatch)
+
+    assert not load_dictionary(path).is_valid("Hausboot")
+    _write_dict(tmp_path, ["Baumhaus", "Hausboot", "Gartenzaun"])
+    assert load_dictionary(path).is_valid("Hausboot")
+
+
+def test_off_mode_uses_given_checker():
+    made = []
+    with SpellSession("off", check=lambda sp, w: w in sp, make_checker=lambda: made.append(1),
+                      checker={"HAUS"}) as spell:
+        assert spell.check(["HAUS", "BAUM"]) == [True, False]
+    assert made == []
+
+
+def test_session_keeps_one_process_pool(tmp_path, monkeypatch):
+    monkeypatch.setattr(kreis_spellpool.os, "cpu_count", lambda: 2)
+    path = _write_dict(tmp_path, [f"wort{i}" for i in range(0, 6000, 2)])
+    words = [f"wort{i}" for i in range(6000)]
+    with SpellSession("process", workers=2, dict_path=path) as spell:
+        first = spell.check(words)
+        pool = spell._pool
+        assert pool is not None
+        second = spell.check(words)
+        assert spell._pool is pool
+    assert first == second == [i % 2 == 0 for i in range(6000)]
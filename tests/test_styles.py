@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+import kreis_styles
+from kreis_styles import STYLE_DEFS, STYLE_WORDLIST_HEADER, STYLES_FLAG, STYLES_VERSION, ensure_cell_styles
+
+
+class _Style:
+    def __init__(self):
+        self.props = {}
+
+    def setPropertyValue(self, name, value):
+        self.props[name] = value
+
+    def setParentStyle(self, name):
+        self.props["ParentStyle"] = name
+
+
+class _Family(dict):
+    def hasByName(self, name):
+        return name in self
+
+    def getByName(self, name):
+        return self[name]
+
+    def insertByName(self, name, style):
+        self[name] = style
+
+
+class _Doc:
+    def __init__(self):
+        self.family = _Family()
+        self.StyleFamilies = self
+        self.user = {}
+
+    def getByName(self, name):
+        return self.family
+
+    def createInstance(self, service):
+        return _Style()
+
+
+def _fake_props(monkeypatch):
+    monkeypatch.setattr(kreis_styles, "stored_layout_version", lambda doc, key: int(doc.user.get(key, 0)))
+    monkeypatch.setattr(kreis_styles, "set_user_prop", lambda doc, key, value: doc.user.__setitem__(key, value))
+
+
+def test_styles_created_once_then_left_alone(monkeypatch):
+    _fake_props(monkeypatch)
+    doc = _Doc()
+    assert ensure_cell_styles(doc) == len(STYLE_DEFS)
+    assert doc.user[STYLES_FLAG] == STYLES_VERSION
+    assert doc.family[STYLE_WORDLIST_HEADER].props == {"CharHeight": 10.5, "CharWeight": kreis_styles.BOLD}
+
+    doc.family[STYLE_WORDLIST_HEADER].props["CharHeight"] = 20.0  # vom Benutzer geändert
+    assert ensure_cell_styles(doc) == 0
+    assert doc.family[STYLE_WORDLIST_HEADER].props["CharHeight"] == 20.0
+
+
+def test_existing_styles_updated_on_new_version(monkeypatch):
+    _fake_props(monkeypatch)
+    doc = _Doc()
+    old = _Style()
+    old.props["CharHeight"] = 9.0
+    doc.family[STYLE_WORDLIST_HEADER] = old
+    doc.user[STYLES_FLAG] = STYLES_VERSION - 1
+
+    assert ensure_cell_styles(doc) == len(STYLE_DEFS)
+    assert doc.family[STYLE_WORDLIST_HEADER] is old
+    assert old.props["CharHeight"] == 10.5
+    assert doc.user[STYLES_FLAG] == STYLES_VERSION
@@ -0,0 +1,18 @@
+# -*- coding: utf-8 -*-
+import os
+
+from kreis_wordindex import WordTrie, load_trie, save_trie
+
+WORDS = ["GARTEN", "STRAẞE", "MÜLLER"]
+
+
+def test_save_load_round_trip_leaves_no_temp_files(tmp_path):
+    path = str(tmp_path / "index.bin")
+    save_trie(WordTrie(WORDS, pad_to=8), path, signature=7)
+    save_trie(WordTrie(WORDS[:1], pad_to=8), path, signature=8)  # überschreibt
+    assert os.listdir(str(tmp_path)) == ["index.bin"]
+
+    trie = load_trie(path, signature=8)
+    assert "GARTEN" in trie
+    assert "MÜLLER" not in trie
+    assert load_trie(path, signature=7) is None